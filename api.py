@@ -2,91 +2,532 @@
 FastAPI REST API for Web Summarizer Agent
 """
 
+import asyncio
+import concurrent.futures
+import functools
+import gzip
+import hashlib
+import io
+import logging
 import os
+import queue
+import re
 import sys
-from typing import Optional
+import urllib.parse
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import (
+    Annotated,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
+import orjson
+import requests
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, StreamingResponse
-from pydantic import BaseModel, HttpUrl
-import io
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    HttpUrl,
+    TypeAdapter,
+    ValidationError,
+)
+from pydantic_core import Url
+from starlette.middleware.cors import SAFELISTED_HEADERS
+from starlette.responses import ContentStream
+from starlette.types import ASGIApp, Receive, Scope, Send
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
 
 from web_summarizer import WebSummarizerAgent
+from web_summarizer.cache import TTLCache
+from web_summarizer.fetcher import create_session
 from web_summarizer.models import SummaryOptions, SummaryRequest, SummaryResponse
-from web_summarizer.topic_aggregator import TopicAggregator
+from web_summarizer.rate_limit import RateLimiter
 from web_summarizer.spreadsheet_generator import SpreadsheetGenerator
+from web_summarizer.topic_aggregator import TopicAggregator
 from web_summarizer.web_searcher import WebSearcher
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Micro-batching settings for /summarize
+MAX_BATCH = int(os.getenv("MAX_BATCH", "16"))
+MAX_WAIT_MS = int(os.getenv("MAX_WAIT_MS", "10"))
+
+_summarize_queue: Optional[asyncio.Queue] = None
+
+# Bounded pool for blocking agent calls; admission is capped at twice its size
+SUMMARIZE_WORKERS = int(os.getenv("SUMMARIZE_WORKERS", "8"))
+SUMMARIZE_QUEUE_TIMEOUT = float(os.getenv("SUMMARIZE_QUEUE_TIMEOUT", "5"))
+
+_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_summarize_slots: Optional[asyncio.Semaphore] = None
+
+# Worker processes for CPU-bound content extraction (0 extracts on the request threads)
+EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", "0"))
+
+# Keep-alive connections held per host by the shared fetch session
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "100"))
+
+# Outbound calls per second to each provider (0 disables the limit)
+GEMINI_RPS = float(os.getenv("GEMINI_RPS", "10"))
+SEARCH_RPS = float(os.getenv("SEARCH_RPS", "2"))
+
+# Successful summaries are cached by the agent, keyed by (url, options); the
+# API reads that cache directly instead of keeping a second copy
+SUMMARY_CACHE_SIZE = int(os.getenv("SUMMARY_CACHE_SIZE", "1024"))
+SUMMARY_CACHE_TTL = float(os.getenv("SUMMARY_CACHE_TTL", "3600"))
+# Concurrent summaries per topic request when max_workers is null
+TOPIC_MAX_WORKERS = 5
+
+# Recent /search-and-aggregate results, shared with the export endpoint
+_topic_cache = TTLCache(
+    maxsize=int(os.getenv("TOPIC_CACHE_SIZE", "64")),
+    ttl=float(os.getenv("TOPIC_CACHE_TTL", "600")),
+)
+
+# Optional Redis tier shared by all workers, enabled by REDIS_URL
+REDIS_URL = os.getenv("REDIS_URL")
+SUMMARY_REDIS_TTL = int(os.getenv("SUMMARY_REDIS_TTL", "86400"))
+
+_redis = None
+
+# In-flight summarizations, so concurrent identical requests share one call
+_summary_inflight: Dict[tuple, asyncio.Future] = {}
+
+# Services are created at startup, see _init_services()
+agent: Optional[WebSummarizerAgent] = None
+topic_aggregator: Optional[TopicAggregator] = None
+spreadsheet_generator: Optional[SpreadsheetGenerator] = None
+web_searcher: Optional[WebSearcher] = None
+
+
+async def batch_worker(summarize_queue: asyncio.Queue) -> None:
+    """Coalesce queued summarize requests into batches, running each batch as its own task"""
+    loop = asyncio.get_running_loop()
+    running: Set[asyncio.Task] = set()
+
+    try:
+        while True:
+            batch = [await summarize_queue.get()]
+
+            # Drain whatever else arrives within the batching window
+            deadline = loop.time() + MAX_WAIT_MS / 1000
+            while len(batch) < MAX_BATCH:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(summarize_queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Don't wait for this batch; a slow page must not hold up the next one
+            task = asyncio.create_task(_run_batch(batch))
+            running.add(task)
+            task.add_done_callback(running.discard)
+    finally:
+        for task in running:
+            task.cancel()
+
+
+async def _run_batch(batch: List[Tuple[SummaryRequest, asyncio.Future]]) -> None:
+    """Summarize a drained batch, sending requests with the same options to the AI together"""
+    groups: Dict[tuple, List[Tuple[SummaryRequest, asyncio.Future]]] = {}
+    for item in batch:
+        options = item[0].options or SummaryOptions()
+        groups.setdefault(tuple(options.model_dump().values()), []).append(item)
+
+    await asyncio.gather(*(_run_batch_group(group) for group in groups.values()))
+
+
+async def _run_batch_group(group: List[Tuple[SummaryRequest, asyncio.Future]]) -> None:
+    """Summarize requests sharing one set of options through the agent's combined path"""
+    urls = [str(summary_request.url) for summary_request, _ in group]
+
+    try:
+        if agent is None:
+            raise _agent_not_ready()
+        responses = await asyncio.get_running_loop().run_in_executor(
+            _executor,
+            functools.partial(
+                agent.summarize_combined,
+                urls,
+                group[0][0].options,
+                max_workers=len(urls),
+            ),
+        )
+    except Exception as e:
+        for _, future in group:
+            if not future.done():
+                future.set_exception(e)
+        return
+
+    for (_, future), response in zip(group, responses):
+        if not future.done():
+            future.set_result(response)
+
+
+async def _acquire_summarize_slot() -> asyncio.Semaphore:
+    """
+    Reserve a summarization slot, failing fast with 503 when saturated
+
+    Returns:
+        The semaphore the slot was taken from, to release it on
+    """
+    slots = _summarize_slots
+    if slots is None:
+        raise _agent_not_ready()
+    try:
+        await asyncio.wait_for(slots.acquire(), timeout=SUMMARIZE_QUEUE_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=503, detail="Server overloaded, please retry later")
+    return slots
+
+
+@asynccontextmanager
+async def _summarize_slot() -> AsyncIterator[None]:
+    """Hold a summarization slot for the duration of the block"""
+    slots = await _acquire_summarize_slot()
+    try:
+        yield
+    finally:
+        slots.release()
+
+
+def _agent_not_ready() -> HTTPException:
+    """Error raised while the agent is unavailable (a configuration issue, not a server fault)"""
+    return HTTPException(
+        status_code=503, detail="Agent not initialized. Please set GEMINI_API_KEY in .env file"
+    )
+
+
+def _start_logging() -> QueueListener:
+    """Route log records through a queue so request handlers never block on I/O"""
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, logging.StreamHandler(), respect_handler_level=True)
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+    listener.start()
+    return listener
+
+
+def _build_http_session() -> requests.Session:
+    """Create the pooled session shared by every page fetch"""
+    session: requests.Session = create_session(pool_size=HTTP_POOL_SIZE)
+    return session
+
+
+def _init_services(http_session: Optional[requests.Session] = None) -> None:
+    """Build the agent and its helpers (deferred until app startup)"""
+    global agent, topic_aggregator, spreadsheet_generator, web_searcher
+
+    try:
+        # Check if RAG should be enabled
+        enable_rag = os.getenv("ENABLE_RAG", "false").lower() == "true"
+        rag_embedding = os.getenv("RAG_EMBEDDING_MODEL", "sentence-transformers")
+
+        agent = WebSummarizerAgent(
+            gemini_api_key=os.getenv("GEMINI_API_KEY"),
+            enable_rag=enable_rag,
+            rag_embedding_model=rag_embedding,
+            http_session=http_session,
+            gemini_rate_limiter=RateLimiter(GEMINI_RPS) if GEMINI_RPS > 0 else None,
+            cache_size=SUMMARY_CACHE_SIZE,
+            cache_ttl=SUMMARY_CACHE_TTL,
+            extraction_workers=EXTRACTION_WORKERS,
+        )
+        topic_aggregator = TopicAggregator(
+            agent,
+            combine_summaries=os.getenv("COMBINE_SUMMARIES", "true").lower() == "true",
+        )
+        spreadsheet_generator = SpreadsheetGenerator()
+        web_searcher = WebSearcher(
+            search_engine="duckduckgo",
+            rate_limiter=RateLimiter(SEARCH_RPS) if SEARCH_RPS > 0 else None,
+        )
+
+        if enable_rag:
+            logger.info(f"RAG enabled with {rag_embedding} embeddings")
+    except ValueError as e:
+        logger.warning(f"{e}. Please set GEMINI_API_KEY in your .env file")
+        agent = None
+        topic_aggregator = None
+        spreadsheet_generator = None
+        web_searcher = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Initialize services and background workers"""
+    global _summarize_queue, _executor, _summarize_slots, _redis
+
+    listener = _start_logging()
+    app.state.http = _build_http_session()
+    _init_services(app.state.http)
+
+    if REDIS_URL:
+        if aioredis is None:
+            logger.warning(
+                "REDIS_URL is set but redis is not installed; using the local cache only"
+            )
+        else:
+            _redis = aioredis.from_url(REDIS_URL)
+
+    worker = None
+    if agent is not None:
+        _executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=SUMMARIZE_WORKERS,
+            thread_name_prefix="summarize",
+        )
+        _summarize_slots = asyncio.Semaphore(SUMMARIZE_WORKERS * 2)
+        _summarize_queue = asyncio.Queue()
+        worker = asyncio.create_task(batch_worker(_summarize_queue))
+
+    yield
+
+    if worker is not None:
+        worker.cancel()
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+    if agent is not None:
+        agent.close()
+    app.state.http.close()
+    listener.stop()
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize types orjson doesn't know natively"""
+    if isinstance(obj, Url):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default)
+
+
+class _ClosingStreamingResponse(StreamingResponse):
+    """Streaming response that runs a callback however the response ends
+
+    Unlike a BackgroundTask, the callback also runs when the client disconnects
+    or the body iterator is never started.
+    """
+
+    def __init__(self, content: ContentStream, on_close: Callable[[], None], **kwargs: Any) -> None:
+        super().__init__(content, **kwargs)
+        self._on_close = on_close
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self._on_close()
+
+
+# Interactive docs and the OpenAPI schema are only served when DEBUG is set
+DEBUG = os.getenv("DEBUG", "").lower() in ("1", "true", "yes")
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Web Summarizer API",
     description="AI-powered web content summarization using Google Gemini",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    docs_url="/docs" if DEBUG else None,
+    redoc_url="/redoc" if DEBUG else None,
+    openapi_url="/openapi.json" if DEBUG else None,
 )
 
+# CORS policy: comma-separated CORS_ORIGINS, or "*" to allow any origin
+# (credentials are only allowed with an explicit allowlist)
+CORS_ORIGINS = [
+    origin.strip() for origin in os.getenv("CORS_ORIGINS", "*").split(",") if origin.strip()
+]
+_CORS_POLICY: Dict[str, Any] = {
+    "allow_origins": CORS_ORIGINS,
+    "allow_credentials": "*" not in CORS_ORIGINS,
+    "allow_methods": ["GET", "POST", "DELETE"],
+    "allow_headers": ["Content-Type"],
+}
+
 # Add CORS middleware to allow browser access
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, replace with specific origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(CORSMiddleware, **_CORS_POLICY)
 
-# Initialize agent
-try:
-    # Check if RAG should be enabled
-    enable_rag = os.getenv("ENABLE_RAG", "false").lower() == "true"
-    rag_embedding = os.getenv("RAG_EMBEDDING_MODEL", "sentence-transformers")
-
-    agent = WebSummarizerAgent(
-        gemini_api_key=os.getenv("GEMINI_API_KEY"),
-        enable_rag=enable_rag,
-        rag_embedding_model=rag_embedding
-    )
-    topic_aggregator = TopicAggregator(agent)
-    spreadsheet_generator = SpreadsheetGenerator()
-    web_searcher = WebSearcher(search_engine="duckduckgo")
 
-    if enable_rag:
-        print(f"✅ RAG enabled with {rag_embedding} embeddings")
-except ValueError as e:
-    print(f"⚠️ Warning: {e}")
-    print("Please set GEMINI_API_KEY in your .env file")
-    agent = None
-    topic_aggregator = None
-    spreadsheet_generator = None
-    web_searcher = None
+class StaticPreflightMiddleware:
+    """
+    Answer CORS preflight requests from prebuilt headers
 
+    Takes the same policy as CORSMiddleware and precomputes its preflight
+    headers, so an allowed preflight costs one header scan and, for an
+    allowlist, echoing the origin. Anything it would reject falls through to
+    CORSMiddleware to produce the error response.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Sequence[str],
+        allow_methods: Sequence[str],
+        allow_headers: Sequence[str],
+        allow_credentials: bool = False,
+        max_age: int = 600,
+    ) -> None:
+        self.app = app
+        self.allow_all_origins = "*" in allow_origins
+        self.echo_origin = not self.allow_all_origins or allow_credentials
+        self.origins = frozenset(origin.encode() for origin in allow_origins)
+        self.methods = frozenset(method.encode() for method in allow_methods)
+
+        allowed_headers = sorted(SAFELISTED_HEADERS | set(allow_headers))
+        self.allowed_headers = frozenset(header.lower() for header in allowed_headers)
+
+        headers = [
+            (
+                b"vary",
+                b"Origin, Access-Control-Request-Method, Access-Control-Request-Headers, "
+                b"Access-Control-Request-Private-Network",
+            ),
+        ]
+        if not self.echo_origin:
+            headers.append((b"access-control-allow-origin", b"*"))
+        headers.append((b"access-control-allow-methods", ", ".join(allow_methods).encode()))
+        headers.append((b"access-control-max-age", str(max_age).encode()))
+        headers.append((b"access-control-allow-headers", ", ".join(allowed_headers).encode()))
+        if allow_credentials:
+            headers.append((b"access-control-allow-credentials", b"true"))
+        headers.append((b"content-length", b"2"))
+        headers.append((b"content-type", b"text/plain; charset=utf-8"))
+        self.headers = headers
+
+    def _allowed(self, origin: bytes, method: bytes, requested_headers: Optional[bytes]) -> bool:
+        if not (self.allow_all_origins or origin in self.origins):
+            return False
+        if method not in self.methods:
+            return False
+        if requested_headers is not None:
+            return all(
+                header.strip() in self.allowed_headers
+                for header in requested_headers.decode("latin-1").lower().split(",")
+            )
+        return True
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] == "OPTIONS":
+            origin = requested_method = requested_headers = None
+            private_network = False
+            for name, value in scope["headers"]:
+                if name == b"origin":
+                    origin = value
+                elif name == b"access-control-request-method":
+                    requested_method = value
+                elif name == b"access-control-request-headers":
+                    requested_headers = value
+                elif name == b"access-control-request-private-network":
+                    private_network = True
+
+            if (
+                origin is not None
+                and requested_method is not None
+                and not private_network
+                and self._allowed(origin, requested_method, requested_headers)
+            ):
+                headers = self.headers
+                if self.echo_origin:
+                    headers = [*headers, (b"access-control-allow-origin", origin)]
+                await send({"type": "http.response.start", "status": 200, "headers": headers})
+                await send({"type": "http.response.body", "body": b"OK"})
+                return
+
+        await self.app(scope, receive, send)
+
+
+# Added last so it runs before CORSMiddleware
+app.add_middleware(StaticPreflightMiddleware, **_CORS_POLICY)
 
 # Request models
+_http_url_adapter = TypeAdapter(HttpUrl)
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_http_url(value: str) -> str:
+    """
+    Validate value as an HTTP(S) URL but keep the original string
+
+    Only successful validations are memoized, so URLs that are popular
+    (and usually answered from the summary cache) skip the parse entirely.
+    """
+    _http_url_adapter.validate_python(value)
+    return value
+
+
+HttpUrlStr = Annotated[str, AfterValidator(_validate_http_url)]
+
+
 class SummarizeURLRequest(BaseModel):
     """Simple request model for URL summarization"""
-    url: HttpUrl
-    max_summary_sentences: Optional[int] = 4
-    num_key_points: Optional[int] = 5
-    include_citations: Optional[bool] = False
-    model: Optional[str] = "models/gemini-2.5-flash"
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    url: HttpUrlStr
+    max_summary_sentences: int = Field(default=4, ge=1, le=10)
+    num_key_points: int = Field(default=5, ge=1, le=10)
+    include_citations: bool = False
+    model: str = "models/gemini-2.5-flash"
 
 
 class AdvancedSummarizeRequest(BaseModel):
     """Advanced request model with full options"""
-    url: HttpUrl
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    url: HttpUrlStr
     options: Optional[SummaryOptions] = None
 
 
 class TopicAggregatorRequest(BaseModel):
     """Request model for topic aggregation"""
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     topic: str
-    urls: list[str]
+    # Reject malformed URLs before any fetching starts
+    urls: Annotated[list[HttpUrlStr], Field(max_length=100)]
     platforms: Optional[list[str]] = ["twitter", "linkedin", "facebook"]
     max_workers: Optional[int] = 5
     export_format: Optional[str] = "csv"  # csv or excel
@@ -94,6 +535,9 @@ class TopicAggregatorRequest(BaseModel):
 
 class TopicSearchRequest(BaseModel):
     """Request model for topic-based search and aggregation"""
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     topic: str
     num_results: Optional[int] = 10
     platforms: Optional[list[str]] = ["twitter", "linkedin", "facebook"]
@@ -102,26 +546,52 @@ class TopicSearchRequest(BaseModel):
     search_type: Optional[str] = "web"  # web or news
     allowed_domains: Optional[list[str]] = None
     blocked_domains: Optional[list[str]] = None
+    # Skip the topic cache, the agent's URL and content caches and RAG-stored summaries
+    force_refresh: bool = False
 
 
 class RAGSearchRequest(BaseModel):
     """Request model for RAG semantic search"""
+
     query: str
     n_results: Optional[int] = 5
 
 
 class RAGQueryRequest(BaseModel):
     """Request model for RAG question answering"""
+
     question: str
     n_context_docs: Optional[int] = 3
 
 
+def _json_body(model: type) -> Callable[[Request], Awaitable[Any]]:
+    """
+    Build a dependency that validates the raw JSON body straight into model
+
+    Skips FastAPI's dict-based body parsing; validation errors are reported
+    as the usual 422 with locations under "body".
+    """
+    adapter: TypeAdapter[Any] = TypeAdapter(model)
+
+    async def parse(request: Request) -> Any:
+        try:
+            return adapter.validate_json(await request.body())
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+            )
+
+    return parse
+
+
+_summarize_body = Depends(_json_body(SummarizeURLRequest))
+_advanced_body = Depends(_json_body(AdvancedSummarizeRequest))
+
+
 # API Endpoints
 
-@app.get("/", response_class=HTMLResponse)
-async def root():
-    """Serve a simple HTML test interface"""
-    return """
+# Landing page, encoded once at import time
+_ROOT_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -337,6 +807,10 @@ async def root():
                     <span class="method post">POST</span>
                     <code>/search-and-aggregate</code> - Research topic and generate social media posts
                 </div>
+                <div class="endpoint">
+                    <span class="method get">GET</span>
+                    <code>/search-and-aggregate/stream</code> - Same research, streamed as Server-Sent Events
+                </div>
                 <div class="endpoint">
                     <span class="method post">POST</span>
                     <code>/search-and-aggregate/export</code> - Research topic and export to CSV/Excel
@@ -345,14 +819,6 @@ async def root():
                     <span class="method post">POST</span>
                     <code>/summarize</code> - Summarize a single URL
                 </div>
-                <div class="endpoint">
-                    <span class="method get">GET</span>
-                    <code>/docs</code> - Interactive API documentation (Swagger)
-                </div>
-                <div class="endpoint">
-                    <span class="method get">GET</span>
-                    <code>/redoc</code> - Alternative API documentation
-                </div>
             </div>
         </div>
 
@@ -420,6 +886,132 @@ async def root():
                 alert('Copied to clipboard!');
             }
 
+            function streamResults(topic, formData) {
+                const submitBtn = document.getElementById('submitBtn');
+                const loading = document.getElementById('loading');
+                const result = document.getElementById('result');
+                const error = document.getElementById('error');
+
+                const params = new URLSearchParams({
+                    topic: formData.topic,
+                    num_results: formData.num_results,
+                    search_type: formData.search_type,
+                });
+                formData.platforms.forEach(p => params.append('platforms', p));
+
+                result.innerHTML = `
+                    <h2>📊 Research Results: ${topic}</h2>
+                    <p id="stream_status" style="color: #666; margin-bottom: 20px;">Searching for articles...</p>
+
+                    <div class="summary">
+                        <h3>📝 Master Summary</h3>
+                        <p id="master_summary" style="white-space: pre-wrap;">Waiting for article summaries...</p>
+                    </div>
+
+                    <div class="key-points" id="posts" style="display: none;">
+                        <h3>📱 Social Media Posts (Ready to Publish)</h3>
+                        <p style="color: #666; font-size: 14px; margin-bottom: 15px;">These posts are generated from insights across all articles:</p>
+                    </div>
+
+                    <div class="key-points">
+                        <h3>📰 Source Articles (<span id="article_count">0</span>)</h3>
+                        <details open>
+                            <summary style="cursor: pointer; padding: 10px; background: #f0f7ff; border-radius: 5px; margin-bottom: 15px;">
+                                Individual article summaries
+                            </summary>
+                            <div id="articles"></div>
+                        </details>
+                    </div>
+                `;
+                result.style.display = 'block';
+
+                const status = document.getElementById('stream_status');
+                let articleCount = 0;
+                let finished = false;
+
+                const source = new EventSource('/search-and-aggregate/stream?' + params.toString());
+
+                const finish = () => {
+                    finished = true;
+                    source.close();
+                    loading.style.display = 'none';
+                    submitBtn.disabled = false;
+                };
+
+                source.onmessage = (message) => {
+                    const event = JSON.parse(message.data);
+
+                    if (event.type === 'search') {
+                        status.textContent = `Found ${event.count} articles, summarizing...`;
+                        loading.textContent = `⏳ Summarizing ${event.count} articles...`;
+                    } else if (event.type === 'article') {
+                        if (!event.success) return;
+                        articleCount += 1;
+                        document.getElementById('article_count').textContent = articleCount;
+                        document.getElementById('articles').insertAdjacentHTML('beforeend', `
+                            <div style="margin: 15px 0; padding: 15px; background: white; border-radius: 5px; border-left: 3px solid #ddd;">
+                                <strong>Article ${articleCount}:</strong> ${event.title}<br>
+                                <small><a href="${event.url}" target="_blank" style="color: #1a73e8;">${event.url}</a></small>
+                                <p style="margin-top: 10px; color: #333;">${event.summary}</p>
+                            </div>
+                        `);
+                    } else if (event.type === 'master_summary') {
+                        document.getElementById('master_summary').textContent = event.text;
+                        loading.textContent = '⏳ Generating social media posts...';
+                    } else if (event.type === 'post') {
+                        const posts = document.getElementById('posts');
+                        const postId = 'post_' + event.platform;
+                        posts.style.display = 'block';
+                        posts.insertAdjacentHTML('beforeend', `
+                            <div style="margin: 15px 0; padding: 15px; background: #f8f9fa; border-radius: 5px; border-left: 4px solid #1a73e8;">
+                                <strong style="font-size: 16px;">${event.platform.toUpperCase()}</strong>
+                                <button onclick="copyToClipboard('${postId}')"
+                                        style="float: right; padding: 5px 10px; background: #1a73e8; color: white; border: none; border-radius: 3px; cursor: pointer;">
+                                    Copy
+                                </button>
+                                <textarea id="${postId}" style="position: absolute; left: -9999px;">${event.text}</textarea>
+                                <p style="margin-top: 10px; white-space: pre-wrap; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;">${event.text}</p>
+                                <small style="color: #666;">${event.text.length} characters</small>
+                            </div>
+                        `);
+                    } else if (event.type === 'done') {
+                        status.textContent = `Analyzed ${event.successful_summaries} articles and generated social media content`;
+                        const platforms = formData.platforms.join(',');
+                        result.insertAdjacentHTML('beforeend', `
+                            <div style="margin-top: 30px; padding: 20px; background: #f0f7ff; border-radius: 5px; text-align: center;">
+                                <h3>📥 Download Complete Report</h3>
+                                <p style="color: #666; margin-bottom: 15px;">Get all articles, summaries, and social media posts</p>
+                                <button onclick="downloadSpreadsheet('${topic}', '${platforms}')"
+                                        style="padding: 12px 30px; background: #1a73e8; color: white; border: none; border-radius: 5px; font-size: 16px; cursor: pointer; margin: 5px;">
+                                    📊 Excel
+                                </button>
+                                <button onclick="downloadSpreadsheet('${topic}', '${platforms}', 'csv')"
+                                        style="padding: 12px 30px; background: #34a853; color: white; border: none; border-radius: 5px; font-size: 16px; cursor: pointer; margin: 5px;">
+                                    📄 CSV
+                                </button>
+                                <button onclick="downloadSpreadsheet('${topic}', '${platforms}', 'pdf')"
+                                        style="padding: 12px 30px; background: #ea4335; color: white; border: none; border-radius: 5px; font-size: 16px; cursor: pointer; margin: 5px;">
+                                    📕 PDF
+                                </button>
+                            </div>
+                        `);
+                        finish();
+                    } else if (event.type === 'error') {
+                        error.textContent = '❌ Error: ' + event.detail;
+                        error.style.display = 'block';
+                        finish();
+                    }
+                };
+
+                // EventSource reconnects on its own; stop it instead
+                source.onerror = () => {
+                    if (finished) return;
+                    error.textContent = '❌ Error: Lost connection to the server';
+                    error.style.display = 'block';
+                    finish();
+                };
+            }
+
             document.getElementById('topicForm').addEventListener('submit', async (e) => {
                 console.log('Form submitted!');
                 e.preventDefault();
@@ -454,15 +1046,14 @@ async def root():
                     export_format: exportFormat === 'json' ? 'csv' : exportFormat,
                 };
 
-                try {
-                    let endpoint = '/search-and-aggregate';
-
-                    // Use export endpoint for CSV/Excel
-                    if (exportFormat !== 'json') {
-                        endpoint = '/search-and-aggregate/export';
-                    }
+                // Render results in the browser as they stream in
+                if (exportFormat === 'json') {
+                    streamResults(topic, formData);
+                    return;
+                }
 
-                    const response = await fetch(endpoint, {
+                try {
+                    const response = await fetch('/search-and-aggregate/export', {
                         method: 'POST',
                         headers: {
                             'Content-Type': 'application/json',
@@ -471,134 +1062,31 @@ async def root():
                     });
 
                     // Handle file downloads
-                    if (exportFormat !== 'json') {
-                        if (!response.ok) {
-                            const data = await response.json();
-                            throw new Error(data.detail || 'Failed to generate export');
-                        }
-
-                        const blob = await response.blob();
-                        const url = window.URL.createObjectURL(blob);
-                        const a = document.createElement('a');
-                        a.href = url;
-                        a.download = `${topic}_social_media.${exportFormat}`;
-                        document.body.appendChild(a);
-                        a.click();
-                        window.URL.revokeObjectURL(url);
-                        a.remove();
-
-                        loading.style.display = 'none';
-                        submitBtn.disabled = false;
-
-                        result.innerHTML = `
-                            <h2>✅ Success!</h2>
-                            <p>Your ${exportFormat.toUpperCase()} file has been downloaded.</p>
-                            <p><strong>Topic:</strong> ${topic}</p>
-                            <p><strong>Articles Processed:</strong> ${formData.num_results}</p>
-                        `;
-                        result.style.display = 'block';
-                        return;
-                    }
-
-                    // Handle JSON response
-                    const data = await response.json();
-
                     if (!response.ok) {
-                        throw new Error(data.detail || 'Failed to process topic');
+                        const data = await response.json();
+                        throw new Error(data.detail || 'Failed to generate export');
                     }
 
-                    if (data.success) {
-                        // Display results
-                        const resultData = data.data;
-
-                        let html = `
-                            <h2>📊 Research Results: ${topic}</h2>
-                            <p style="color: #666; margin-bottom: 20px;">
-                                Analyzed ${resultData.successful_summaries} articles and generated social media content
-                            </p>
+                    const blob = await response.blob();
+                    const url = window.URL.createObjectURL(blob);
+                    const a = document.createElement('a');
+                    a.href = url;
+                    a.download = `${topic}_social_media.${exportFormat}`;
+                    document.body.appendChild(a);
+                    a.click();
+                    window.URL.revokeObjectURL(url);
+                    a.remove();
 
-                            <div class="summary">
-                                <h3>📝 Master Summary (Based on All ${resultData.successful_summaries} Articles)</h3>
-                                <p style="white-space: pre-wrap;">${resultData.master_summary}</p>
-                            </div>
-                        `;
-
-                        // Display social media posts
-                        if (resultData.social_media_posts) {
-                            html += '<div class="key-points"><h3>📱 Social Media Posts (Ready to Publish)</h3>';
-                            html += '<p style="color: #666; font-size: 14px; margin-bottom: 15px;">These posts are generated from insights across all articles:</p>';
-
-                            for (const [platform, post] of Object.entries(resultData.social_media_posts)) {
-                                // Format with newlines preserved
-                                const formattedPost = post.replace(/\\n/g, '<br>');
-                                const postId = 'post_' + platform;
-                                html += `
-                                    <div style="margin: 15px 0; padding: 15px; background: #f8f9fa; border-radius: 5px; border-left: 4px solid #1a73e8;">
-                                        <strong style="font-size: 16px;">${platform.toUpperCase()}</strong>
-                                        <button onclick="copyToClipboard('${postId}')"
-                                                style="float: right; padding: 5px 10px; background: #1a73e8; color: white; border: none; border-radius: 3px; cursor: pointer;">
-                                            Copy
-                                        </button>
-                                        <textarea id="${postId}" style="position: absolute; left: -9999px;">${post}</textarea>
-                                        <p style="margin-top: 10px; white-space: pre-wrap; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;">${formattedPost}</p>
-                                        <small style="color: #666;">${post.length} characters</small>
-                                    </div>
-                                `;
-                            }
-
-                            html += '</div>';
-                        }
-
-                        // Display article summaries in collapsible section
-                        if (resultData.summaries && resultData.summaries.length > 0) {
-                            const successfulSummaries = resultData.summaries.filter(s => s.success);
-                            html += `
-                                <div class="key-points">
-                                    <h3>📰 Source Articles (${successfulSummaries.length})</h3>
-                                    <details>
-                                        <summary style="cursor: pointer; padding: 10px; background: #f0f7ff; border-radius: 5px; margin-bottom: 15px;">
-                                            Click to view individual article summaries
-                                        </summary>
-                            `;
-
-                            successfulSummaries.forEach((summary, idx) => {
-                                html += `
-                                    <div style="margin: 15px 0; padding: 15px; background: white; border-radius: 5px; border-left: 3px solid #ddd;">
-                                        <strong>Article ${idx + 1}:</strong> ${summary.data.title}<br>
-                                        <small><a href="${summary.url}" target="_blank" style="color: #1a73e8;">${summary.url}</a></small>
-                                        <p style="margin-top: 10px; color: #333;">${summary.data.summary}</p>
-                                    </div>
-                                `;
-                            });
-
-                            html += '</details></div>';
-                        }
-
-                        // Add download button
-                        html += `
-                            <div style="margin-top: 30px; padding: 20px; background: #f0f7ff; border-radius: 5px; text-align: center;">
-                                <h3>📥 Download Complete Report</h3>
-                                <p style="color: #666; margin-bottom: 15px;">Get all articles, summaries, and social media posts</p>
-                                <button onclick="downloadSpreadsheet('${topic}', '${platforms.join(',')}')"
-                                        style="padding: 12px 30px; background: #1a73e8; color: white; border: none; border-radius: 5px; font-size: 16px; cursor: pointer; margin: 5px;">
-                                    📊 Excel
-                                </button>
-                                <button onclick="downloadSpreadsheet('${topic}', '${platforms.join(',')}', 'csv')"
-                                        style="padding: 12px 30px; background: #34a853; color: white; border: none; border-radius: 5px; font-size: 16px; cursor: pointer; margin: 5px;">
-                                    📄 CSV
-                                </button>
-                                <button onclick="downloadSpreadsheet('${topic}', '${platforms.join(',')}', 'pdf')"
-                                        style="padding: 12px 30px; background: #ea4335; color: white; border: none; border-radius: 5px; font-size: 16px; cursor: pointer; margin: 5px;">
-                                    📕 PDF
-                                </button>
-                            </div>
-                        `;
+                    loading.style.display = 'none';
+                    submitBtn.disabled = false;
 
-                        result.innerHTML = html;
-                        result.style.display = 'block';
-                    } else {
-                        throw new Error(data.error || 'Processing failed');
-                    }
+                    result.innerHTML = `
+                        <h2>✅ Success!</h2>
+                        <p>Your ${exportFormat.toUpperCase()} file has been downloaded.</p>
+                        <p><strong>Topic:</strong> ${topic}</p>
+                        <p><strong>Articles Processed:</strong> ${formData.num_results}</p>
+                    `;
+                    result.style.display = 'block';
                 } catch (err) {
                     error.textContent = '❌ Error: ' + err.message;
                     error.style.display = 'block';
@@ -612,87 +1100,294 @@ async def root():
     </html>
     """
 
+_ROOT_BODY = _ROOT_HTML.encode("utf-8")
+_ROOT_ETAG = hashlib.md5(_ROOT_BODY).hexdigest()
+
+# Precompressed variants, keyed by Content-Encoding
+_ROOT_VARIANTS = {"gzip": gzip.compress(_ROOT_BODY, 9)}
+if brotli is not None:
+    _ROOT_VARIANTS["br"] = brotli.compress(_ROOT_BODY, quality=11)
+
+
+@functools.lru_cache(maxsize=64)
+def _root_variant(accept_encoding: str) -> Tuple[Optional[str], bytes, str]:
+    """
+    Pick the best precompressed landing page variant for a client
 
-@app.get("/health")
-async def health_check():
+    Browsers send a handful of distinct Accept-Encoding values, so the
+    choice is memoized per header value.
+
+    Returns:
+        Tuple of (content_encoding or None, body, etag)
+    """
+    accepted = {token.split(";")[0].strip() for token in accept_encoding.lower().split(",")}
+    for encoding in ("br", "gzip"):
+        if encoding in accepted and encoding in _ROOT_VARIANTS:
+            return encoding, _ROOT_VARIANTS[encoding], f'"{_ROOT_ETAG}-{encoding}"'
+    return None, _ROOT_BODY, f'"{_ROOT_ETAG}"'
+
+
+@app.get("/", response_class=HTMLResponse)
+async def root(request: Request) -> Response:
+    """Serve a simple HTML test interface"""
+    encoding, body, etag = _root_variant(request.headers.get("accept-encoding", ""))
+
+    headers = {
+        "Cache-Control": "public, max-age=3600",
+        "ETag": etag,
+        "Vary": "Accept-Encoding",
+    }
+
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return HTMLResponse(content=body, headers=headers)
+
+
+@app.get("/health", response_model=None)
+async def health_check() -> Dict[str, Any]:
     """Health check endpoint"""
     return {
         "status": "healthy",
         "service": "Web Summarizer API",
         "version": "1.0.0",
-        "gemini_configured": agent is not None
+        "gemini_configured": agent is not None,
     }
 
 
-@app.post("/summarize", response_model=SummaryResponse)
-async def summarize_url(request: SummarizeURLRequest):
+def _build_summary_request(request: SummarizeURLRequest) -> SummaryRequest:
+    """Translate a simple API request into an agent SummaryRequest"""
+    return SummaryRequest(
+        url=request.url,
+        options=SummaryOptions(
+            max_summary_sentences=request.max_summary_sentences,
+            num_key_points=request.num_key_points,
+            include_citations=request.include_citations,
+            model=request.model,
+        ),
+    )
+
+
+async def _run_summarize(handler: Callable[[], Awaitable[SummaryResponse]]) -> Response:
     """
-    Summarize a web page from URL
+    Run a summarize handler with the shared readiness check and error mapping
 
-    Returns structured summary with key points, citations, and metadata.
+    Args:
+        handler: Zero-argument coroutine function producing the response
+
+    Returns:
+        The handler's SummaryResponse, serialized straight to JSON bytes
     """
     if agent is None:
-        raise HTTPException(
-            status_code=500,
-            detail="Agent not initialized. Please set GEMINI_API_KEY in .env file"
-        )
+        raise _agent_not_ready()
 
     try:
-        # Convert to string for agent
-        url = str(request.url)
+        result = await handler()
+        # Returning a Response skips FastAPI's response_model re-validation and
+        # dict round-trip; pydantic's serializer writes the bytes directly
+        return Response(result.model_dump_json(), media_type="application/json")
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Summarization failed: {str(e)}")
 
-        # Summarize
-        response = agent.summarize_url(
-            url=url,
-            max_summary_sentences=request.max_summary_sentences,
-            num_key_points=request.num_key_points,
-            include_citations=request.include_citations,
-            model=request.model,
-        )
 
-        return response
+def _redis_key(cache_key: tuple) -> str:
+    """Stable Redis key for a (url, options) cache key"""
+    return "sum:" + hashlib.sha256("|".join(map(str, cache_key)).encode()).hexdigest()
+
 
+async def _redis_get(cache_key: tuple) -> Optional[SummaryResponse]:
+    """Look up a summary in Redis; failures are treated as a miss"""
+    if _redis is None:
+        return None
+    try:
+        cached = await _redis.get(_redis_key(cache_key))
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Summarization failed: {str(e)}"
+        logger.warning(f"Redis lookup failed: {e}")
+        return None
+    return SummaryResponse.model_validate_json(cached) if cached else None
+
+
+async def _redis_set(cache_key: tuple, response: SummaryResponse) -> None:
+    """Store a summary in Redis; failures are logged and ignored"""
+    if _redis is None:
+        return
+    try:
+        await _redis.set(_redis_key(cache_key), response.model_dump_json(), ex=SUMMARY_REDIS_TTL)
+    except Exception as e:
+        logger.warning(f"Redis store failed: {e}")
+
+
+async def _summarize_cached(request: SummarizeURLRequest) -> SummaryResponse:
+    """Serve from cache, join an in-flight duplicate, or queue for the batch worker"""
+    if agent is None or _summarize_queue is None:
+        raise _agent_not_ready()
+
+    summary_request = _build_summary_request(request)
+    # Normalized once, the same way the agent keys its own cache
+    url = str(summary_request.url)
+    cache_key = (
+        url,
+        request.max_summary_sentences,
+        request.num_key_points,
+        request.include_citations,
+        request.model,
+    )
+
+    cached = agent.cached_summary(url, summary_request.options)
+    if cached is not None:
+        return cached
+
+    # Join an identical request that is already being summarized
+    inflight = _summary_inflight.get(cache_key)
+    if inflight is not None:
+        return await asyncio.shield(inflight)
+
+    # Queue for the batch worker and wait for our result
+    future = asyncio.get_running_loop().create_future()
+    # Mark the exception retrieved even if nobody joins this request
+    future.add_done_callback(lambda f: f.cancelled() or f.exception())
+    _summary_inflight[cache_key] = future
+
+    queued = False
+    try:
+        # Another worker may already have summarized it
+        shared = await _redis_get(cache_key)
+        response: SummaryResponse
+        if shared is not None:
+            response = shared
+            future.set_result(shared)
+        else:
+            async with _summarize_slot():
+                await _summarize_queue.put((summary_request, future))
+                queued = True
+                response = await asyncio.shield(future)
+    except BaseException as e:
+        # Never queued, so the worker won't resolve it; release any joiners
+        if not queued and not future.done():
+            if isinstance(e, Exception):
+                future.set_exception(e)
+            else:
+                future.cancel()
+        raise
+    finally:
+        _summary_inflight.pop(cache_key, None)
+
+    # The agent caches what it summarizes itself; only Redis hits need copying in
+    if response.success:
+        if shared is None:
+            await _redis_set(cache_key, response)
+        else:
+            agent.cache_summary(url, summary_request.options, response)
+
+    return response
+
+
+async def _summarize_pooled(request: AdvancedSummarizeRequest) -> SummaryResponse:
+    """Summarize directly in the bounded worker pool"""
+    if agent is None:
+        raise _agent_not_ready()
+
+    summary_request = SummaryRequest(url=request.url, options=request.options)
+
+    async with _summarize_slot():
+        return await asyncio.get_running_loop().run_in_executor(
+            _executor, functools.partial(agent.summarize, summary_request)
         )
 
 
+@app.post("/summarize", response_model=SummaryResponse)
+async def summarize_url(request: SummarizeURLRequest = _summarize_body) -> Response:
+    """
+    Summarize a web page from URL
+
+    Returns structured summary with key points, citations, and metadata.
+    """
+    return await _run_summarize(functools.partial(_summarize_cached, request))
+
+
 @app.post("/summarize/advanced", response_model=SummaryResponse)
-async def summarize_advanced(request: AdvancedSummarizeRequest):
+async def summarize_advanced(request: AdvancedSummarizeRequest = _advanced_body) -> Response:
     """
     Advanced summarization with full configuration options
 
     Allows complete control over summarization options via SummaryOptions model.
     """
+    return await _run_summarize(functools.partial(_summarize_pooled, request))
+
+
+@app.post("/summarize/stream")
+async def summarize_stream(request: SummarizeURLRequest = _summarize_body) -> StreamingResponse:
+    """
+    Summarize a web page, streaming model output as newline-delimited JSON
+
+    Emits {"type": "chunk", "text": ...} lines while the model generates,
+    followed by one {"type": "result", ...} line holding the full SummaryResponse,
+    or a final {"type": "error", "detail": ...} line if the worker fails.
+    """
     if agent is None:
-        raise HTTPException(
-            status_code=500,
-            detail="Agent not initialized. Please set GEMINI_API_KEY in .env file"
-        )
+        raise _agent_not_ready()
 
     try:
-        # Create full request
-        summary_request = SummaryRequest(
-            url=request.url,
-            options=request.options
-        )
+        summary_request = _build_summary_request(request)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Summarization failed: {str(e)}")
 
-        # Summarize
-        response = agent.summarize(summary_request)
+    slots = await _acquire_summarize_slot()
 
-        return response
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+    task: Optional[asyncio.Future] = None
+    released = False
+
+    def release_slot() -> None:
+        nonlocal released
+        if not released:
+            released = True
+            slots.release()
+
+    def on_close() -> None:
+        # Once the worker has started, the slot is held until it finishes
+        if task is None:
+            release_slot()
+
+    def on_chunk(text: str) -> None:
+        # Called from the worker thread
+        loop.call_soon_threadsafe(events.put_nowait, {"type": "chunk", "text": text})
+
+    work = functools.partial(agent.summarize, summary_request, on_chunk=on_chunk)
+
+    async def ndjson_events() -> AsyncIterator[bytes]:
+        nonlocal task
+        task = loop.run_in_executor(_executor, work)
+        task.add_done_callback(lambda _: release_slot())
+        # Scheduled after every chunk the worker has already queued
+        task.add_done_callback(lambda _: events.put_nowait(None))
+
+        while (event := await events.get()) is not None:
+            yield orjson.dumps(event) + b"\n"
+
+        try:
+            response = await task
+        except Exception as e:
+            logger.error(f"Streaming summarization failed: {e}")
+            yield orjson.dumps({"type": "error", "detail": f"Summarization failed: {e}"}) + b"\n"
+            return
+        yield orjson.dumps({"type": "result", **response.model_dump(mode="json")}) + b"\n"
+
+    return _ClosingStreamingResponse(ndjson_events(), on_close, media_type="application/x-ndjson")
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Summarization failed: {str(e)}"
-        )
+
+def _topic_workers(max_workers: Optional[int]) -> int:
+    """Worker count for a topic request, defaulting a null max_workers"""
+    return max_workers or TOPIC_MAX_WORKERS
 
 
 @app.post("/aggregate-topic")
-async def aggregate_topic(request: TopicAggregatorRequest):
+async def aggregate_topic(request: TopicAggregatorRequest) -> Response:
     """
     Aggregate summaries from multiple URLs for a specific topic
     and generate social media posts
@@ -701,33 +1396,125 @@ async def aggregate_topic(request: TopicAggregatorRequest):
     """
     if topic_aggregator is None:
         raise HTTPException(
-            status_code=500,
-            detail="Agent not initialized. Please set GEMINI_API_KEY in .env file"
+            status_code=500, detail="Agent not initialized. Please set GEMINI_API_KEY in .env file"
         )
 
     try:
         # Aggregate content
-        result = topic_aggregator.aggregate_topic(
+        result = await topic_aggregator.aggregate_topic_async(
             topic=request.topic,
             urls=request.urls,
             platforms=request.platforms,
-            max_workers=request.max_workers,
+            max_workers=_topic_workers(request.max_workers),
         )
 
-        return {
-            "success": True,
-            "data": result,
-        }
+        # Returned directly so the large dict skips jsonable_encoder
+        return ORJSONResponse(
+            {
+                "success": True,
+                "data": result,
+            }
+        )
 
     except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Topic aggregation failed: {str(e)}")
+
+
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def _sse_stream(events: Iterator[Dict]) -> Iterator[bytes]:
+    """Encode events as Server-Sent Events, reporting failures as an error event"""
+    try:
+        for event in events:
+            yield b"data: " + orjson.dumps(event, default=_orjson_default) + b"\n\n"
+    except Exception as e:
+        logger.error(f"Event stream failed: {e}")
+        yield b"data: " + orjson.dumps({"type": "error", "detail": str(e)}) + b"\n\n"
+
+
+@app.post("/aggregate-topic/stream")
+async def aggregate_topic_stream(request: TopicAggregatorRequest) -> StreamingResponse:
+    """
+    Aggregate a topic as a Server-Sent Events stream
+
+    Emits an "article" event per URL as it is summarized, then "master_summary",
+    one "post" per platform and a final "done" event.
+    """
+    if topic_aggregator is None:
         raise HTTPException(
-            status_code=500,
-            detail=f"Topic aggregation failed: {str(e)}"
+            status_code=500, detail="Agent not initialized. Please set GEMINI_API_KEY in .env file"
         )
 
+    events = topic_aggregator.stream_topic(
+        topic=request.topic,
+        urls=request.urls,
+        platforms=request.platforms,
+        max_workers=_topic_workers(request.max_workers),
+    )
+    # Sync iterators are drained in the threadpool, off the event loop
+    return StreamingResponse(
+        _sse_stream(events), media_type="text/event-stream", headers=_SSE_HEADERS
+    )
+
+
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+@functools.lru_cache(maxsize=256)
+def _content_disposition(topic: str, suffix: str) -> str:
+    """
+    Build an attachment Content-Disposition header for an export
+
+    The plain filename is an ASCII slug of the topic, so the header always
+    encodes as latin-1; the RFC 5987 filename* keeps the original topic.
+
+    Args:
+        topic: User-supplied topic the export is named after
+        suffix: Filename suffix, e.g. "social_media.csv"
+    """
+    safe = _UNSAFE_FILENAME_CHARS.sub("_", topic)[:64] or "export"
+    encoded = urllib.parse.quote(f"{topic}_{suffix}", safe="")
+    return f"attachment; filename={safe}_{suffix}; filename*=UTF-8''{encoded}"
+
+
+_XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+async def _render_export(
+    render: Callable[..., object],
+    result: Dict,
+    media_type: str,
+    topic: str,
+    suffix: str,
+) -> Response:
+    """
+    Render an export document in memory, off the event loop, and send it as one body
+
+    Args:
+        render: SpreadsheetGenerator method writing into a file-like output_path
+        result: Aggregation result to export
+        media_type: Content type of the document
+        topic: Topic used to name the download
+        suffix: Filename suffix, e.g. "report.pdf"
+
+    Returns:
+        Response with the finished document and a Content-Length
+    """
+    # openpyxl/reportlab are CPU-bound; the document is complete before sending,
+    # so a single body beats streaming a BytesIO (which iterates it line by line)
+    buffer = io.BytesIO()
+    await asyncio.to_thread(render, result, output_path=buffer, include_metadata=True)
+
+    return Response(
+        buffer.getvalue(),
+        media_type=media_type,
+        headers={"Content-Disposition": _content_disposition(topic, suffix)},
+    )
+
 
 @app.post("/aggregate-topic/export")
-async def aggregate_topic_export(request: TopicAggregatorRequest):
+async def aggregate_topic_export(request: TopicAggregatorRequest) -> Response:
     """
     Aggregate summaries and export to spreadsheet (CSV or Excel)
 
@@ -735,106 +1522,139 @@ async def aggregate_topic_export(request: TopicAggregatorRequest):
     """
     if topic_aggregator is None or spreadsheet_generator is None:
         raise HTTPException(
-            status_code=500,
-            detail="Agent not initialized. Please set GEMINI_API_KEY in .env file"
+            status_code=500, detail="Agent not initialized. Please set GEMINI_API_KEY in .env file"
         )
 
     try:
         # Aggregate content
-        result = topic_aggregator.aggregate_topic(
+        result = await topic_aggregator.aggregate_topic_async(
             topic=request.topic,
             urls=request.urls,
             platforms=request.platforms,
-            max_workers=request.max_workers,
+            max_workers=_topic_workers(request.max_workers),
         )
 
         # Generate spreadsheet
-        export_format = request.export_format.lower()
+        export_format = (request.export_format or "csv").lower()
 
         if export_format == "csv":
-            # Generate CSV
-            csv_content = spreadsheet_generator.generate_csv(
-                result,
-                output_path=None,
-                include_metadata=True,
-            )
-
-            # Return as downloadable file
-            output = io.StringIO(csv_content)
-            response = StreamingResponse(
-                iter([csv_content]),
+            # Stream the CSV row by row; Starlette drains sync iterators in the threadpool
+            return StreamingResponse(
+                spreadsheet_generator.iter_csv(result, include_metadata=True),
                 media_type="text/csv",
+                headers={
+                    "Content-Disposition": _content_disposition(request.topic, "social_media.csv")
+                },
             )
-            response.headers["Content-Disposition"] = f"attachment; filename={request.topic}_social_media.csv"
-            return response
 
         elif export_format == "excel":
-            # For Excel, we need to save to temp file
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.xlsx') as tmp:
-                tmp_path = tmp.name
-
-            spreadsheet_generator.generate_excel(
+            return await _render_export(
+                spreadsheet_generator.generate_excel,
                 result,
-                output_path=tmp_path,
-                include_metadata=True,
+                _XLSX_MEDIA_TYPE,
+                request.topic,
+                "social_media.xlsx",
             )
 
-            # Read and return the file
-            with open(tmp_path, 'rb') as f:
-                excel_content = f.read()
-
-            # Clean up temp file
-            os.unlink(tmp_path)
-
-            response = StreamingResponse(
-                io.BytesIO(excel_content),
-                media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            )
-            response.headers["Content-Disposition"] = f"attachment; filename={request.topic}_social_media.xlsx"
-            return response
-
         elif export_format == "pdf":
-            # For PDF, we need to save to temp file
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.pdf') as tmp:
-                tmp_path = tmp.name
-
-            spreadsheet_generator.generate_pdf(
+            return await _render_export(
+                spreadsheet_generator.generate_pdf,
                 result,
-                output_path=tmp_path,
-                include_metadata=True,
-            )
-
-            # Read and return the file
-            with open(tmp_path, 'rb') as f:
-                pdf_content = f.read()
-
-            # Clean up temp file
-            os.unlink(tmp_path)
-
-            response = StreamingResponse(
-                io.BytesIO(pdf_content),
-                media_type="application/pdf",
+                "application/pdf",
+                request.topic,
+                "report.pdf",
             )
-            response.headers["Content-Disposition"] = f"attachment; filename={request.topic}_report.pdf"
-            return response
 
         else:
             raise HTTPException(
                 status_code=400,
-                detail=f"Unsupported export format: {export_format}. Use 'csv', 'excel', or 'pdf'"
+                detail=f"Unsupported export format: {export_format}. Use 'csv', 'excel', or 'pdf'",
             )
 
     except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
+
+
+def _search_topic(request: TopicSearchRequest) -> list:
+    """Search the web for a topic request, applying its domain filters"""
+    if web_searcher is None:
+        raise HTTPException(
+            status_code=500,
+            detail="Services not initialized. Please set GEMINI_API_KEY in .env file",
+        )
+
+    # Domain filters go into the query so the engine returns only usable URLs
+    search = web_searcher.search_news if request.search_type == "news" else web_searcher.search
+    results: list = search(
+        query=request.topic,
+        num_results=request.num_results,
+        allowed_domains=request.allowed_domains,
+        blocked_domains=request.blocked_domains,
+    )
+    return results
+
+
+async def _resolve_and_aggregate(request: TopicSearchRequest) -> Dict:
+    """
+    Search for a topic and aggregate the results, reusing a recent identical run
+
+    Args:
+        request: Topic search request (force_refresh skips this cache and every
+            summary cache below it; pages are still revalidated, not refetched blindly)
+
+    Returns:
+        Aggregation result with search metadata
+
+    Raises:
+        HTTPException: 404 if the search finds nothing
+    """
+    cache_key = (
+        request.topic,
+        request.search_type,
+        request.num_results,
+        tuple(request.allowed_domains or ()),
+        tuple(request.blocked_domains or ()),
+        tuple(request.platforms or ()),
+    )
+    if not request.force_refresh:
+        cached: Optional[Dict] = _topic_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    # Search for articles (ddgs is blocking, keep it off the event loop)
+    search_results = await asyncio.to_thread(_search_topic, request)
+
+    # Extract URLs
+    urls = [result["url"] for result in search_results]
+
+    if not urls:
+        raise HTTPException(status_code=404, detail="No search results found for the topic")
+
+    if topic_aggregator is None:
         raise HTTPException(
             status_code=500,
-            detail=f"Export failed: {str(e)}"
+            detail="Services not initialized. Please set GEMINI_API_KEY in .env file",
         )
 
+    # Aggregate summaries
+    result: Dict = await topic_aggregator.aggregate_topic_async(
+        topic=request.topic,
+        urls=urls,
+        platforms=request.platforms,
+        max_workers=_topic_workers(request.max_workers),
+        force_refresh=request.force_refresh,
+    )
+
+    # Add search results metadata
+    result["search_results_count"] = len(search_results)
+    result["search_type"] = request.search_type
+
+    _topic_cache.set(cache_key, result)
+    return result
+
 
 @app.post("/search-and-aggregate")
-async def search_and_aggregate(request: TopicSearchRequest):
+async def search_and_aggregate(request: TopicSearchRequest) -> Response:
     """
     Search the web for a topic, then aggregate summaries and generate social media posts
 
@@ -843,67 +1663,77 @@ async def search_and_aggregate(request: TopicSearchRequest):
     if web_searcher is None or topic_aggregator is None:
         raise HTTPException(
             status_code=500,
-            detail="Services not initialized. Please set GEMINI_API_KEY in .env file"
+            detail="Services not initialized. Please set GEMINI_API_KEY in .env file",
         )
 
     try:
-        # Search for articles
-        if request.search_type == "news":
-            search_results = web_searcher.search_news(
-                query=request.topic,
-                num_results=request.num_results,
-            )
-        else:
-            search_results = web_searcher.search(
-                query=request.topic,
-                num_results=request.num_results,
-            )
+        result = await _resolve_and_aggregate(request)
 
-        # Filter by domain if specified
-        if request.allowed_domains or request.blocked_domains:
-            search_results = web_searcher.filter_by_domain(
-                search_results,
-                allowed_domains=request.allowed_domains,
-                blocked_domains=request.blocked_domains,
-            )
+        # Returned directly so the large dict skips jsonable_encoder
+        return ORJSONResponse(
+            {
+                "success": True,
+                "data": result,
+            }
+        )
 
-        # Extract URLs
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Search and aggregation failed: {str(e)}")
+
+
+@app.get("/search-and-aggregate/stream")
+async def search_and_aggregate_stream(
+    topic: str,
+    num_results: int = 10,
+    search_type: str = "web",
+    platforms: list[str] = Query(["twitter", "linkedin", "facebook"]),
+    max_workers: int = 5,
+) -> StreamingResponse:
+    """
+    Search for a topic and stream the aggregation as Server-Sent Events
+
+    A GET endpoint so browsers can consume it with EventSource. Emits a "search"
+    event with the result count, followed by the /aggregate-topic/stream events.
+    """
+    if web_searcher is None or topic_aggregator is None:
+        raise HTTPException(
+            status_code=500,
+            detail="Services not initialized. Please set GEMINI_API_KEY in .env file",
+        )
+
+    request = TopicSearchRequest(
+        topic=topic,
+        num_results=num_results,
+        search_type=search_type,
+        platforms=platforms,
+        max_workers=max_workers,
+    )
+
+    def events() -> Iterator[Dict]:
+        search_results = _search_topic(request)
         urls = [result["url"] for result in search_results]
+        yield {"type": "search", "count": len(urls), "search_type": request.search_type}
 
         if not urls:
-            raise HTTPException(
-                status_code=404,
-                detail="No search results found for the topic"
-            )
+            yield {"type": "error", "detail": "No search results found for the topic"}
+            return
 
-        # Aggregate summaries
-        result = topic_aggregator.aggregate_topic(
+        yield from topic_aggregator.stream_topic(
             topic=request.topic,
             urls=urls,
             platforms=request.platforms,
-            max_workers=request.max_workers,
+            max_workers=_topic_workers(request.max_workers),
         )
 
-        # Add search results metadata
-        result["search_results_count"] = len(search_results)
-        result["search_type"] = request.search_type
-
-        return {
-            "success": True,
-            "data": result,
-        }
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Search and aggregation failed: {str(e)}"
-        )
+    return StreamingResponse(
+        _sse_stream(events()), media_type="text/event-stream", headers=_SSE_HEADERS
+    )
 
 
 @app.post("/search-and-aggregate/export")
-async def search_and_aggregate_export(request: TopicSearchRequest):
+async def search_and_aggregate_export(request: TopicSearchRequest) -> Response:
     """
     Search for a topic, aggregate summaries, and export to spreadsheet
 
@@ -912,130 +1742,64 @@ async def search_and_aggregate_export(request: TopicSearchRequest):
     if web_searcher is None or topic_aggregator is None or spreadsheet_generator is None:
         raise HTTPException(
             status_code=500,
-            detail="Services not initialized. Please set GEMINI_API_KEY in .env file"
+            detail="Services not initialized. Please set GEMINI_API_KEY in .env file",
         )
 
     try:
-        # Search for articles
-        if request.search_type == "news":
-            search_results = web_searcher.search_news(
-                query=request.topic,
-                num_results=request.num_results,
-            )
-        else:
-            search_results = web_searcher.search(
-                query=request.topic,
-                num_results=request.num_results,
-            )
-
-        # Filter by domain if specified
-        if request.allowed_domains or request.blocked_domains:
-            search_results = web_searcher.filter_by_domain(
-                search_results,
-                allowed_domains=request.allowed_domains,
-                blocked_domains=request.blocked_domains,
-            )
-
-        # Extract URLs
-        urls = [result["url"] for result in search_results]
-
-        if not urls:
-            raise HTTPException(
-                status_code=404,
-                detail="No search results found for the topic"
-            )
-
-        # Aggregate summaries
-        result = topic_aggregator.aggregate_topic(
-            topic=request.topic,
-            urls=urls,
-            platforms=request.platforms,
-            max_workers=request.max_workers,
-        )
+        result = await _resolve_and_aggregate(request)
 
         # Generate spreadsheet
-        export_format = request.export_format.lower()
+        export_format = (request.export_format or "csv").lower()
 
         if export_format == "csv":
-            csv_content = spreadsheet_generator.generate_csv(
-                result,
-                output_path=None,
-                include_metadata=True,
-            )
-
-            response = StreamingResponse(
-                iter([csv_content]),
+            return StreamingResponse(
+                spreadsheet_generator.iter_csv(result, include_metadata=True),
                 media_type="text/csv",
+                headers={
+                    "Content-Disposition": _content_disposition(request.topic, "social_media.csv")
+                },
             )
-            response.headers["Content-Disposition"] = f"attachment; filename={request.topic}_social_media.csv"
-            return response
 
         elif export_format == "excel":
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.xlsx') as tmp:
-                tmp_path = tmp.name
-
-            spreadsheet_generator.generate_excel(
+            return await _render_export(
+                spreadsheet_generator.generate_excel,
                 result,
-                output_path=tmp_path,
-                include_metadata=True,
-            )
-
-            with open(tmp_path, 'rb') as f:
-                excel_content = f.read()
-
-            os.unlink(tmp_path)
-
-            response = StreamingResponse(
-                io.BytesIO(excel_content),
-                media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                _XLSX_MEDIA_TYPE,
+                request.topic,
+                "social_media.xlsx",
             )
-            response.headers["Content-Disposition"] = f"attachment; filename={request.topic}_social_media.xlsx"
-            return response
 
         elif export_format == "pdf":
-            # For PDF, we need to save to temp file
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.pdf') as tmp:
-                tmp_path = tmp.name
-
-            spreadsheet_generator.generate_pdf(
+            return await _render_export(
+                spreadsheet_generator.generate_pdf,
                 result,
-                output_path=tmp_path,
-                include_metadata=True,
+                "application/pdf",
+                request.topic,
+                "report.pdf",
             )
 
-            # Read and return the file
-            with open(tmp_path, 'rb') as f:
-                pdf_content = f.read()
-
-            # Clean up temp file
-            os.unlink(tmp_path)
-
-            response = StreamingResponse(
-                io.BytesIO(pdf_content),
-                media_type="application/pdf",
-            )
-            response.headers["Content-Disposition"] = f"attachment; filename={request.topic}_report.pdf"
-            return response
-
         else:
             raise HTTPException(
                 status_code=400,
-                detail=f"Unsupported export format: {export_format}. Use 'csv', 'excel', or 'pdf'"
+                detail=f"Unsupported export format: {export_format}. Use 'csv', 'excel', or 'pdf'",
             )
 
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Export failed: {str(e)}"
-        )
+        raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
+
 
+@functools.lru_cache(maxsize=1)
+def _rag_model() -> Any:
+    """Plain-text Gemini model used to answer RAG questions"""
+    import google.generativeai as genai
 
-@app.post("/rag/search")
-async def rag_search(request: RAGSearchRequest):
+    return genai.GenerativeModel(os.getenv("DEFAULT_MODEL", "models/gemini-2.5-flash"))
+
+
+@app.post("/rag/search", response_model=None)
+async def rag_search(request: RAGSearchRequest) -> Dict[str, Any]:
     """
     Search for similar summaries in the RAG knowledge base
 
@@ -1043,32 +1807,27 @@ async def rag_search(request: RAGSearchRequest):
     """
     if not agent or not agent.rag_enabled or not agent.rag_engine:
         raise HTTPException(
-            status_code=503,
-            detail="RAG is not enabled. Set ENABLE_RAG=true in environment"
+            status_code=503, detail="RAG is not enabled. Set ENABLE_RAG=true in environment"
         )
 
     try:
-        results = agent.rag_engine.search_similar(
-            query=request.query,
-            n_results=request.n_results
+        results = await asyncio.to_thread(
+            agent.rag_engine.search_similar, query=request.query, n_results=request.n_results
         )
 
         return {
             "success": True,
             "query": request.query,
             "results_count": len(results),
-            "results": results
+            "results": results,
         }
 
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"RAG search failed: {str(e)}"
-        )
+        raise HTTPException(status_code=500, detail=f"RAG search failed: {str(e)}")
 
 
-@app.post("/rag/query")
-async def rag_query(request: RAGQueryRequest):
+@app.post("/rag/query", response_model=None)
+async def rag_query(request: RAGQueryRequest) -> Dict[str, Any]:
     """
     Ask a question and get an AI-generated answer using RAG
 
@@ -1076,19 +1835,13 @@ async def rag_query(request: RAGQueryRequest):
     """
     if not agent or not agent.rag_enabled or not agent.rag_engine:
         raise HTTPException(
-            status_code=503,
-            detail="RAG is not enabled. Set ENABLE_RAG=true in environment"
+            status_code=503, detail="RAG is not enabled. Set ENABLE_RAG=true in environment"
         )
 
     try:
-        # Generate response using RAG
-        import google.generativeai as genai
-        model = genai.GenerativeModel(os.getenv("DEFAULT_MODEL", "models/gemini-2.5-flash"))
-
-        result = agent.rag_engine.generate_with_context(
-            query=request.question,
-            gemini_model=model,
-            n_context_docs=request.n_context_docs
+        # Generate response using RAG, awaiting Gemini instead of blocking the loop
+        result = await agent.rag_engine.generate_with_context_async(
+            query=request.question, gemini_model=_rag_model(), n_context_docs=request.n_context_docs
         )
 
         return {
@@ -1096,70 +1849,88 @@ async def rag_query(request: RAGQueryRequest):
             "question": request.question,
             "answer": result["answer"],
             "sources": result["sources"],
-            "context_documents_used": result["context_used"]
+            "context_documents_used": result["context_used"],
         }
 
     except Exception as e:
+        raise HTTPException(status_code=500, detail=f"RAG query failed: {str(e)}")
+
+
+@app.post("/rag/query/stream")
+async def rag_query_stream(request: RAGQueryRequest) -> StreamingResponse:
+    """
+    Ask a question using RAG, streaming the answer as newline-delimited JSON
+
+    Emits one {"type": "sources", ...} line after retrieval, {"type": "chunk", "text": ...}
+    lines while Gemini generates, and a final {"type": "result", ...} line.
+    """
+    if not agent or not agent.rag_enabled or not agent.rag_engine:
         raise HTTPException(
-            status_code=500,
-            detail=f"RAG query failed: {str(e)}"
+            status_code=503, detail="RAG is not enabled. Set ENABLE_RAG=true in environment"
         )
 
+    rag_engine = agent.rag_engine
+
+    async def ndjson_events() -> AsyncIterator[bytes]:
+        async for event in rag_engine.stream_with_context(
+            query=request.question, gemini_model=_rag_model(), n_context_docs=request.n_context_docs
+        ):
+            yield orjson.dumps(event) + b"\n"
+
+    return StreamingResponse(ndjson_events(), media_type="application/x-ndjson")
+
 
-@app.get("/rag/stats")
-async def rag_stats():
+@app.get("/rag/stats", response_model=None)
+async def rag_stats() -> Dict[str, Any]:
     """Get statistics about the RAG knowledge base"""
     if not agent or not agent.rag_enabled or not agent.rag_engine:
         raise HTTPException(
-            status_code=503,
-            detail="RAG is not enabled. Set ENABLE_RAG=true in environment"
+            status_code=503, detail="RAG is not enabled. Set ENABLE_RAG=true in environment"
         )
 
     try:
         stats = agent.rag_engine.get_stats()
-        return {
-            "success": True,
-            "stats": stats
-        }
+        return {"success": True, "stats": stats}
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get stats: {str(e)}"
-        )
+        raise HTTPException(status_code=500, detail=f"Failed to get stats: {str(e)}")
 
 
-@app.delete("/rag/clear")
-async def rag_clear():
+@app.delete("/rag/clear", response_model=None)
+async def rag_clear() -> Dict[str, Any]:
     """Clear all documents from the RAG knowledge base"""
     if not agent or not agent.rag_enabled or not agent.rag_engine:
         raise HTTPException(
-            status_code=503,
-            detail="RAG is not enabled. Set ENABLE_RAG=true in environment"
+            status_code=503, detail="RAG is not enabled. Set ENABLE_RAG=true in environment"
         )
 
     try:
         success = agent.rag_engine.clear_all()
         if success:
-            return {
-                "success": True,
-                "message": "All documents cleared from RAG knowledge base"
-            }
+            return {"success": True, "message": "All documents cleared from RAG knowledge base"}
         else:
             raise HTTPException(status_code=500, detail="Failed to clear database")
     except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to clear database: {str(e)}"
-        )
+        raise HTTPException(status_code=500, detail=f"Failed to clear database: {str(e)}")
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    print("🚀 Starting Web Summarizer API...")
-    print("📖 Open http://localhost:8000 in your browser")
-    print("📚 API docs: http://localhost:8000/docs")
-    if agent and agent.rag_enabled:
-        print("🧠 RAG (Retrieval-Augmented Generation) ENABLED")
+    port = int(os.getenv("PORT", "8000"))
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    print("🚀 Starting Web Summarizer API...")
+    print(f"📖 Open http://localhost:{port} in your browser")
+    if DEBUG:
+        print(f"📚 API docs: http://localhost:{port}/docs")
+
+    # uvloop is not available on Windows. Behind a load balancer, set
+    # FORWARDED_ALLOW_IPS so uvicorn trusts its X-Forwarded-* headers
+    uvicorn.run(
+        "api:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop" if sys.platform != "win32" else "asyncio",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        access_log=False,
+    )
@@ -2,8 +2,8 @@
 Basic usage example for Web Summarizer Agent
 """
 
-import json
 import os
+
 from dotenv import load_dotenv
 
 from web_summarizer import WebSummarizerAgent
@@ -47,7 +47,7 @@ def main():
     print("\n" + "=" * 80)
     print("Full JSON Response:")
     print("=" * 80)
-    print(json.dumps(response.model_dump(), indent=2, default=str))
+    print(response.model_dump_json(indent=2))
 
 
 if __name__ == "__main__":
@@ -7,15 +7,12 @@ for a specific topic and generate social media posts.
 """
 
 import os
-import sys
-from dotenv import load_dotenv
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+from dotenv import load_dotenv
 
 from web_summarizer import WebSummarizerAgent
-from web_summarizer.topic_aggregator import TopicAggregator
 from web_summarizer.spreadsheet_generator import SpreadsheetGenerator
+from web_summarizer.topic_aggregator import TopicAggregator
 
 # Load environment variables
 load_dotenv()
@@ -67,13 +64,13 @@ def main():
     print("=" * 80)
 
     # Display first summary with social media posts
-    if result['data']:
-        first_result = result['data'][0]
+    if result["data"]:
+        first_result = result["data"][0]
         print(f"\n📄 Sample: {first_result['title']}")
         print(f"URL: {first_result['source_url']}")
         print(f"\nSummary:\n{first_result['summary']}")
         print(f"\nKey Points:")
-        for point in first_result['key_points'].split('; '):
+        for point in first_result["key_points"].split("; "):
             print(f"  • {point}")
 
         print("\n" + "=" * 80)
@@ -2,11 +2,23 @@
 Main Web Summarizer Agent
 """
 
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
 import logging
+import multiprocessing
+import sys
+import threading
 import time
-from typing import Optional
+from collections import defaultdict
+from typing import Callable, DefaultDict, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
 
-from web_summarizer.extractor import ContentExtractor, ExtractionError
+import requests
+
+from web_summarizer.cache import TTLCache
+from web_summarizer.extractor import ContentExtractor, ExtractionError, extract_content
 from web_summarizer.fetcher import FetchError, URLFetcher
 from web_summarizer.models import (
     ErrorResponse,
@@ -16,11 +28,36 @@ from web_summarizer.models import (
     SummaryRequest,
     SummaryResponse,
 )
-from web_summarizer.summarizer import AISummarizer, SummarizationError
+from web_summarizer.rate_limit import RateLimiter
+from web_summarizer.summarizer import AISummarizer, SummarizationError, SummarizerResult
 
 logger = logging.getLogger(__name__)
 
 
+def _normalize_category(category: object) -> Optional[str]:
+    """Trim a model-produced category and intern it (the same few values repeat across summaries)"""
+    if not isinstance(category, str):
+        return None
+    category = category.strip()
+    return sys.intern(category) if category else None
+
+
+@functools.lru_cache(maxsize=32)
+def _summary_options(
+    max_summary_sentences: int,
+    num_key_points: int,
+    include_citations: bool,
+    model: str,
+) -> SummaryOptions:
+    """Build SummaryOptions once per parameter combination (never mutated, safe to share)"""
+    return SummaryOptions(
+        max_summary_sentences=max_summary_sentences,
+        num_key_points=num_key_points,
+        include_citations=include_citations,
+        model=model,
+    )
+
+
 class WebSummarizerAgent:
     """
     Main agent for web content summarization
@@ -29,6 +66,13 @@ class WebSummarizerAgent:
     to turn any webpage into structured, summarized information.
     """
 
+    # Limits for packing several documents into one summarize_combined request
+    MAX_COMBINED_DOCS = 8
+    MAX_COMBINED_CHARS = 200_000
+
+    # Summaries written to the RAG store per upsert
+    RAG_WRITE_BATCH = 16
+
     def __init__(
         self,
         gemini_api_key: Optional[str] = None,
@@ -40,6 +84,12 @@ class WebSummarizerAgent:
         enable_rag: bool = False,
         rag_persist_dir: str = "./chroma_db",
         rag_embedding_model: str = "sentence-transformers",
+        http_session: Optional[requests.Session] = None,
+        gemini_rate_limiter: Optional[RateLimiter] = None,
+        enable_cache: bool = True,
+        cache_size: int = 1024,
+        cache_ttl: float = 3600.0,
+        extraction_workers: int = 0,
     ):
         """
         Initialize the Web Summarizer Agent
@@ -54,18 +104,33 @@ class WebSummarizerAgent:
             enable_rag: Enable RAG (Retrieval-Augmented Generation) features
             rag_persist_dir: Directory to persist RAG vector database
             rag_embedding_model: "sentence-transformers" (free) or "gemini" (uses API key)
+            http_session: Shared requests session for page fetches (pooled connections)
+            gemini_rate_limiter: Optional limiter capping Gemini calls per second
+            enable_cache: Reuse successful summaries for repeated (url, options) requests
+            cache_size: Maximum number of cached summaries
+            cache_ttl: Seconds a cached summary stays valid
+            extraction_workers: Run content extraction in this many worker processes
+                (readability's scoring holds the GIL); 0 extracts on the calling thread
         """
         self.fetcher = URLFetcher(
             timeout=timeout,
             max_redirects=max_redirects,
             user_agent=user_agent,
+            session=http_session,
         )
         self.extractor = ContentExtractor(
             min_content_length=min_content_length,
             max_content_length=max_content_length,
         )
-        self.summarizer = AISummarizer(api_key=gemini_api_key)
+        self.summarizer = AISummarizer(api_key=gemini_api_key, rate_limiter=gemini_rate_limiter)
+        self.extraction_workers = extraction_workers
+        self._extract_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._extract_pool_lock = threading.Lock()
         self.gemini_api_key = gemini_api_key
+        # The one URL-level summary cache; the API reads it through cached_summary()
+        self._summary_cache = TTLCache(maxsize=cache_size, ttl=cache_ttl) if enable_cache else None
+        # AI results keyed by text hash, not URL (mirrors, tracking params, expired URL entries)
+        self._content_cache = TTLCache(maxsize=cache_size, ttl=cache_ttl) if enable_cache else None
 
         # Initialize RAG if enabled
         self.rag_enabled = enable_rag
@@ -73,128 +138,511 @@ class WebSummarizerAgent:
         if enable_rag:
             try:
                 from web_summarizer.rag_engine import RAGEngine
+
                 self.rag_engine = RAGEngine(
                     persist_directory=rag_persist_dir,
                     embedding_model=rag_embedding_model,
-                    gemini_api_key=gemini_api_key if rag_embedding_model == "gemini" else None
+                    gemini_api_key=gemini_api_key if rag_embedding_model == "gemini" else None,
                 )
                 logger.info("RAG engine initialized")
             except Exception as e:
                 logger.error(f"Failed to initialize RAG: {e}")
                 self.rag_enabled = False
 
+        # RAG writes happen behind the response on a single writer thread
+        self._rag_writer: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._rag_pending: List[Dict] = []
+        self._rag_flush_scheduled = False
+        self._rag_lock = threading.Lock()
+
         logger.info("WebSummarizerAgent initialized")
 
-    def summarize(self, request: SummaryRequest) -> SummaryResponse:
+    def cached_summary(
+        self, url: str, options: Optional[SummaryOptions] = None
+    ) -> Optional[SummaryResponse]:
+        """
+        Look up a recent successful summary without fetching anything
+
+        Args:
+            url: URL as normalized by SummaryRequest
+            options: Summary options (defaults to SummaryOptions())
+
+        Returns:
+            The cached SummaryResponse, or None on a miss or with caching disabled
+        """
+        if self._summary_cache is None:
+            return None
+        cached: Optional[SummaryResponse] = self._summary_cache.get(
+            self._cache_key(url, options or SummaryOptions())
+        )
+        return cached
+
+    def cache_summary(
+        self, url: str, options: Optional[SummaryOptions], response: SummaryResponse
+    ) -> None:
+        """
+        Remember a successful summary produced elsewhere (e.g. by another API worker)
+
+        Args:
+            url: URL as normalized by SummaryRequest
+            options: Summary options the response was produced with
+            response: Successful SummaryResponse to cache
+        """
+        if self._summary_cache is not None and response.success:
+            self._summary_cache.set(self._cache_key(url, options or SummaryOptions()), response)
+
+    def summarize(
+        self,
+        request: SummaryRequest,
+        on_chunk: Optional[Callable[[str], None]] = None,
+    ) -> SummaryResponse:
         """
         Summarize a webpage from a URL
 
         Args:
             request: SummaryRequest containing URL and options
+            on_chunk: Optional callback that receives raw model output as it streams in
 
         Returns:
             SummaryResponse with success status and data/error
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         url = str(request.url)
         options = request.options or SummaryOptions()
 
+        cache_key = self._cache_key(url, options)
+        if self._summary_cache is not None:
+            cached: Optional[SummaryResponse] = self._summary_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Serving cached summary for: {url}")
+                return cached
+
         logger.info(f"Starting summarization for: {url}")
 
         try:
-            # Step 1: Fetch the webpage
-            html, final_url = self.fetcher.fetch(url)
-
-            # Step 2: Extract content
-            cleaned_text, title = self.extractor.extract(html, final_url)
-
-            # Step 3: Summarize with AI
-            summary_result = self.summarizer.summarize(
-                text=cleaned_text,
-                title=title,
-                model=options.model,
-                max_summary_sentences=options.max_summary_sentences,
-                num_key_points=options.num_key_points,
-                include_citations=options.include_citations,
-                timeout=options.timeout_seconds,
-            )
+            # Steps 1-2: Fetch the webpage and extract content
+            final_url, title, cleaned_text = self._fetch_content(url)
 
-            # Calculate processing time
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            # Step 3: Summarize with AI, unless this exact text was summarized recently
+            summary_result = self._cached_result(cleaned_text, options)
+            if summary_result is None:
+                summary_result = self.summarizer.summarize(
+                    text=cleaned_text,
+                    title=title,
+                    model=options.model,
+                    max_summary_sentences=options.max_summary_sentences,
+                    num_key_points=options.num_key_points,
+                    include_citations=options.include_citations,
+                    timeout=options.timeout_seconds,
+                    on_chunk=on_chunk,
+                )
 
-            # Build response
-            metadata = SummaryMetadata(
-                tokens_used=summary_result.get("tokens_used", 0),
-                processing_time_ms=processing_time_ms,
-                model_used=summary_result.get("model_used", options.model),
-                content_length=len(cleaned_text),
-                extraction_method="readability",
+            return self._build_response(
+                cache_key, final_url, title, cleaned_text, summary_result, options, start_time
             )
 
-            data = SummaryData(
-                url=final_url,
-                title=title,
-                summary=summary_result.get("summary", ""),
-                key_points=summary_result.get("key_points", []),
-                citations=summary_result.get("citations") if options.include_citations else None,
-                category=summary_result.get("category"),
-                metadata=metadata,
-            )
+        except Exception as e:
+            return self._error_response(e)
+
+    def summarize_combined(
+        self,
+        urls: List[str],
+        options: Optional[SummaryOptions] = None,
+        max_workers: int = 5,
+        max_per_host: int = 2,
+        refresh: bool = False,
+    ) -> List[SummaryResponse]:
+        """
+        Summarize several URLs, sending their content to the AI in shared requests
 
-            logger.info(f"Successfully summarized {url} in {processing_time_ms}ms")
+        URLs already in the cache or, with RAG enabled, already stored with the
+        same options are reused as-is. The rest are fetched concurrently, then
+        packed into as few Gemini calls as MAX_COMBINED_DOCS and
+        MAX_COMBINED_CHARS allow. Documents the model leaves out of a combined
+        answer are summarized on their own.
 
-            # Store in RAG if enabled
-            if self.rag_enabled and self.rag_engine:
+        Args:
+            urls: URLs to summarize
+            options: Summary options applied to every URL
+            max_workers: Maximum concurrent page fetches
+            max_per_host: Maximum concurrent page fetches per host
+            refresh: Summarize every URL again, ignoring the URL cache, the content cache
+                and summaries stored in RAG (pages are still revalidated by the fetcher
+                rather than downloaded unconditionally)
+
+        Returns:
+            SummaryResponses in the same order as the URLs
+        """
+        responses = dict(self.iter_combined(urls, options, max_workers, max_per_host, refresh))
+        return [responses[idx] for idx in range(len(urls))]
+
+    def iter_combined(
+        self,
+        urls: List[str],
+        options: Optional[SummaryOptions] = None,
+        max_workers: int = 5,
+        max_per_host: int = 2,
+        refresh: bool = False,
+    ) -> Iterator[Tuple[int, SummaryResponse]]:
+        """
+        Like summarize_combined, yielding (index, SummaryResponse) pairs as they are ready
+
+        Reused summaries and failed fetches come first, then the responses of each
+        combined request as soon as it returns.
+
+        Args:
+            urls: URLs to summarize
+            options: Summary options applied to every URL
+            max_workers: Maximum concurrent page fetches
+            max_per_host: Maximum concurrent page fetches per host
+            refresh: Summarize every URL again (see summarize_combined)
+
+        Yields:
+            (index into urls, SummaryResponse) once per URL
+        """
+        start_time = time.perf_counter_ns()
+        options = options or SummaryOptions()
+
+        pending = []
+        for idx, url in enumerate(urls):
+            cached = None
+            if self._summary_cache is not None and not refresh:
+                cached = self._summary_cache.get(self._cache_key(url, options))
+            if cached is not None:
+                yield idx, cached
+            else:
+                pending.append(idx)
+
+        if pending and not refresh:
+            stored = self._stored_summaries([urls[idx] for idx in pending], options)
+            for idx in pending:
+                if urls[idx] in stored:
+                    yield idx, stored[urls[idx]]
+            pending = [idx for idx in pending if urls[idx] not in stored]
+
+        # Steps 1-2: Fetch and extract concurrently, a few connections per site at most
+        host_slots = {
+            urlsplit(urls[idx]).hostname: threading.Semaphore(max_per_host) for idx in pending
+        }
+
+        def fetch(idx: int) -> Tuple[str, Optional[str], str]:
+            with host_slots[urlsplit(urls[idx]).hostname]:
+                return self._fetch_content(urls[idx])
+
+        documents = []
+        if pending:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {idx: executor.submit(fetch, idx) for idx in pending}
+                for idx, future in futures.items():
+                    try:
+                        final_url, title, text = future.result()
+                    except Exception as e:
+                        yield idx, self._error_response(e)
+                        continue
+
+                    summary_result = None if refresh else self._cached_result(text, options)
+                    if summary_result is not None:
+                        yield idx, self._build_response(
+                            self._cache_key(urls[idx], options),
+                            final_url,
+                            title,
+                            text,
+                            summary_result,
+                            options,
+                            start_time,
+                        )
+                    else:
+                        documents.append((idx, final_url, title, text))
+
+        # Step 3: Summarize in combined requests
+        for batch in self._combined_batches(documents):
+            results: List[Optional[SummarizerResult]] = [None] * len(batch)
+            if len(batch) > 1:
                 try:
-                    self.rag_engine.store_summary(
-                        url=final_url,
-                        title=title,
-                        summary=data.summary,
-                        key_points=data.key_points,
-                        category=data.category or "",
-                        metadata={
-                            "tokens_used": metadata.tokens_used,
-                            "processing_time_ms": metadata.processing_time_ms
-                        }
+                    results = self.summarizer.summarize_batch(
+                        documents=[(text, title) for _, _, title, text in batch],
+                        model=options.model,
+                        max_summary_sentences=options.max_summary_sentences,
+                        num_key_points=options.num_key_points,
+                        include_citations=options.include_citations,
+                        timeout=options.timeout_seconds,
+                    )
+                except SummarizationError as e:
+                    logger.warning(
+                        f"Combined summarization failed, summarizing individually: {e.message}"
                     )
-                    logger.info(f"Stored summary in RAG database")
-                except Exception as rag_error:
-                    logger.warning(f"Failed to store in RAG: {rag_error}")
 
-            return SummaryResponse(success=True, data=data)
+            for (idx, final_url, title, text), summary_result in zip(batch, results):
+                try:
+                    if summary_result is None:
+                        summary_result = self.summarizer.summarize(
+                            text=text,
+                            title=title,
+                            model=options.model,
+                            max_summary_sentences=options.max_summary_sentences,
+                            num_key_points=options.num_key_points,
+                            include_citations=options.include_citations,
+                            timeout=options.timeout_seconds,
+                        )
+                    response = self._build_response(
+                        self._cache_key(urls[idx], options),
+                        final_url,
+                        title,
+                        text,
+                        summary_result,
+                        options,
+                        start_time,
+                    )
+                except Exception as e:
+                    response = self._error_response(e)
+                yield idx, response
 
-        except FetchError as e:
-            logger.error(f"Fetch error: {e.message}")
-            return SummaryResponse(
-                success=False,
-                error=e.message,
-                error_code=e.error_code,
-            )
+    def _combined_batches(self, documents: List[tuple]) -> List[List[tuple]]:
+        """Greedily pack (idx, url, title, text) documents into size-capped batches"""
+        batches: List[List[tuple]] = []
+        batch_chars = 0
+        for document in documents:
+            chars = len(document[3])
+            if (
+                not batches
+                or len(batches[-1]) >= self.MAX_COMBINED_DOCS
+                or batch_chars + chars > self.MAX_COMBINED_CHARS
+            ):
+                batches.append([])
+                batch_chars = 0
+            batches[-1].append(document)
+            batch_chars += chars
+        return batches
 
-        except ExtractionError as e:
-            logger.error(f"Extraction error: {e.message}")
-            return SummaryResponse(
-                success=False,
-                error=e.message,
-                error_code=e.error_code,
+    def _stored_summaries(
+        self, urls: List[str], options: SummaryOptions
+    ) -> Dict[str, SummaryResponse]:
+        """Rebuild responses for URLs the RAG store already summarized with these options"""
+        if not self.rag_enabled or not self.rag_engine:
+            return {}
+
+        tag = self._options_tag(options)
+        responses = {}
+        for url, meta in self.rag_engine.get_summaries(urls).items():
+            if meta.get("summary_options") != tag or "summary_json" not in meta:
+                continue
+            try:
+                response = SummaryResponse(
+                    success=True, data=SummaryData.model_validate_json(meta["summary_json"])
+                )
+            except ValueError as e:
+                logger.warning(f"Ignoring unreadable stored summary for {url}: {e}")
+                continue
+            responses[url] = response
+            if self._summary_cache is not None:
+                self._summary_cache.set(self._cache_key(url, options), response)
+
+        if responses:
+            logger.info(f"Reusing {len(responses)} stored summaries from RAG")
+        return responses
+
+    def _options_tag(self, options: SummaryOptions) -> str:
+        """Flatten the options that shape a summary into a string for RAG metadata"""
+        return "|".join(str(value) for value in self._cache_key("", options)[1:])
+
+    def _cache_key(self, url: str, options: SummaryOptions) -> tuple:
+        """Cache key for a URL summarized with the given options"""
+        return (
+            url,
+            options.model,
+            options.max_summary_sentences,
+            options.num_key_points,
+            options.include_citations,
+        )
+
+    def _content_key(self, text: str, options: SummaryOptions) -> tuple:
+        """Cache key for extracted text summarized with the given options"""
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        return (digest, *self._cache_key("", options)[1:])
+
+    def _cached_result(self, text: str, options: SummaryOptions) -> Optional[SummarizerResult]:
+        """Return a recent AI result for identical text and options, if any"""
+        if self._content_cache is None:
+            return None
+        result: Optional[SummarizerResult] = self._content_cache.get(
+            self._content_key(text, options)
+        )
+        if result is not None:
+            logger.info("Reusing summary of identical content")
+        return result
+
+    def _fetch_content(self, url: str) -> Tuple[str, Optional[str], str]:
+        """Fetch a page and extract its text, returning (final_url, title, text)"""
+        html, final_url = self.fetcher.fetch(url)
+        cleaned_text, title = self._extract(html, final_url)
+        return final_url, title, cleaned_text
+
+    def _extract(self, html: str, url: str) -> Tuple[str, Optional[str]]:
+        """Extract page content, in a worker process when extraction_workers is set"""
+        if not self.extraction_workers:
+            return self.extractor.extract(html, url)
+
+        return (
+            self._get_extract_pool()
+            .submit(
+                extract_content,
+                html,
+                url,
+                self.extractor.min_content_length,
+                self.extractor.max_content_length,
             )
+            .result()
+        )
 
-        except SummarizationError as e:
-            logger.error(f"Summarization error: {e.message}")
-            return SummaryResponse(
-                success=False,
-                error=e.message,
-                error_code=e.error_code,
+    def _get_extract_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Start the extraction worker processes on first use"""
+        with self._extract_pool_lock:
+            if self._extract_pool is None:
+                # spawn, not fork: the agent usually lives in a process full of threads
+                context = multiprocessing.get_context("spawn")
+                if sys.version_info >= (3, 11):
+                    # Recycle workers so long-running servers don't accumulate parser memory
+                    self._extract_pool = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=self.extraction_workers,
+                        mp_context=context,
+                        max_tasks_per_child=100,
+                    )
+                else:
+                    self._extract_pool = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=self.extraction_workers, mp_context=context
+                    )
+            return self._extract_pool
+
+    def close(self) -> None:
+        """Stop extraction workers and release the fetcher's connections"""
+        with self._extract_pool_lock:
+            pool, self._extract_pool = self._extract_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        self.fetcher.close()
+
+    def _build_response(
+        self,
+        cache_key: tuple,
+        final_url: str,
+        title: Optional[str],
+        cleaned_text: str,
+        summary_result: SummarizerResult,
+        options: SummaryOptions,
+        start_time: int,
+    ) -> SummaryResponse:
+        """Wrap an AI result in a SummaryResponse, storing it in the cache and RAG"""
+        # Calculate processing time
+        processing_time_ms = (time.perf_counter_ns() - start_time) // 1_000_000
+
+        # Build response
+        metadata = SummaryMetadata(
+            tokens_used=summary_result["tokens_used"],
+            processing_time_ms=processing_time_ms,
+            model_used=summary_result["model_used"],
+            content_length=len(cleaned_text),
+            extraction_method="readability",
+        )
+
+        data = SummaryData(
+            url=final_url,
+            title=title,
+            summary=summary_result["summary"],
+            key_points=summary_result["key_points"],
+            citations=summary_result["citations"] if options.include_citations else None,
+            category=_normalize_category(summary_result["category"]),
+            metadata=metadata,
+        )
+
+        logger.info(f"Successfully summarized {final_url} in {processing_time_ms}ms")
+
+        # Store in RAG if enabled (in the background, embedding is slow)
+        if self.rag_enabled and self.rag_engine:
+            self._queue_rag_store(
+                {
+                    "url": final_url,
+                    "title": title,
+                    "summary": data.summary,
+                    "key_points": data.key_points,
+                    "category": data.category or "",
+                    "metadata": {
+                        "tokens_used": metadata.tokens_used,
+                        "processing_time_ms": metadata.processing_time_ms,
+                        # Full payload so summarize_combined can reuse it without the AI
+                        "summary_json": data.model_dump_json(),
+                        "summary_options": self._options_tag(options),
+                    },
+                }
             )
 
-        except Exception as e:
-            logger.error(f"Unexpected error: {e}", exc_info=True)
+        response = SummaryResponse(success=True, data=data)
+        if self._summary_cache is not None:
+            self._summary_cache.set(cache_key, response)
+        if self._content_cache is not None:
+            self._content_cache.set(self._content_key(cleaned_text, options), summary_result)
+        return response
+
+    def wait_for_rag_writes(self) -> None:
+        """Block until every summary queued for the RAG store has been written"""
+        with self._rag_lock:
+            writer = self._rag_writer
+        if writer is not None:
+            # The writer runs tasks in order, so this returns after earlier flushes
+            writer.submit(lambda: None).result()
+
+    def _queue_rag_store(self, entry: Dict) -> None:
+        """Queue a summary for the RAG store, scheduling a flush if none is pending"""
+        with self._rag_lock:
+            self._rag_pending.append(entry)
+            if self._rag_flush_scheduled:
+                return
+            if self._rag_writer is None:
+                self._rag_writer = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="rag-writer"
+                )
+            self._rag_flush_scheduled = True
+            self._rag_writer.submit(self._flush_rag_writes)
+
+    def _flush_rag_writes(self) -> None:
+        """Write everything queued so far, RAG_WRITE_BATCH summaries per call"""
+        with self._rag_lock:
+            pending, self._rag_pending = self._rag_pending, []
+            self._rag_flush_scheduled = False
+
+        rag_engine = self.rag_engine
+        if rag_engine is None:
+            return
+
+        for start in range(0, len(pending), self.RAG_WRITE_BATCH):
+            batch = pending[start : start + self.RAG_WRITE_BATCH]
+            try:
+                rag_engine.store_summaries(batch)
+                logger.info(f"Stored {len(batch)} summaries in RAG database")
+            except Exception as rag_error:
+                logger.warning(f"Failed to store in RAG: {rag_error}")
+
+    def _error_response(self, error: Exception) -> SummaryResponse:
+        """Map an exception raised while summarizing onto a failed SummaryResponse"""
+        if isinstance(error, FetchError):
+            logger.error(f"Fetch error: {error.message}")
+        elif isinstance(error, ExtractionError):
+            logger.error(f"Extraction error: {error.message}")
+        elif isinstance(error, SummarizationError):
+            logger.error(f"Summarization error: {error.message}")
+        else:
+            logger.error(f"Unexpected error: {error}", exc_info=error)
             return SummaryResponse(
                 success=False,
-                error=f"Unexpected error: {str(e)}",
+                error=f"Unexpected error: {str(error)}",
                 error_code="UNKNOWN_ERROR",
             )
 
+        return SummaryResponse(
+            success=False,
+            error=error.message,
+            error_code=error.error_code,
+        )
+
     def summarize_url(
         self,
         url: str,
@@ -218,11 +666,92 @@ class WebSummarizerAgent:
         """
         request = SummaryRequest(
             url=url,
-            options=SummaryOptions(
-                max_summary_sentences=max_summary_sentences,
-                num_key_points=num_key_points,
-                include_citations=include_citations,
-                model=model,
+            options=_summary_options(
+                max_summary_sentences, num_key_points, include_citations, model
             ),
         )
         return self.summarize(request)
+
+    def summarize_batch(
+        self,
+        requests: List[SummaryRequest],
+        max_workers: Optional[int] = None,
+        executor: Optional[concurrent.futures.Executor] = None,
+    ) -> List[SummaryResponse]:
+        """
+        Summarize several requests concurrently
+
+        Args:
+            requests: SummaryRequests to process
+            max_workers: Maximum concurrent workers (defaults to one per request)
+            executor: Existing executor to run the requests on (max_workers is ignored)
+
+        Returns:
+            SummaryResponses in the same order as the requests
+        """
+        if not requests:
+            return []
+
+        if executor is not None:
+            return list(executor.map(self.summarize, requests))
+
+        if len(requests) == 1:
+            return [self.summarize(requests[0])]
+
+        workers = max_workers or len(requests)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.summarize, requests))
+
+    async def summarize_many(
+        self,
+        urls: List[str],
+        options: Optional[SummaryOptions] = None,
+        max_concurrency: int = 50,
+        max_per_host: int = 4,
+    ) -> List[SummaryResponse]:
+        """
+        Summarize many URLs concurrently from async code
+
+        Each URL runs the usual fetch, extract and summarize pipeline on a
+        dedicated thread pool, so the event loop stays free and wall time is
+        bounded by the slowest pages rather than the sum of all of them.
+
+        Args:
+            urls: URLs to summarize
+            options: Summary options applied to every URL
+            max_concurrency: Maximum URLs processed at once
+            max_per_host: Maximum URLs from one host processed at once
+
+        Returns:
+            SummaryResponses in the same order as the URLs
+        """
+        if not urls:
+            return []
+
+        options = options or SummaryOptions()
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        # Don't hammer one origin even when the overall limit allows it
+        host_semaphores: DefaultDict[Optional[str], asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(max_per_host)
+        )
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(urls))
+        )
+
+        async def bounded(url: str) -> SummaryResponse:
+            async with host_semaphores[urlsplit(url).hostname], semaphore:
+                try:
+                    request = SummaryRequest.model_validate({"url": url, "options": options})
+                except ValueError:
+                    return self._error_response(
+                        FetchError(f"Invalid URL format: {url}", error_code="INVALID_URL")
+                    )
+                return await loop.run_in_executor(executor, self.summarize, request)
+
+        try:
+            return list(await asyncio.gather(*(bounded(url) for url in urls)))
+        finally:
+            # Waiting here would block the event loop if the gather was cancelled
+            executor.shutdown(wait=False, cancel_futures=True)
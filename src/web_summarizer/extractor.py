@@ -2,28 +2,77 @@
 Content extraction and cleaning module
 """
 
+import html as htmllib
 import logging
 import re
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
-from bs4 import BeautifulSoup
+import orjson
+from lxml import etree
+from lxml import html as lhtml
 from readability import Document
 
 logger = logging.getLogger(__name__)
 
+# Markup that never holds article text
+UNWANTED_TAGS = ("script", "style", "noscript", "nav", "header", "footer", "aside")
+
+# Class/id fragments of common ad and menu containers (matched case-insensitively)
+UNWANTED_NAMES = (
+    "ad",
+    "advertisement",
+    "sidebar",
+    "menu",
+    "navigation",
+    "nav",
+    "footer",
+    "header",
+    "social",
+    "share",
+    "comments",
+    "related",
+    "recommended",
+    "popup",
+    "modal",
+)
+
+_UNWANTED_RE = re.compile("|".join(map(re.escape, UNWANTED_NAMES)), re.IGNORECASE)
+
+# One walk over the tree collects unwanted tags and anything with a class or id
+_CANDIDATES_XPATH = etree.XPath(
+    ".//*[{tags} or @class or @id]".format(
+        tags=" or ".join(f"self::{tag}" for tag in UNWANTED_TAGS)
+    )
+)
+
+# JSON-LD blocks, where structured-data pages publish their article body
+_JSON_LD_RE = re.compile(
+    r"<script[^>]+application/ld\+json[^>]*>(.*?)</script>", re.IGNORECASE | re.DOTALL
+)
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
 
 class ExtractionError(Exception):
     """Exception raised when content extraction fails"""
 
+    __slots__ = ("message", "error_code")
+
     def __init__(self, message: str, error_code: str):
         self.message = message
         self.error_code = error_code
         super().__init__(self.message)
 
+    def __reduce__(self) -> Tuple[type, Tuple[str, str]]:
+        # Keep error_code when raised in an extraction worker process (slots are not pickled)
+        return (self.__class__, (self.message, self.error_code))
+
 
 class ContentExtractor:
     """Extracts and cleans readable content from HTML"""
 
+    # Shorter JSON-LD bodies are usually teasers, so readability handles those pages
+    MIN_STRUCTURED_LENGTH = 500
+
     def __init__(self, min_content_length: int = 100, max_content_length: int = 50000):
         self.min_content_length = min_content_length
         self.max_content_length = max_content_length
@@ -49,21 +98,13 @@ class ContentExtractor:
             )
 
         try:
-            # Use readability to extract main content
-            doc = Document(html)
-            title = doc.title()
-            content_html = doc.summary()
-
-            logger.info(f"Extracted title: {title}")
-
-            # Parse with BeautifulSoup for cleaning
-            soup = BeautifulSoup(content_html, "lxml")
-
-            # Remove unwanted elements
-            self._remove_unwanted_elements(soup)
-
-            # Extract text
-            text = soup.get_text(separator="\n", strip=True)
+            # Pages that publish their article body as JSON-LD skip readability entirely
+            structured = self._extract_structured(html)
+            if structured is not None:
+                text, title = structured
+                logger.info(f"Using JSON-LD article body, title: {title}")
+            else:
+                text, title = self._extract_readable(html)
 
             # Clean the text
             cleaned_text = self._clean_text(text)
@@ -95,59 +136,98 @@ class ContentExtractor:
                 error_code="EXTRACTION_FAILED",
             )
 
-    def _remove_unwanted_elements(self, soup: BeautifulSoup) -> None:
-        """Remove unwanted HTML elements"""
-        # Remove script and style elements
-        for element in soup(["script", "style", "noscript"]):
-            element.decompose()
-
-        # Remove navigation elements
-        for element in soup.find_all(["nav", "header", "footer", "aside"]):
-            element.decompose()
-
-        # Remove elements with common ad/menu classes
-        unwanted_classes = [
-            "ad",
-            "advertisement",
-            "sidebar",
-            "menu",
-            "navigation",
-            "nav",
-            "footer",
-            "header",
-            "social",
-            "share",
-            "comments",
-            "related",
-            "recommended",
-            "popup",
-            "modal",
-        ]
-
-        for class_name in unwanted_classes:
-            for element in soup.find_all(class_=re.compile(class_name, re.IGNORECASE)):
-                element.decompose()
-
-        # Remove elements with common ad/menu IDs
-        for id_name in unwanted_classes:
-            for element in soup.find_all(id=re.compile(id_name, re.IGNORECASE)):
-                element.decompose()
+    def _extract_readable(self, html: str) -> Tuple[str, Optional[str]]:
+        """Find the main content with readability and return its text and title"""
+        doc = Document(html)
+        title = doc.title()
+        content_html = doc.summary(html_partial=True)
+        # Free readability's full-page tree before parsing the (much smaller) article
+        del doc
+
+        logger.info(f"Extracted title: {title}")
+
+        if not content_html.strip():
+            return "", title
+
+        tree = lhtml.fromstring(content_html)
+
+        # Remove unwanted elements
+        self._remove_unwanted_elements(tree)
+
+        # Extract text, one line per text node
+        return "\n".join(filter(None, (chunk.strip() for chunk in tree.itertext()))), title
+
+    def _extract_structured(self, html: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Return (articleBody, headline) from the page's JSON-LD, if it has a full one"""
+        if "articleBody" not in html:
+            return None
+
+        for block in _JSON_LD_RE.findall(html):
+            try:
+                data = orjson.loads(block)
+            except orjson.JSONDecodeError:
+                continue
+
+            article = self._find_article(data)
+            if article is None:
+                continue
+
+            body = htmllib.unescape(article["articleBody"])
+            if len(body) < self.MIN_STRUCTURED_LENGTH:
+                continue
+
+            title = article.get("headline") or article.get("name")
+            if not isinstance(title, str):
+                match = _TITLE_RE.search(html)
+                title = htmllib.unescape(match.group(1)).strip() if match else None
+            return body, title
+
+        return None
+
+    def _find_article(self, data: Any) -> Optional[dict]:
+        """Find the first JSON-LD node with a string articleBody (top level, list or @graph)"""
+        nodes = data if isinstance(data, list) else [data]
+        for node in nodes:
+            if not isinstance(node, dict):
+                continue
+            if isinstance(node.get("articleBody"), str):
+                return node
+            if "@graph" in node:
+                found = self._find_article(node["@graph"])
+                if found is not None:
+                    return found
+        return None
+
+    def _remove_unwanted_elements(self, tree: lhtml.HtmlElement) -> None:
+        """Remove scripts, navigation and ad/menu containers from the tree"""
+        for element in _CANDIDATES_XPATH(tree):
+            if (
+                element.tag in UNWANTED_TAGS
+                or _UNWANTED_RE.search(element.get("class", ""))
+                or _UNWANTED_RE.search(element.get("id", ""))
+            ):
+                element.drop_tree()
 
     def _clean_text(self, text: str) -> str:
         """Clean extracted text"""
-        # Replace multiple newlines with double newline
-        text = re.sub(r"\n{3,}", "\n\n", text)
-
-        # Remove excessive whitespace
-        text = re.sub(r"[ \t]+", " ", text)
-
-        # Remove leading/trailing whitespace from each line
-        lines = [line.strip() for line in text.split("\n")]
-
-        # Remove empty lines
-        lines = [line for line in lines if line]
-
-        # Join lines back together
-        text = "\n".join(lines)
-
-        return text.strip()
+        # One pass: collapse runs of whitespace, strip, and drop empty lines.
+        # map/filter keep the per-line work in C (no generator frames)
+        return "\n".join(filter(None, map(" ".join, map(str.split, text.split("\n")))))
+
+
+def extract_content(
+    html: str, url: str, min_content_length: int, max_content_length: int
+) -> Tuple[str, Optional[str]]:
+    """
+    Extract content with a fresh ContentExtractor (picklable entry point for worker processes)
+
+    Args:
+        html: Raw HTML content
+        url: Source URL (for context)
+        min_content_length: Minimum content length to accept
+        max_content_length: Maximum content length (longer text is truncated)
+
+    Returns:
+        Tuple of (cleaned_text, title)
+    """
+    return ContentExtractor(min_content_length, max_content_length).extract(html, url)
@@ -2,24 +2,82 @@
 URL fetching and content retrieval module
 """
 
+import asyncio
+import concurrent.futures
 import logging
-from typing import Tuple
+from types import MappingProxyType
+from typing import List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from web_summarizer.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Transient upstream failures worth one more try; 429s are surfaced, not retried
+RETRY_STATUSES = (502, 503, 504)
+
+# Bytes pulled off the socket per read while streaming a page
+CHUNK_SIZE = 64 * 1024
+
+# Browser-like request headers sent with every fetch (User-Agent is per fetcher)
+DEFAULT_HEADERS = MappingProxyType(
+    {
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        # Whatever urllib3 can decode here: gzip and deflate, plus br/zstd when
+        # brotli/zstandard are installed
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "DNT": "1",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+    }
+)
+
 
 class FetchError(Exception):
     """Base exception for fetch errors"""
 
+    __slots__ = ("message", "error_code")
+
     def __init__(self, message: str, error_code: str):
         self.message = message
         self.error_code = error_code
         super().__init__(self.message)
 
+    def __reduce__(self) -> Tuple[type, Tuple[str, str]]:
+        return (self.__class__, (self.message, self.error_code))
+
+
+def create_session(pool_size: int = 10, retries: int = 2) -> requests.Session:
+    """
+    Create a session with a pooled, retrying adapter
+
+    Args:
+        pool_size: Keep-alive connections held per host
+        retries: Retries for connection errors and transient 5xx responses
+
+    Returns:
+        Configured requests session
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.3,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 class URLFetcher:
     """Handles fetching webpage content"""
@@ -29,10 +87,52 @@ class URLFetcher:
         timeout: int = 10,
         max_redirects: int = 3,
         user_agent: str = "WebSummarizerAgent/1.0.0",
+        session: Optional[requests.Session] = None,
+        max_bytes: int = 2 * 1024 * 1024,
+        revalidate_size: int = 64,
+        revalidate_bytes: int = 16 * 1024 * 1024,
     ):
+        """
+        Initialize the fetcher
+
+        Args:
+            timeout: Request timeout in seconds
+            max_redirects: Maximum number of redirects to follow
+            user_agent: User agent string for requests
+            session: Shared session to reuse pooled connections (one is created if omitted)
+            max_bytes: Stop reading a page body after this many (decompressed) bytes
+            revalidate_size: Pages remembered with their ETag/Last-Modified so repeat
+                fetches can be answered with 304 Not Modified (0 disables)
+            revalidate_bytes: Cap on the total size of the HTML those pages keep in
+                memory; least recently fetched pages are dropped first
+        """
         self.timeout = timeout
         self.max_redirects = max_redirects
         self.user_agent = user_agent
+        self.max_bytes = max_bytes
+        # url -> (validator headers, html, final_url) for conditional GETs, sized by its html
+        self._validated = None
+        if revalidate_size:
+            self._validated = TTLCache(
+                maxsize=revalidate_size,
+                ttl=24 * 3600,
+                max_bytes=revalidate_bytes,
+                sizeof=lambda entry: len(entry[1]),
+            )
+
+        # Reuse one session so keep-alive connections survive between fetches
+        self._owns_session = session is None
+        self.session = session or create_session()
+        self.session.max_redirects = max_redirects
+
+        # Request headers are the same for every fetch, so build them once. They stay
+        # off session.headers because the session may be shared with other fetchers
+        self.headers = {"User-Agent": user_agent, **DEFAULT_HEADERS}
+
+    def close(self) -> None:
+        """Close the fetcher's own session (a shared session is left to its owner)"""
+        if self._owns_session:
+            self.session.close()
 
     def fetch(self, url: str) -> Tuple[str, str]:
         """
@@ -60,64 +160,94 @@ class URLFetcher:
             url = url.replace("http://", "https://", 1)
             logger.info(f"Upgraded HTTP to HTTPS: {url}")
 
-        headers = {
-            "User-Agent": self.user_agent,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
+        # Ask the server to skip the body if our copy is still current
+        headers = self.headers
+        validated = self._validated.get(url) if self._validated is not None else None
+        if validated is not None:
+            headers = {**self.headers, **validated[0]}
 
         try:
             logger.info(f"Fetching URL: {url}")
-            # Create session to configure max redirects
-            session = requests.Session()
-            session.max_redirects = self.max_redirects
-
-            response = session.get(
+            with self.session.get(
                 url,
                 headers=headers,
                 timeout=self.timeout,
                 allow_redirects=True,
-            )
+                stream=True,
+            ) as response:
+                if response.status_code == 304 and validated is not None:
+                    logger.info(f"Not modified, reusing cached page: {url}")
+                    return validated[1], validated[2]
 
-            # Check for HTTP errors
-            if response.status_code == 404:
-                raise FetchError(
-                    f"Page not found (404): {url}",
-                    error_code="NOT_FOUND",
-                )
-            elif response.status_code == 403:
-                raise FetchError(
-                    f"Access forbidden (403): {url}",
-                    error_code="FORBIDDEN",
-                )
-            elif response.status_code == 500:
-                raise FetchError(
-                    f"Server error (500): {url}",
-                    error_code="SERVER_ERROR",
-                )
-            elif response.status_code >= 400:
-                raise FetchError(
-                    f"HTTP error {response.status_code}: {url}",
-                    error_code=f"HTTP_{response.status_code}",
-                )
-
-            response.raise_for_status()
-
-            # Check content type
-            content_type = response.headers.get("Content-Type", "").lower()
-            if "text/html" not in content_type and "application/xhtml" not in content_type:
-                logger.warning(f"Unexpected content type: {content_type}")
-
-            # Get final URL after redirects
-            final_url = response.url
-
-            logger.info(f"Successfully fetched {len(response.text)} bytes from {final_url}")
-
-            return response.text, final_url
+                # Check for HTTP errors
+                if response.status_code == 404:
+                    raise FetchError(
+                        f"Page not found (404): {url}",
+                        error_code="NOT_FOUND",
+                    )
+                elif response.status_code == 403:
+                    raise FetchError(
+                        f"Access forbidden (403): {url}",
+                        error_code="FORBIDDEN",
+                    )
+                elif response.status_code == 500:
+                    raise FetchError(
+                        f"Server error (500): {url}",
+                        error_code="SERVER_ERROR",
+                    )
+                elif response.status_code >= 400:
+                    raise FetchError(
+                        f"HTTP error {response.status_code}: {url}",
+                        error_code=f"HTTP_{response.status_code}",
+                    )
+
+                response.raise_for_status()
+
+                # Check content type before downloading anything
+                content_type = response.headers.get("Content-Type", "").lower()
+                if content_type and not (
+                    content_type.startswith("text/")
+                    or "html" in content_type
+                    or "xml" in content_type
+                ):
+                    raise FetchError(
+                        f"Unsupported content type ({content_type}): {url}",
+                        error_code="UNSUPPORTED_CONTENT_TYPE",
+                    )
+                if "text/html" not in content_type and "application/xhtml" not in content_type:
+                    logger.warning(f"Unexpected content type: {content_type}")
+
+                # Read at most max_bytes instead of buffering arbitrarily large pages
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    body.extend(chunk)
+                    if len(body) >= self.max_bytes:
+                        logger.warning(f"Page exceeds {self.max_bytes} bytes, truncating: {url}")
+                        del body[self.max_bytes :]
+                        break
+
+                # Only trust an explicit charset; requests assumes ISO-8859-1 for bare text/html
+                encoding = response.encoding if "charset=" in content_type else "utf-8"
+                try:
+                    html = body.decode(encoding or "utf-8", errors="replace")
+                except LookupError:
+                    html = body.decode("utf-8", errors="replace")
+
+                # Get final URL after redirects
+                final_url = response.url
+
+                if self._validated is not None:
+                    validators = {}
+                    if response.headers.get("ETag"):
+                        validators["If-None-Match"] = response.headers["ETag"]
+                    if response.headers.get("Last-Modified"):
+                        validators["If-Modified-Since"] = response.headers["Last-Modified"]
+                    if validators:
+                        self._validated.set(url, (validators, html, final_url))
+
+            logger.info(f"Successfully fetched {len(body)} bytes from {final_url}")
+
+            return html, final_url
 
         except FetchError:
             # Re-raise FetchError as-is
@@ -139,3 +269,40 @@ class URLFetcher:
                 f"Unexpected error while fetching URL: {str(e)}",
                 error_code="UNKNOWN_ERROR",
             )
+
+    async def afetch_many(
+        self, urls: List[str], max_concurrency: int = 10
+    ) -> List[Union[Tuple[str, str], FetchError]]:
+        """
+        Fetch many URLs concurrently from async code
+
+        Each fetch runs on a worker thread over the shared connection pool, so
+        wall time is bounded by the slowest pages rather than the sum of them.
+
+        Args:
+            urls: URLs to fetch
+            max_concurrency: Maximum fetches in flight at once
+
+        Returns:
+            (html_content, final_url) per URL in input order, or the FetchError
+            in place of a URL that failed
+        """
+        if not urls:
+            return []
+
+        loop = asyncio.get_running_loop()
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(urls))
+        )
+
+        async def fetch_one(url: str) -> Union[Tuple[str, str], FetchError]:
+            try:
+                return await loop.run_in_executor(executor, self.fetch, url)
+            except FetchError as e:
+                return e
+
+        try:
+            return list(await asyncio.gather(*(fetch_one(url) for url in urls)))
+        finally:
+            # Waiting here would block the event loop if the gather was cancelled
+            executor.shutdown(wait=False, cancel_futures=True)
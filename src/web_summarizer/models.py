@@ -3,6 +3,7 @@ Data models for Web Summarizer Agent
 """
 
 from datetime import datetime
+from functools import cached_property
 from typing import List, Optional
 
 from pydantic import BaseModel, Field, HttpUrl, field_validator
@@ -74,6 +75,16 @@ class SummaryData(BaseModel):
     category: Optional[str] = None
     metadata: SummaryMetadata
 
+    @cached_property
+    def word_count(self) -> int:
+        """Number of words in the summary (computed once, cached summaries reuse it)"""
+        return len(self.summary.split())
+
+    @cached_property
+    def key_points_text(self) -> str:
+        """Key points joined into one "; "-separated string for flat exports"""
+        return "; ".join(self.key_points)
+
 
 class SummaryResponse(BaseModel):
     """Response model for web summarization"""
@@ -3,10 +3,13 @@ RAG (Retrieval-Augmented Generation) engine for Web Summarizer
 Stores and retrieves summaries using vector embeddings
 """
 
+import asyncio
+import hashlib
 import logging
 import os
-from typing import List, Dict, Optional, Any
 from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
 import chromadb
 from chromadb.config import Settings
 from chromadb.utils import embedding_functions
@@ -14,15 +17,34 @@ from chromadb.utils import embedding_functions
 logger = logging.getLogger(__name__)
 
 
+def _embedding_device() -> str:
+    """Pick the fastest torch device available for local embeddings"""
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+
+    if torch.cuda.is_available():
+        return "cuda"
+    if getattr(torch.backends, "mps", None) is not None and torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
 class RAGEngine:
     """RAG engine for storing and retrieving summaries"""
 
+    # HNSW index settings for new collections (Chroma defaults: 100 / 10 / 16)
+    HNSW_DEFAULTS = {"hnsw:construction_ef": 200, "hnsw:search_ef": 50, "hnsw:M": 32}
+
     def __init__(
         self,
         persist_directory: str = "./chroma_db",
         collection_name: str = "web_summaries",
         embedding_model: str = "sentence-transformers",
-        gemini_api_key: Optional[str] = None
+        gemini_api_key: Optional[str] = None,
+        embedding_device: Optional[str] = None,
+        hnsw_params: Optional[Dict[str, Any]] = None,
     ):
         """
         Initialize RAG engine
@@ -32,45 +54,60 @@ class RAGEngine:
             collection_name: Name of the collection
             embedding_model: "sentence-transformers" (free) or "gemini" (requires API key)
             gemini_api_key: Google Gemini API key (required if using gemini embeddings)
+            embedding_device: Torch device for sentence-transformers ("cpu", "cuda", ...);
+                detected automatically if omitted
+            hnsw_params: Overrides for HNSW_DEFAULTS (e.g. {"hnsw:search_ef": 100});
+                applied whenever the collection is created (including by clear_all)
         """
         self.persist_directory = persist_directory
         self.collection_name = collection_name
         self.embedding_model = embedding_model
+        self.hnsw_params = hnsw_params or {}
 
         # Initialize ChromaDB client
-        self.client = chromadb.Client(Settings(
-            persist_directory=persist_directory,
-            anonymized_telemetry=False
-        ))
+        self.client = chromadb.Client(
+            Settings(persist_directory=persist_directory, anonymized_telemetry=False)
+        )
 
         # Choose embedding function
         if embedding_model == "gemini" and gemini_api_key:
             logger.info("Using Gemini embeddings")
             self.embedding_function = embedding_functions.GoogleGenerativeAiEmbeddingFunction(
-                api_key=gemini_api_key,
-                model_name="models/embedding-001"
+                api_key=gemini_api_key, model_name="models/embedding-001"
             )
         else:
-            logger.info("Using Sentence Transformers embeddings (free)")
+            device = embedding_device or os.getenv("RAG_EMBEDDING_DEVICE") or _embedding_device()
+            logger.info(f"Using Sentence Transformers embeddings (free) on {device}")
+            # Batched writes from store_summaries encode in one pass on this device
             self.embedding_function = embedding_functions.SentenceTransformerEmbeddingFunction(
-                model_name="all-MiniLM-L6-v2"
+                model_name="all-MiniLM-L6-v2",
+                device=device,
             )
 
         # Get or create collection
         try:
             self.collection = self.client.get_collection(
-                name=collection_name,
-                embedding_function=self.embedding_function
+                name=collection_name, embedding_function=self.embedding_function
             )
             logger.info(f"Loaded existing collection: {collection_name}")
         except Exception:
-            self.collection = self.client.create_collection(
-                name=collection_name,
-                embedding_function=self.embedding_function,
-                metadata={"description": "Web article summaries with embeddings"}
-            )
+            self.collection = self._create_collection()
             logger.info(f"Created new collection: {collection_name}")
 
+    def _create_collection(self) -> Any:
+        """Create the collection with the index settings used at every creation"""
+        return self.client.create_collection(
+            name=self.collection_name,
+            embedding_function=self.embedding_function,
+            # Cosine distance keeps relevance_score = 1 - distance within [0, 1]
+            metadata={
+                "description": "Web article summaries with embeddings",
+                "hnsw:space": "cosine",
+                **self.HNSW_DEFAULTS,
+                **self.hnsw_params,
+            },
+        )
+
     def store_summary(
         self,
         url: str,
@@ -78,7 +115,7 @@ class RAGEngine:
         summary: str,
         key_points: List[str],
         category: str = "",
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
     ) -> str:
         """
         Store a summary in the vector database
@@ -94,42 +131,115 @@ class RAGEngine:
         Returns:
             Document ID
         """
-        # Create unique ID from URL
-        doc_id = f"doc_{hash(url)}"
-
-        # Combine text for embedding
-        combined_text = f"{title}\n\n{summary}\n\nKey Points:\n" + "\n".join(f"- {kp}" for kp in key_points)
-
-        # Prepare metadata
-        meta = {
-            "url": url,
-            "title": title,
-            "category": category,
-            "timestamp": datetime.now().isoformat(),
-            "key_points_count": len(key_points)
-        }
+        return self.store_summaries(
+            [
+                {
+                    "url": url,
+                    "title": title,
+                    "summary": summary,
+                    "key_points": key_points,
+                    "category": category,
+                    "metadata": metadata,
+                }
+            ]
+        )[0]
+
+    def store_summaries(self, summaries: List[Dict[str, Any]]) -> List[str]:
+        """
+        Store several summaries in the vector database with a single write
 
-        if metadata:
-            meta.update(metadata)
+        Args:
+            summaries: Dicts with the store_summary arguments (url, title, summary,
+                key_points and optionally category and metadata)
 
-        # Store in ChromaDB
-        try:
-            self.collection.add(
-                documents=[combined_text],
-                metadatas=[meta],
-                ids=[doc_id]
+        Returns:
+            Document IDs, in input order
+        """
+        # Later entries for the same URL win (Chroma rejects duplicate IDs in one call)
+        entries: Dict[str, tuple] = {}
+        doc_ids = []
+        for item in summaries:
+            # Create unique ID from URL
+            doc_id = self._doc_id(item["url"])
+            doc_ids.append(doc_id)
+
+            # Combine text for embedding
+            key_points = item["key_points"]
+            combined_text = f"{item['title']}\n\n{item['summary']}\n\nKey Points:\n" + "\n".join(
+                f"- {kp}" for kp in key_points
             )
-            logger.info(f"Stored summary for: {title}")
-            return doc_id
+
+            # Prepare metadata
+            meta = {
+                "url": item["url"],
+                "title": item["title"],
+                "category": item.get("category", ""),
+                "timestamp": datetime.now().isoformat(),
+                "key_points_count": len(key_points),
+                "content_hash": hashlib.blake2b(
+                    combined_text.encode("utf-8"), digest_size=16
+                ).hexdigest(),
+            }
+
+            if item.get("metadata"):
+                meta.update(item["metadata"])
+
+            entries[doc_id] = (combined_text, meta)
+
+        # Store in ChromaDB, replacing any earlier summary of the same URL
+        try:
+            # Unchanged text only needs its metadata refreshed, not a new embedding
+            existing = self.collection.get(ids=list(entries), include=["metadatas"])
+            unchanged = {
+                doc_id
+                for doc_id, stored in zip(existing["ids"], existing["metadatas"] or [])
+                if stored and stored.get("content_hash") == entries[doc_id][1]["content_hash"]
+            }
+            changed = [doc_id for doc_id in entries if doc_id not in unchanged]
+
+            if unchanged:
+                self.collection.update(
+                    ids=list(unchanged),
+                    metadatas=[entries[doc_id][1] for doc_id in unchanged],
+                )
+            if changed:
+                self.collection.upsert(
+                    documents=[entries[doc_id][0] for doc_id in changed],
+                    metadatas=[entries[doc_id][1] for doc_id in changed],
+                    ids=changed,
+                )
+            logger.info(f"Stored {len(entries)} summaries ({len(changed)} embedded)")
+            return doc_ids
         except Exception as e:
-            logger.error(f"Failed to store summary: {e}")
+            logger.error(f"Failed to store summaries: {e}")
             raise
 
+    def get_summaries(self, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up stored summaries by exact URL
+
+        Args:
+            urls: URLs to look up
+
+        Returns:
+            Metadata of each stored summary, keyed by URL (missing URLs are omitted)
+        """
+        if not urls:
+            return {}
+
+        try:
+            results = self.collection.get(
+                ids=[self._doc_id(url) for url in urls],
+                include=["metadatas"],
+            )
+        except Exception as e:
+            logger.error(f"Lookup failed: {e}")
+            return {}
+
+        return {meta["url"]: meta for meta in results["metadatas"] if meta and "url" in meta}
+
     def search_similar(
-        self,
-        query: str,
-        n_results: int = 5,
-        filter_metadata: Optional[Dict[str, Any]] = None
+        self, query: str, n_results: int = 5, filter_metadata: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
         """
         Search for similar summaries
@@ -144,22 +254,10 @@ class RAGEngine:
         """
         try:
             results = self.collection.query(
-                query_texts=[query],
-                n_results=n_results,
-                where=filter_metadata
+                query_texts=[query], n_results=n_results, where=filter_metadata
             )
 
-            # Format results
-            formatted_results = []
-            if results['documents'] and len(results['documents'][0]) > 0:
-                for i in range(len(results['documents'][0])):
-                    formatted_results.append({
-                        "id": results['ids'][0][i],
-                        "document": results['documents'][0][i],
-                        "metadata": results['metadatas'][0][i],
-                        "distance": results['distances'][0][i] if 'distances' in results else None
-                    })
-
+            formatted_results = self._format_matches(results, 0)
             logger.info(f"Found {len(formatted_results)} similar documents")
             return formatted_results
 
@@ -167,11 +265,58 @@ class RAGEngine:
             logger.error(f"Search failed: {e}")
             return []
 
-    def generate_with_context(
+    def search_similar_batch(
         self,
-        query: str,
-        gemini_model,
-        n_context_docs: int = 3
+        queries: List[str],
+        n_results: int = 5,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several queries at once (one embedding pass, one index query)
+
+        Args:
+            queries: Search queries
+            n_results: Number of results to return per query
+            filter_metadata: Optional metadata filters applied to every query
+
+        Returns:
+            One list of similar documents per query, in input order
+        """
+        if not queries:
+            return []
+
+        try:
+            results = self.collection.query(
+                query_texts=queries, n_results=n_results, where=filter_metadata
+            )
+        except Exception as e:
+            logger.error(f"Batch search failed: {e}")
+            return [[] for _ in queries]
+
+        batch = [self._format_matches(results, i) for i in range(len(queries))]
+        logger.info(
+            f"Found {sum(len(matches) for matches in batch)} similar documents for {len(queries)} queries"
+        )
+        return batch
+
+    def _format_matches(self, results: Dict[str, Any], index: int) -> List[Dict[str, Any]]:
+        """Flatten Chroma's nested query results for the query at index"""
+        if not results["documents"] or index >= len(results["documents"]):
+            return []
+
+        distances = results.get("distances")
+        return [
+            {
+                "id": results["ids"][index][i],
+                "document": document,
+                "metadata": results["metadatas"][index][i],
+                "distance": distances[index][i] if distances else None,
+            }
+            for i, document in enumerate(results["documents"][index])
+        ]
+
+    def generate_with_context(
+        self, query: str, gemini_model: Any, n_context_docs: int = 3
     ) -> Dict[str, Any]:
         """
         Generate response using RAG (retrieve + generate)
@@ -188,28 +333,123 @@ class RAGEngine:
         similar_docs = self.search_similar(query, n_results=n_context_docs)
 
         if not similar_docs:
+            return self._no_context_answer()
+
+        prompt, sources = self._build_rag_prompt(query, similar_docs)
+
+        try:
+            response = gemini_model.generate_content(prompt)
+            answer = response.text.strip()
+
             return {
-                "answer": "No relevant documents found in the knowledge base.",
-                "sources": [],
-                "context_used": 0
+                "answer": answer,
+                "sources": sources,
+                "context_used": len(similar_docs),
+                "query": query,
             }
 
-        # Build context from retrieved documents
+        except Exception as e:
+            logger.error(f"Generation failed: {e}")
+            return self._failed_answer(e, sources)
+
+    async def generate_with_context_async(
+        self, query: str, gemini_model: Any, n_context_docs: int = 3
+    ) -> Dict[str, Any]:
+        """
+        Async version of generate_with_context that never blocks the event loop
+
+        Args:
+            query: User query
+            gemini_model: Initialized Gemini model
+            n_context_docs: Number of context documents to retrieve
+
+        Returns:
+            Generated response with sources
+        """
+        # Embedding the query and searching Chroma are blocking
+        similar_docs = await asyncio.to_thread(self.search_similar, query, n_context_docs)
+
+        if not similar_docs:
+            return self._no_context_answer()
+
+        prompt, sources = self._build_rag_prompt(query, similar_docs)
+
+        try:
+            response = await gemini_model.generate_content_async(prompt)
+            return {
+                "answer": response.text.strip(),
+                "sources": sources,
+                "context_used": len(similar_docs),
+                "query": query,
+            }
+
+        except Exception as e:
+            logger.error(f"Generation failed: {e}")
+            return self._failed_answer(e, sources)
+
+    async def stream_with_context(
+        self, query: str, gemini_model: Any, n_context_docs: int = 3
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a RAG answer as it is generated
+
+        Yields {"type": "sources", ...} once retrieval is done, then
+        {"type": "chunk", "text": ...} events, and finally one
+        {"type": "result", ...} event shaped like generate_with_context's return.
+
+        Args:
+            query: User query
+            gemini_model: Initialized Gemini model
+            n_context_docs: Number of context documents to retrieve
+        """
+        similar_docs = await asyncio.to_thread(self.search_similar, query, n_context_docs)
+
+        if not similar_docs:
+            yield {"type": "result", **self._no_context_answer()}
+            return
+
+        prompt, sources = self._build_rag_prompt(query, similar_docs)
+        yield {"type": "sources", "sources": sources}
+
+        parts = []
+        try:
+            response = await gemini_model.generate_content_async(prompt, stream=True)
+            async for chunk in response:
+                parts.append(chunk.text)
+                yield {"type": "chunk", "text": chunk.text}
+        except Exception as e:
+            logger.error(f"Generation failed: {e}")
+            yield {"type": "result", **self._failed_answer(e, sources)}
+            return
+
+        yield {
+            "type": "result",
+            "answer": "".join(parts).strip(),
+            "sources": sources,
+            "context_used": len(similar_docs),
+            "query": query,
+        }
+
+    def _build_rag_prompt(
+        self, query: str, similar_docs: List[Dict[str, Any]]
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """Build the answer prompt and source list from retrieved documents"""
         context_parts = []
         sources = []
 
         for i, doc in enumerate(similar_docs, 1):
             context_parts.append(f"[Source {i}]\n{doc['document']}\n")
-            sources.append({
-                "id": doc['id'],
-                "title": doc['metadata'].get('title', 'Unknown'),
-                "url": doc['metadata'].get('url', ''),
-                "relevance_score": 1 - doc['distance'] if doc['distance'] else None
-            })
+            sources.append(
+                {
+                    "id": doc["id"],
+                    "title": doc["metadata"].get("title", "Unknown"),
+                    "url": doc["metadata"].get("url", ""),
+                    "relevance_score": 1 - doc["distance"] if doc["distance"] is not None else None,
+                }
+            )
 
         context = "\n".join(context_parts)
 
-        # Generate response using Gemini
         prompt = f"""Based on the following context from our knowledge base, answer the question.
 
 Context:
@@ -219,24 +459,23 @@ Question: {query}
 
 Provide a comprehensive answer based on the context above. If the context doesn't fully answer the question, acknowledge that and provide what information is available."""
 
-        try:
-            response = gemini_model.generate_content(prompt)
-            answer = response.text.strip()
+        return prompt, sources
 
-            return {
-                "answer": answer,
-                "sources": sources,
-                "context_used": len(similar_docs),
-                "query": query
-            }
+    def _no_context_answer(self) -> Dict[str, Any]:
+        """Answer returned when nothing relevant is stored"""
+        return {
+            "answer": "No relevant documents found in the knowledge base.",
+            "sources": [],
+            "context_used": 0,
+        }
 
-        except Exception as e:
-            logger.error(f"Generation failed: {e}")
-            return {
-                "answer": f"Error generating response: {str(e)}",
-                "sources": sources,
-                "context_used": 0
-            }
+    def _failed_answer(self, error: Exception, sources: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Answer returned when generation fails"""
+        return {
+            "answer": f"Error generating response: {str(error)}",
+            "sources": sources,
+            "context_used": 0,
+        }
 
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the vector database"""
@@ -246,7 +485,7 @@ Provide a comprehensive answer based on the context above. If the context doesn'
                 "total_documents": count,
                 "collection_name": self.collection_name,
                 "embedding_model": self.embedding_model,
-                "persist_directory": self.persist_directory
+                "persist_directory": self.persist_directory,
             }
         except Exception as e:
             logger.error(f"Failed to get stats: {e}")
@@ -254,7 +493,7 @@ Provide a comprehensive answer based on the context above. If the context doesn'
 
     def delete_by_url(self, url: str) -> bool:
         """Delete a document by URL"""
-        doc_id = f"doc_{hash(url)}"
+        doc_id = self._doc_id(url)
         try:
             self.collection.delete(ids=[doc_id])
             logger.info(f"Deleted document: {url}")
@@ -268,12 +507,13 @@ Provide a comprehensive answer based on the context above. If the context doesn'
         try:
             # Delete and recreate collection
             self.client.delete_collection(name=self.collection_name)
-            self.collection = self.client.create_collection(
-                name=self.collection_name,
-                embedding_function=self.embedding_function
-            )
+            self.collection = self._create_collection()
             logger.info("Cleared all documents from collection")
             return True
         except Exception as e:
             logger.error(f"Failed to clear collection: {e}")
             return False
+
+    def _doc_id(self, url: str) -> str:
+        """Stable document ID for a URL (the same across processes)"""
+        return f"doc_{hashlib.sha1(url.encode('utf-8')).hexdigest()}"
@@ -0,0 +1,51 @@
+"""
+Rate limiting for outbound provider calls
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """Thread-safe token bucket that caps calls per second to an upstream"""
+
+    def __init__(self, requests_per_second: float, burst: Optional[int] = None):
+        """
+        Initialize the rate limiter
+
+        Args:
+            requests_per_second: Sustained rate at which tokens refill
+            burst: Maximum tokens available at once (defaults to one second's worth)
+        """
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+
+        self.rate = requests_per_second
+        self.burst = burst or max(1, int(requests_per_second))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self) -> float:
+        """Take a token if one is available, otherwise return seconds to wait"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        """Block until a call is allowed"""
+        while (wait := self._take()) > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a call is allowed"""
+        while (wait := self._take()) > 0:
+            await asyncio.sleep(wait)
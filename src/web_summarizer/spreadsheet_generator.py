@@ -3,19 +3,256 @@ Spreadsheet generation for social media content
 """
 
 import csv
+import functools
+import io
 import logging
-from datetime import datetime
+import math
+import re
+import zipfile
+from datetime import datetime, timedelta
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Optional
-import io
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+from xml.sax.saxutils import escape
 
 logger = logging.getLogger(__name__)
 
+# Control characters XML 1.0 cannot carry (same set openpyxl rejects)
+_ILLEGAL_XML_RE = re.compile(r"[\000-\010\013\014\016-\037]")
+
+# Style ids in _XLSX_STYLES cellXfs
+_XLSX_PLAIN, _XLSX_HEADER, _XLSX_WRAP, _XLSX_BOLD, _XLSX_DATE = range(5)
+
+# Day zero of Excel's serial dates (1900 date system, past the leap-year bug)
+_XLSX_EPOCH = datetime(1899, 12, 30)
+
+# Rows per chunk, and flowables kept queued, when building PDFs
+_PDF_BATCH_SIZE = 50
+
+# Paragraph markup escapes (quotes too, for href attributes); posts also keep line breaks
+_PDF_MARKUP = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "'": "&#39;", '"': "&quot;"})
+_PDF_POST_MARKUP = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\n": "<br/>"})
+
+# Characters of row XML to buffer before writing to the zip stream
+_XLSX_FLUSH_SIZE = 256 * 1024
+
+_XLSX_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_XLSX_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_XLSX_XML_DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+_XLSX_STYLES = (
+    _XLSX_XML_DECL + f'<styleSheet xmlns="{_XLSX_MAIN_NS}">'
+    '<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy-mm-dd h:mm:ss"/></numFmts>'
+    '<fonts count="3">'
+    '<font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><color rgb="FFFFFFFF"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font>'
+    "</fonts>"
+    '<fills count="3">'
+    '<fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="FF4472C4"/><bgColor rgb="FF4472C4"/></patternFill></fill>'
+    "</fills>"
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="5">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="2" borderId="0" xfId="0" applyFont="1" applyFill="1" applyAlignment="1">'
+    '<alignment horizontal="center" vertical="center"/></xf>'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" applyAlignment="1">'
+    '<alignment vertical="top" wrapText="1"/></xf>'
+    '<xf numFmtId="0" fontId="2" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    "</cellXfs>"
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    "</styleSheet>"
+)
+
+# Fixed package parts; worksheets are written separately
+_XLSX_PARTS = {
+    "[Content_Types].xml": (
+        _XLSX_XML_DECL
+        + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet2.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        _XLSX_XML_DECL
+        + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        f'<Relationship Id="rId1" Type="{_XLSX_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/workbook.xml": (
+        _XLSX_XML_DECL + f'<workbook xmlns="{_XLSX_MAIN_NS}" xmlns:r="{_XLSX_REL_NS}"><sheets>'
+        '<sheet name="Social Media Content" sheetId="1" r:id="rId1"/>'
+        '<sheet name="Metadata" sheetId="2" r:id="rId2"/>'
+        "</sheets></workbook>"
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        _XLSX_XML_DECL
+        + '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        f'<Relationship Id="rId1" Type="{_XLSX_REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>'
+        f'<Relationship Id="rId2" Type="{_XLSX_REL_NS}/worksheet" Target="worksheets/sheet2.xml"/>'
+        f'<Relationship Id="rId3" Type="{_XLSX_REL_NS}/styles" Target="styles.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/styles.xml": _XLSX_STYLES,
+}
+
+_XLSX_SHEET_START = (
+    _XLSX_XML_DECL + f'<worksheet xmlns="{_XLSX_MAIN_NS}" xmlns:r="{_XLSX_REL_NS}">'
+    '{views}<sheetFormatPr defaultRowHeight="15"/><cols>{cols}</cols><sheetData>'
+)
+_XLSX_SHEET_END = "</sheetData></worksheet>"
+_XLSX_FROZEN_HEADER = (
+    '<sheetViews><sheetView workbookViewId="0">'
+    '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+    '<selection pane="bottomLeft" activeCell="A2" sqref="A2"/>'
+    "</sheetView></sheetViews>"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _openpyxl_styles() -> Dict[str, Any]:
+    """Build the openpyxl style objects once; openpyxl is imported on first use"""
+    try:
+        from openpyxl.styles import Alignment, Font, PatternFill
+    except ImportError:
+        raise ImportError(
+            "openpyxl is required for Excel export. Install with: pip install openpyxl"
+        )
+
+    return {
+        "header_fill": PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid"),
+        "header_font": Font(color="FFFFFF", bold=True),
+        "header_alignment": Alignment(horizontal="center", vertical="center"),
+        "post_alignment": Alignment(wrap_text=True, vertical="top"),
+        "label_font": Font(bold=True),
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _pdf_styles() -> Dict[str, Any]:
+    """Build the report's ParagraphStyles once; reportlab is imported on first use"""
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+    styles = getSampleStyleSheet()
+
+    return {
+        "title": ParagraphStyle(
+            "CustomTitle",
+            parent=styles["Heading1"],
+            fontSize=24,
+            textColor=colors.HexColor("#1a73e8"),
+            spaceAfter=30,
+            alignment=TA_CENTER,
+        ),
+        "heading": ParagraphStyle(
+            "CustomHeading",
+            parent=styles["Heading2"],
+            fontSize=16,
+            textColor=colors.HexColor("#1a73e8"),
+            spaceAfter=12,
+            spaceBefore=12,
+        ),
+        "subheading": ParagraphStyle(
+            "CustomSubHeading",
+            parent=styles["Heading3"],
+            fontSize=14,
+            textColor=colors.HexColor("#333333"),
+            spaceAfter=10,
+        ),
+        "body": ParagraphStyle(
+            "CustomBody",
+            parent=styles["BodyText"],
+            fontSize=11,
+            leading=14,
+            alignment=TA_JUSTIFY,
+        ),
+    }
+
+
+def _pdf_text(value: Any) -> str:
+    """Escape a value for use inside reportlab Paragraph markup"""
+    return str(value).translate(_PDF_MARKUP)
+
+
+@functools.lru_cache(maxsize=256)
+def _column_letter(idx: int) -> str:
+    """Spreadsheet column letter for a 1-based column index (memoized)"""
+    letters = ""
+    while idx:
+        idx, rem = divmod(idx - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def _xml_safe(value: Any) -> Any:
+    """Drop control characters XML cannot carry from a string; other values pass through"""
+    if type(value) is str and _ILLEGAL_XML_RE.search(value):
+        return _ILLEGAL_XML_RE.sub("", value)
+    return value
+
+
+def _xlsx_bytes(parts: List[str]) -> bytes:
+    """Join rendered XML and drop control characters XML cannot carry"""
+    xml = "".join(parts)
+    if _ILLEGAL_XML_RE.search(xml):
+        xml = _ILLEGAL_XML_RE.sub("", xml)
+    return xml.encode("utf-8")
+
+
+def _xlsx_specs(refs: List[str], styles: List[int]) -> List[Tuple[str, str, str]]:
+    """Per-column (ref, number tail, string tail) so cells only format value and row number"""
+    return [
+        (ref, f'" s="{style}"><v>', f'" s="{style}" t="inlineStr"><is><t xml:space="preserve">')
+        for ref, style in zip(refs, styles)
+    ]
+
+
+def _xlsx_row(row_num: int, specs: List[Tuple[str, str, str]], values: List[Any]) -> str:
+    """Render one <row> of inline-string, numeric and date cells, skipping empty values"""
+    row = str(row_num)
+    cells = []
+    for (ref, num_tail, str_tail), value in zip(specs, values):
+        if value is None or value == "":
+            continue
+        kind = type(value)
+        if kind is int or (kind is float and math.isfinite(value)):
+            cells.append(f'<c r="{ref}{row}{num_tail}{value!r}</v></c>')
+            continue
+        if kind is datetime and value.tzinfo is None:
+            # Serial day number, shown like openpyxl's default datetime format
+            serial = (value - _XLSX_EPOCH) / timedelta(days=1)
+            cells.append(f'<c r="{ref}{row}" s="{_XLSX_DATE}"><v>{serial!r}</v></c>')
+            continue
+        if kind is not str:
+            # Only reached for rows after the first chunk; store as text
+            value = value.isoformat() if hasattr(value, "isoformat") else str(value)
+        cells.append(f'<c r="{ref}{row}{str_tail}{escape(value)}</t></is></c>')
+    return f'<row r="{row}">{"".join(cells)}</row>'
+
 
 class SpreadsheetGenerator:
     """Generate spreadsheets from aggregated topic data"""
 
-    def __init__(self):
+    # Excel column widths by field name, then by field-name marker (first match wins)
+    _COL_WIDTHS = {"source_url": 50, "title": 40, "summary": 40, "key_points": 60}
+    _MARKER_WIDTHS = (("_post", 70), ("_hashtags", 30), ("_chars", 12))
+    _DEFAULT_WIDTH = 15
+
+    def __init__(self) -> None:
         pass
 
     def generate_csv(
@@ -23,23 +260,123 @@ class SpreadsheetGenerator:
         aggregated_data: Dict,
         output_path: Optional[str] = None,
         include_metadata: bool = True,
+        chunk_size: int = 10_000,
     ) -> str:
         """
         Generate CSV spreadsheet from aggregated data
 
         Args:
-            aggregated_data: Data from TopicAggregator
+            aggregated_data: Data from TopicAggregator; "data" may be any iterable of rows
             output_path: Path to save CSV (if None, returns CSV string)
             include_metadata: Include processing metadata columns
+            chunk_size: Rows to pull from "data" per writerows call
 
         Returns:
             CSV content as string or path to saved file
         """
-        if not aggregated_data["data"]:
+        columns = self._csv_columns(aggregated_data, include_metadata)
+        chunks = self._row_chunks(aggregated_data["data"], chunk_size)
+
+        # Save to file if path provided, writing straight into the file
+        if output_path:
+            output_path = self._ensure_path(output_path)
+            with open(output_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+                self._write_csv(f, columns, chunks)
+            logger.info(f"CSV saved to {output_path}")
+            return output_path
+
+        output = io.StringIO()
+        self._write_csv(output, columns, chunks)
+        return output.getvalue()
+
+    @staticmethod
+    def _write_csv(stream: TextIO, columns: List[str], chunks: Iterable[List[Dict]]) -> None:
+        """Write header and rows, one writerows call per chunk"""
+        writer = csv.writer(stream)
+        writer.writerow(columns)
+        for chunk in chunks:
+            # Project rows positionally; missing fields are None, written as empty
+            writer.writerows([list(map(row.get, columns)) for row in chunk])
+
+    @staticmethod
+    def _row_chunks(rows: Iterable[Dict], chunk_size: int) -> Iterator[List[Dict]]:
+        """
+        Split rows into lists of at most chunk_size, so only one chunk is held at a time
+
+        Args:
+            rows: List or iterator of row dicts
+            chunk_size: Maximum rows per chunk
+
+        Returns:
+            Iterator of row lists
+
+        Raises:
+            ValueError: If there are no rows (raised immediately, not on iteration)
+        """
+        it = iter(rows)
+        first = list(islice(it, chunk_size))
+        if not first:
             raise ValueError("No data to export")
 
-        # Determine columns based on first row and platforms
-        first_row = aggregated_data["data"][0]
+        def rest() -> Iterator[List[Dict]]:
+            while True:
+                chunk = list(islice(it, chunk_size))
+                if not chunk:
+                    return
+                yield chunk
+
+        return chain([first], rest())
+
+    def iter_csv(
+        self,
+        aggregated_data: Dict,
+        include_metadata: bool = True,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[bytes]:
+        """
+        Stream CSV rows from aggregated data without building the whole file
+
+        Rows are coalesced into chunks of roughly chunk_size characters, so
+        consumers that pay per step (Starlette drains sync iterators one
+        threadpool hop at a time) are not charged per row.
+
+        Args:
+            aggregated_data: Data from TopicAggregator; "data" may be any iterable of rows
+            include_metadata: Include processing metadata columns
+            chunk_size: Characters to accumulate before yielding a chunk
+
+        Returns:
+            Iterator of UTF-8 encoded CSV chunks, header first
+
+        Raises:
+            ValueError: If there is no data (raised immediately, not on iteration)
+        """
+        columns = self._csv_columns(aggregated_data, include_metadata)
+        chunks = self._row_chunks(aggregated_data["data"], 10_000)
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        def drain() -> bytes:
+            # Hand off what the writer produced and reuse the buffer
+            chunk = buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            return chunk
+
+        def rows() -> Iterator[bytes]:
+            writer.writerow(columns)
+            for row in chain.from_iterable(chunks):
+                writer.writerow(list(map(row.get, columns)))
+                if buffer.tell() >= chunk_size:
+                    yield drain()
+            if buffer.tell():
+                yield drain()
+
+        return rows()
+
+    def _csv_columns(self, aggregated_data: Dict, include_metadata: bool) -> List[str]:
+        """Determine CSV columns from platforms and metadata settings"""
         platforms = aggregated_data.get("platforms", ["twitter", "linkedin", "facebook"])
 
         # Base columns
@@ -53,84 +390,73 @@ class SpreadsheetGenerator:
 
         # Add platform-specific columns
         for platform in platforms:
-            columns.extend([
-                f"{platform}_post",
-                f"{platform}_hashtags",
-                f"{platform}_chars",
-            ])
+            columns.extend(
+                [
+                    f"{platform}_post",
+                    f"{platform}_hashtags",
+                    f"{platform}_chars",
+                ]
+            )
 
         # Add metadata columns if requested
         if include_metadata:
-            columns.extend([
-                "word_count",
-                "tokens_used",
-                "processing_time_ms",
-                "timestamp",
-            ])
-
-        # Generate CSV
-        output = io.StringIO()
-        writer = csv.DictWriter(output, fieldnames=columns, extrasaction="ignore")
-
-        # Write header
-        writer.writeheader()
-
-        # Write data rows
-        for row in aggregated_data["data"]:
-            writer.writerow(row)
-
-        csv_content = output.getvalue()
-        output.close()
-
-        # Save to file if path provided
-        if output_path:
-            output_path = self._ensure_path(output_path)
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
-                f.write(csv_content)
-            logger.info(f"CSV saved to {output_path}")
-            return output_path
+            columns.extend(
+                [
+                    "word_count",
+                    "tokens_used",
+                    "processing_time_ms",
+                    "timestamp",
+                ]
+            )
 
-        return csv_content
+        return columns
 
     def generate_excel(
         self,
         aggregated_data: Dict,
-        output_path: str,
+        output_path: Union[str, BinaryIO],
         include_metadata: bool = True,
-    ) -> str:
+        chunk_size: int = 10_000,
+    ) -> Union[str, BinaryIO]:
         """
         Generate Excel spreadsheet with formatting
 
+        Plain string/number/datetime data is written as raw worksheet XML; anything
+        else goes through openpyxl. The choice is made on the first chunk of
+        rows; later values the raw writer cannot store natively are written
+        as text. Either way, control characters XML cannot carry are dropped.
+
         Args:
-            aggregated_data: Data from TopicAggregator
-            output_path: Path to save Excel file
+            aggregated_data: Data from TopicAggregator; "data" may be any iterable of rows
+            output_path: Path to save Excel file, or a binary file-like object to write into
             include_metadata: Include processing metadata
+            chunk_size: Rows to pull from "data" at a time
 
         Returns:
-            Path to saved file
+            Path to saved file, or the file-like object it was written to
         """
-        try:
-            import openpyxl
-            from openpyxl.styles import Font, PatternFill, Alignment
-            from openpyxl.utils import get_column_letter
-        except ImportError:
-            raise ImportError(
-                "openpyxl is required for Excel export. Install with: pip install openpyxl"
-            )
+        chunks = self._row_chunks(aggregated_data["data"], chunk_size)
+        first = next(chunks)
+        chunks = chain([first], chunks)
 
-        if not aggregated_data["data"]:
-            raise ValueError("No data to export")
+        platforms = aggregated_data.get("platforms", ["twitter", "linkedin", "facebook"])
+        columns = self._excel_columns(platforms, include_metadata)
+        metadata = self._excel_metadata(aggregated_data, platforms)
 
-        # Create workbook
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Social Media Content"
+        target = output_path if not isinstance(output_path, str) else self._ensure_path(output_path)
 
-        # Add metadata sheet
-        metadata_sheet = wb.create_sheet("Metadata")
+        if self._is_plain(first, columns, metadata):
+            self._generate_xlsx_fast(chunks, target, columns, metadata)
+        else:
+            self._generate_xlsx_openpyxl(chunks, target, columns, metadata)
 
-        platforms = aggregated_data.get("platforms", ["twitter", "linkedin", "facebook"])
+        if isinstance(target, str):
+            logger.info(f"Excel file saved to {target}")
+
+        return target
 
+    def _excel_columns(self, platforms: List[str], include_metadata: bool) -> List[Tuple[str, str]]:
+        """Determine Excel (field, header) columns from platforms and metadata settings"""
         # Define columns
         columns = [
             ("source_url", "Source URL"),
@@ -143,90 +469,202 @@ class SpreadsheetGenerator:
         # Add platform columns
         for platform in platforms:
             platform_name = platform.capitalize()
-            columns.extend([
-                (f"{platform}_post", f"{platform_name} Post"),
-                (f"{platform}_hashtags", f"{platform_name} Hashtags"),
-                (f"{platform}_chars", f"{platform_name} Char Count"),
-            ])
+            columns.extend(
+                [
+                    (f"{platform}_post", f"{platform_name} Post"),
+                    (f"{platform}_hashtags", f"{platform_name} Hashtags"),
+                    (f"{platform}_chars", f"{platform_name} Char Count"),
+                ]
+            )
 
         # Add metadata columns
         if include_metadata:
-            columns.extend([
-                ("word_count", "Word Count"),
-                ("tokens_used", "Tokens Used"),
-                ("processing_time_ms", "Processing Time (ms)"),
-                ("timestamp", "Timestamp"),
-            ])
+            columns.extend(
+                [
+                    ("word_count", "Word Count"),
+                    ("tokens_used", "Tokens Used"),
+                    ("processing_time_ms", "Processing Time (ms)"),
+                    ("timestamp", "Timestamp"),
+                ]
+            )
 
-        # Write headers
-        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True)
+        return columns
+
+    def _excel_metadata(self, aggregated_data: Dict, platforms: List[str]) -> List[Tuple[str, Any]]:
+        """Label/value rows for the Metadata sheet"""
+        return [
+            ("Topic", aggregated_data["topic"]),
+            ("Total Sources", aggregated_data["total_sources"]),
+            ("Successful Summaries", aggregated_data["successful_summaries"]),
+            ("Failed Summaries", aggregated_data["failed_summaries"]),
+            ("Generated At", aggregated_data["generated_at"]),
+            ("Platforms", ", ".join(platforms)),
+        ]
 
-        for col_idx, (field, header) in enumerate(columns, 1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal="center", vertical="center")
-
-        # Write data
-        for row_idx, row_data in enumerate(aggregated_data["data"], 2):
-            for col_idx, (field, _) in enumerate(columns, 1):
-                value = row_data.get(field, "")
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-
-                # Special formatting for social media posts
-                if "_post" in field:
-                    cell.alignment = Alignment(wrap_text=True, vertical="top")
-
-        # Auto-adjust column widths
-        for col_idx, (field, _) in enumerate(columns, 1):
-            col_letter = get_column_letter(col_idx)
-
-            # Set specific widths for different column types
-            if field == "source_url":
-                ws.column_dimensions[col_letter].width = 50
-            elif field in ["title", "summary"]:
-                ws.column_dimensions[col_letter].width = 40
-            elif field == "key_points":
-                ws.column_dimensions[col_letter].width = 60
-            elif "_post" in field:
-                ws.column_dimensions[col_letter].width = 70
-            elif "_hashtags" in field:
-                ws.column_dimensions[col_letter].width = 30
-            elif "_chars" in field:
-                ws.column_dimensions[col_letter].width = 12
-            else:
-                ws.column_dimensions[col_letter].width = 15
+    @classmethod
+    def _column_width(cls, field: str) -> int:
+        """Display width for a column by field type"""
+        width = cls._COL_WIDTHS.get(field)
+        if width is None:
+            width = next(
+                (w for marker, w in cls._MARKER_WIDTHS if marker in field), cls._DEFAULT_WIDTH
+            )
+        return width
+
+    @staticmethod
+    def _is_plain(
+        rows: List[Dict], columns: List[Tuple[str, str]], metadata: List[Tuple[str, Any]]
+    ) -> bool:
+        """Check every cell is a string, finite number, naive datetime or empty (raw-writer safe)"""
+        # Control characters are stripped by both writers, so they don't decide the writer
+        values = [value for _, value in metadata]
+        values.extend(header for _, header in columns)
+        fields = [field for field, _ in columns]
+        for row in rows:
+            values.extend(row.get(field) for field in fields)
+
+        for value in values:
+            kind = type(value)
+            if kind is str:
+                continue
+            if kind is datetime:
+                if value.tzinfo is not None:
+                    return False
+            elif kind is float:
+                if not math.isfinite(value):
+                    return False
+            elif value is not None and kind is not int:
+                return False
+        return True
+
+    def _generate_xlsx_fast(
+        self,
+        chunks: Iterable[List[Dict]],
+        output_path: Union[str, BinaryIO],
+        columns: List[Tuple[str, str]],
+        metadata: List[Tuple[str, Any]],
+    ) -> None:
+        """
+        Write the workbook as raw SpreadsheetML, one row at a time
+
+        Cells are emitted as inline strings, numbers or serial dates with fixed
+        style ids, skipping openpyxl's per-cell objects and style bookkeeping.
+
+        Args:
+            chunks: Row lists; values should be plain (others are written as text)
+            output_path: Path or binary file-like object to write into
+            columns: (field, header) pairs for the content sheet
+            metadata: (label, value) rows for the Metadata sheet
+        """
+        fields = [field for field, _ in columns]
+        refs = [_column_letter(idx) for idx in range(1, len(columns) + 1)]
+        specs = _xlsx_specs(
+            refs, [_XLSX_WRAP if "_post" in field else _XLSX_PLAIN for field in fields]
+        )
+        header_specs = _xlsx_specs(refs, [_XLSX_HEADER] * len(refs))
+        cols = "".join(
+            f'<col min="{idx}" max="{idx}" width="{self._column_width(field)}" customWidth="1"/>'
+            for idx, field in enumerate(fields, 1)
+        )
+
+        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for name, content in _XLSX_PARTS.items():
+                zf.writestr(name, content)
+
+            with zf.open("xl/worksheets/sheet1.xml", "w") as sheet:
+                sheet.write(
+                    _XLSX_SHEET_START.format(views=_XLSX_FROZEN_HEADER, cols=cols).encode("utf-8")
+                )
+
+                parts = [_xlsx_row(1, header_specs, [header for _, header in columns])]
+                size = 0
+                for row_num, row_data in enumerate(chain.from_iterable(chunks), 2):
+                    row = _xlsx_row(row_num, specs, list(map(row_data.get, fields)))
+                    parts.append(row)
+                    size += len(row)
+                    if size >= _XLSX_FLUSH_SIZE:
+                        sheet.write(_xlsx_bytes(parts))
+                        parts.clear()
+                        size = 0
+                parts.append(_XLSX_SHEET_END)
+                sheet.write(_xlsx_bytes(parts))
+
+            meta_cols = (
+                '<col min="1" max="1" width="20" customWidth="1"/>'
+                '<col min="2" max="2" width="40" customWidth="1"/>'
+            )
+            meta_specs = _xlsx_specs(["A", "B"], [_XLSX_BOLD, _XLSX_PLAIN])
+            meta_rows = "".join(
+                _xlsx_row(row_num, meta_specs, [label, value])
+                for row_num, (label, value) in enumerate(metadata, 1)
+            )
+            zf.writestr(
+                "xl/worksheets/sheet2.xml",
+                _xlsx_bytes(
+                    [_XLSX_SHEET_START.format(views="", cols=meta_cols), meta_rows, _XLSX_SHEET_END]
+                ),
+            )
+
+    def _generate_xlsx_openpyxl(
+        self,
+        chunks: Iterable[List[Dict]],
+        output_path: Union[str, BinaryIO],
+        columns: List[Tuple[str, str]],
+        metadata: List[Tuple[str, Any]],
+    ) -> None:
+        """Write the workbook through openpyxl (fallback for non-plain values)"""
+        styles = _openpyxl_styles()
+
+        import openpyxl
+        from openpyxl.cell import WriteOnlyCell
+
+        # Write-only workbook: rows stream to XML instead of building a cell tree
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Social Media Content")
+
+        # Add metadata sheet
+        metadata_sheet = wb.create_sheet("Metadata")
 
         # Add freeze panes (freeze first row)
         ws.freeze_panes = "A2"
 
+        # Set column widths and build header cells in one pass; both precede the first row
+        header_cells = []
+        for col_idx, (field, header) in enumerate(columns, 1):
+            ws.column_dimensions[_column_letter(col_idx)].width = self._column_width(field)
+            cell = WriteOnlyCell(ws, value=_xml_safe(header))
+            cell.fill = styles["header_fill"]
+            cell.font = styles["header_font"]
+            cell.alignment = styles["header_alignment"]
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        # Write data; only social media posts need a styled cell (wrapped text)
+        fields = [field for field, _ in columns]
+        post_alignment = styles["post_alignment"]
+        post_columns = {idx for idx, field in enumerate(fields) if "_post" in field}
+
+        for chunk in chunks:
+            for row_data in chunk:
+                # openpyxl raises IllegalCharacterError on these; strip them like the raw writer
+                values = [_xml_safe(value) for value in map(row_data.get, fields)]
+                for idx in post_columns:
+                    cell = WriteOnlyCell(ws, value=values[idx])
+                    cell.alignment = post_alignment
+                    values[idx] = cell
+                ws.append(values)
+
         # Add metadata to metadata sheet
-        metadata_sheet["A1"] = "Topic"
-        metadata_sheet["B1"] = aggregated_data["topic"]
-        metadata_sheet["A2"] = "Total Sources"
-        metadata_sheet["B2"] = aggregated_data["total_sources"]
-        metadata_sheet["A3"] = "Successful Summaries"
-        metadata_sheet["B3"] = aggregated_data["successful_summaries"]
-        metadata_sheet["A4"] = "Failed Summaries"
-        metadata_sheet["B4"] = aggregated_data["failed_summaries"]
-        metadata_sheet["A5"] = "Generated At"
-        metadata_sheet["B5"] = aggregated_data["generated_at"]
-        metadata_sheet["A6"] = "Platforms"
-        metadata_sheet["B6"] = ", ".join(platforms)
-
-        # Style metadata sheet
-        for row in range(1, 7):
-            metadata_sheet[f"A{row}"].font = Font(bold=True)
-            metadata_sheet.column_dimensions["A"].width = 20
-            metadata_sheet.column_dimensions["B"].width = 40
-
-        # Save workbook
-        output_path = self._ensure_path(output_path)
-        wb.save(output_path)
-        logger.info(f"Excel file saved to {output_path}")
+        metadata_sheet.column_dimensions["A"].width = 20
+        metadata_sheet.column_dimensions["B"].width = 40
+        label_font = styles["label_font"]
 
-        return output_path
+        for label, value in metadata:
+            label_cell = WriteOnlyCell(metadata_sheet, value=_xml_safe(label))
+            label_cell.font = label_font
+            metadata_sheet.append([label_cell, _xml_safe(value)])
+
+        wb.save(output_path)
 
     def _ensure_path(self, path: str) -> str:
         """Ensure output directory exists and return full path"""
@@ -237,138 +675,146 @@ class SpreadsheetGenerator:
     def generate_pdf(
         self,
         aggregated_data: Dict,
-        output_path: str,
+        output_path: Union[str, BinaryIO],
         include_metadata: bool = True,
-    ) -> str:
+    ) -> Union[str, BinaryIO]:
         """
         Generate PDF report with formatting
 
+        Article flowables are generated lazily and fed to the layout engine
+        in batches, so only a batch of Paragraphs is alive at a time.
+
         Args:
-            aggregated_data: Data from TopicAggregator
-            output_path: Path to save PDF file
+            aggregated_data: Data from TopicAggregator; "data" may be any iterable of rows
+            output_path: Path to save PDF file, or a binary file-like object to write into
             include_metadata: Include processing metadata
 
         Returns:
-            Path to saved file
+            Path to saved file, or the file-like object it was written to
         """
         try:
-            from reportlab.lib.pagesizes import letter, A4
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+            from reportlab.lib.pagesizes import letter
             from reportlab.lib.units import inch
-            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
-            from reportlab.lib import colors
-            from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
+            from reportlab.platypus import PageBreak, Paragraph, SimpleDocTemplate, Spacer
         except ImportError:
             raise ImportError(
                 "reportlab is required for PDF export. Install with: pip install reportlab"
             )
 
-        if not aggregated_data["data"]:
-            raise ValueError("No data to export")
+        rows = chain.from_iterable(self._row_chunks(aggregated_data["data"], _PDF_BATCH_SIZE))
+
+        if isinstance(output_path, str):
+            output_path = self._ensure_path(output_path)
+
+        class StreamingDocTemplate(SimpleDocTemplate):
+            """Top up the pending flowables from a generator as layout consumes them"""
+
+            source: Iterator = iter(())
+
+            def build(self, flowables: List[Any], *args: Any, **kwargs: Any) -> None:
+                self._pending = flowables
+                super().build(flowables, *args, **kwargs)
 
-        output_path = self._ensure_path(output_path)
+            def handle_flowable(self, flowables: List[Any]) -> None:
+                super().handle_flowable(flowables)
+                # Also called for internal lists (hanging page-begin actions); only top up the story
+                if flowables is self._pending and len(flowables) < _PDF_BATCH_SIZE:
+                    flowables.extend(islice(self.source, _PDF_BATCH_SIZE))
 
         # Create PDF document
-        doc = SimpleDocTemplate(
+        doc = StreamingDocTemplate(
             output_path,
             pagesize=letter,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=1*inch,
-            bottomMargin=0.75*inch,
+            rightMargin=0.75 * inch,
+            leftMargin=0.75 * inch,
+            topMargin=1 * inch,
+            bottomMargin=0.75 * inch,
         )
 
         # Build story (content)
         story = []
-        styles = getSampleStyleSheet()
+        styles = _pdf_styles()
+        title_style = styles["title"]
+        heading_style = styles["heading"]
+        subheading_style = styles["subheading"]
+        body_style = styles["body"]
 
-        # Custom styles
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1a73e8'),
-            spaceAfter=30,
-            alignment=TA_CENTER,
+        # Title
+        story.append(
+            Paragraph(f"Research Report: {_pdf_text(aggregated_data['topic'])}", title_style)
         )
+        story.append(Spacer(1, 0.3 * inch))
 
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#1a73e8'),
-            spaceAfter=12,
-            spaceBefore=12,
+        # Metadata
+        story.append(
+            Paragraph(f"<b>Generated:</b> {_pdf_text(aggregated_data['generated_at'])}", body_style)
         )
-
-        subheading_style = ParagraphStyle(
-            'CustomSubHeading',
-            parent=styles['Heading3'],
-            fontSize=14,
-            textColor=colors.HexColor('#333333'),
-            spaceAfter=10,
+        story.append(
+            Paragraph(f"<b>Total Sources:</b> {aggregated_data['total_sources']}", body_style)
         )
-
-        body_style = ParagraphStyle(
-            'CustomBody',
-            parent=styles['BodyText'],
-            fontSize=11,
-            leading=14,
-            alignment=TA_JUSTIFY,
+        story.append(
+            Paragraph(
+                f"<b>Successful Summaries:</b> {aggregated_data['successful_summaries']}",
+                body_style,
+            )
         )
-
-        # Title
-        story.append(Paragraph(f"Research Report: {aggregated_data['topic']}", title_style))
-        story.append(Spacer(1, 0.3*inch))
-
-        # Metadata
-        story.append(Paragraph(f"<b>Generated:</b> {aggregated_data['generated_at']}", body_style))
-        story.append(Paragraph(f"<b>Total Sources:</b> {aggregated_data['total_sources']}", body_style))
-        story.append(Paragraph(f"<b>Successful Summaries:</b> {aggregated_data['successful_summaries']}", body_style))
-        story.append(Paragraph(f"<b>Platforms:</b> {', '.join(aggregated_data.get('platforms', []))}", body_style))
-        story.append(Spacer(1, 0.3*inch))
+        story.append(
+            Paragraph(
+                f"<b>Platforms:</b> {_pdf_text(', '.join(aggregated_data.get('platforms', [])))}",
+                body_style,
+            )
+        )
+        story.append(Spacer(1, 0.3 * inch))
 
         # Master Summary
-        if aggregated_data.get('master_summary'):
+        if aggregated_data.get("master_summary"):
             story.append(Paragraph("Master Summary", heading_style))
-            story.append(Paragraph(aggregated_data['master_summary'], body_style))
-            story.append(Spacer(1, 0.2*inch))
+            story.append(Paragraph(_pdf_text(aggregated_data["master_summary"]), body_style))
+            story.append(Spacer(1, 0.2 * inch))
 
         # Social Media Posts
-        if aggregated_data.get('social_media_posts'):
+        if aggregated_data.get("social_media_posts"):
             story.append(Paragraph("Social Media Posts (Ready to Publish)", heading_style))
-            story.append(Spacer(1, 0.1*inch))
+            story.append(Spacer(1, 0.1 * inch))
 
-            for platform, post_content in aggregated_data['social_media_posts'].items():
-                story.append(Paragraph(f"<b>{platform.upper()}</b>", subheading_style))
-                # Replace newlines with <br/> tags for PDF
-                formatted_post = post_content.replace('\n', '<br/>')
-                story.append(Paragraph(formatted_post, body_style))
+            for platform, post_content in aggregated_data["social_media_posts"].items():
+                story.append(Paragraph(f"<b>{_pdf_text(platform.upper())}</b>", subheading_style))
+                # Escape markup and turn newlines into <br/> tags in one pass
+                story.append(Paragraph(post_content.translate(_PDF_POST_MARKUP), body_style))
                 story.append(Paragraph(f"<i>{len(post_content)} characters</i>", body_style))
-                story.append(Spacer(1, 0.15*inch))
+                story.append(Spacer(1, 0.15 * inch))
 
         # Source Articles
         story.append(PageBreak())
-        story.append(Paragraph("Source Articles & Summaries", heading_style))
-        story.append(Spacer(1, 0.1*inch))
-
-        for idx, row in enumerate(aggregated_data['data'], 1):
-            story.append(Paragraph(f"<b>Article {idx}: {row['title']}</b>", subheading_style))
-            story.append(Paragraph(f"<i>Source:</i> <a href='{row['source_url']}'>{row['source_url']}</a>", body_style))
-            story.append(Spacer(1, 0.05*inch))
-            story.append(Paragraph(f"<b>Summary:</b>", body_style))
-            story.append(Paragraph(row['summary'], body_style))
-            story.append(Spacer(1, 0.05*inch))
-            story.append(Paragraph(f"<b>Key Points:</b> {row['key_points']}", body_style))
-            story.append(Spacer(1, 0.2*inch))
-
-            # Add page break every 2 articles to avoid cramming
-            if idx % 2 == 0 and idx < len(aggregated_data['data']):
-                story.append(PageBreak())
-
-        # Build PDF
+        story.append(Paragraph("Source Articles &amp; Summaries", heading_style))
+        story.append(Spacer(1, 0.1 * inch))
+
+        def article_flowables() -> Iterator:
+            for idx, row in enumerate(rows, 1):
+                # Add page break every 2 articles to avoid cramming
+                if idx > 1 and idx % 2 == 1:
+                    yield PageBreak()
+
+                source_url = _pdf_text(row["source_url"])
+                yield Paragraph(
+                    f"<b>Article {idx}: {_pdf_text(row['title'])}</b>", subheading_style
+                )
+                yield Paragraph(
+                    f"<i>Source:</i> <a href='{source_url}'>{source_url}</a>", body_style
+                )
+                yield Spacer(1, 0.05 * inch)
+                yield Paragraph("<b>Summary:</b>", body_style)
+                yield Paragraph(_pdf_text(row["summary"]), body_style)
+                yield Spacer(1, 0.05 * inch)
+                yield Paragraph(f"<b>Key Points:</b> {_pdf_text(row['key_points'])}", body_style)
+                yield Spacer(1, 0.2 * inch)
+
+        # Build PDF, pulling article flowables as the page layout needs them
+        doc.source = article_flowables()
+        story.extend(islice(doc.source, _PDF_BATCH_SIZE))
         doc.build(story)
-        logger.info(f"PDF saved to {output_path}")
+        if isinstance(output_path, str):
+            logger.info(f"PDF saved to {output_path}")
 
         return output_path
 
@@ -383,17 +829,12 @@ class SpreadsheetGenerator:
         Returns:
             Preview string
         """
-        if not aggregated_data["data"]:
+        rows = aggregated_data["data"]
+        if not rows:
             return "No data available"
 
-        preview_data = {
-            **aggregated_data,
-            "data": aggregated_data["data"][:max_rows],
-        }
-
-        csv_content = self.generate_csv(preview_data, output_path=None)
-
-        preview = f"Preview (showing {min(max_rows, len(aggregated_data['data']))} of {len(aggregated_data['data'])} rows):\n\n"
-        preview += csv_content
+        shown = rows[:max_rows]
+        output = io.StringIO()
+        self._write_csv(output, self._csv_columns(aggregated_data, include_metadata=True), [shown])
 
-        return preview
+        return f"Preview (showing {len(shown)} of {len(rows)} rows):\n\n{output.getvalue()}"
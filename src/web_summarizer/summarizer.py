@@ -2,36 +2,226 @@
 AI-powered summarization module using Google Gemini
 """
 
-import json
+import asyncio
+import functools
 import logging
 import os
-from typing import Dict, List, Optional
+from types import ModuleType
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, TypedDict, Union
 
-import google.generativeai as genai
-from google.generativeai.types import GenerationConfig
+import orjson
+
+from web_summarizer.rate_limit import RateLimiter
+
+if TYPE_CHECKING:
+    import google.generativeai as genai
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _genai() -> ModuleType:
+    """Import google.generativeai on first use; it takes ~0.5s to import"""
+    import google.generativeai as genai
+
+    return genai
+
+
+def __getattr__(name: str) -> ModuleType:
+    # Keep summarizer.genai reachable without importing it with this module
+    if name == "genai":
+        return _genai()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Default token budget for one document's text, and the rough size of a token
+DEFAULT_MAX_INPUT_TOKENS = 8000
+_CHARS_PER_TOKEN = 4
+
+
+def _fit_token_budget(text: str, max_input_tokens: Optional[int]) -> str:
+    """
+    Cut text to roughly max_input_tokens, at a word boundary where possible
+
+    Tokens are estimated from characters, so no tokenizer runs on the hot path.
+
+    Args:
+        text: Text to send to the model
+        max_input_tokens: Token budget (None leaves text unchanged)
+
+    Returns:
+        The text, truncated if it is over budget
+    """
+    if max_input_tokens is None:
+        return text
+
+    max_chars = max_input_tokens * _CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+
+    cut = text.rfind(" ", max(0, max_chars - 200), max_chars)
+    truncated = text[: cut if cut != -1 else max_chars]
+    logger.warning(
+        f"Text exceeds ~{max_input_tokens} tokens ({len(text)} chars), truncating to {len(truncated)} chars"
+    )
+    return truncated
+
+
+# Fixed opening of the single-document prompt
+_PROMPT_HEAD = (
+    "You are an expert content summarizer. Analyze the following web content "
+    "and provide a structured summary in JSON format.\n\n"
+)
+
+# Fixed opening of the multi-document prompt (before the <doc> envelopes)
+_BATCH_PROMPT_HEAD = (
+    "You are an expert content summarizer. Analyze each of the following {count} web documents "
+    "independently and provide a structured summary of each in JSON format.\n\n"
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _prompt_instructions(
+    max_summary_sentences: int, num_key_points: int, include_citations: bool
+) -> str:
+    """Render the text-independent tail of the single-document prompt once per option set"""
+    return f"""
+
+Provide a JSON response with this exact structure:
+{{
+  "summary": "A concise summary in {max_summary_sentences} sentences or less that captures the main message and purpose",
+  "key_points": ["point 1", "point 2", "point 3", "point 4", "point 5"],
+  "category": "The primary category or topic (e.g., Technology, Business, Health, Politics, etc.)"{', "citations": ["quote 1", "quote 2", "quote 3"]' if include_citations else ''}
+}}
+
+Requirements:
+- summary: {max_summary_sentences} sentences maximum
+- key_points: Exactly {num_key_points} key takeaways as an array of strings{f'''
+- citations: 2-3 notable verbatim quotes from the text''' if include_citations else ''}
+- category: Single word or short phrase
+
+Focus on the main message, key facts, conclusions, and actionable insights."""
+
+
+@functools.lru_cache(maxsize=64)
+def _batch_prompt_instructions(
+    max_summary_sentences: int, num_key_points: int, include_citations: bool
+) -> str:
+    """Render the document-independent tail of the multi-document prompt once per option set"""
+    return f"""
+
+Provide a JSON array with one object per document, using this exact structure:
+[
+  {{
+    "id": 0,
+    "summary": "A concise summary in {max_summary_sentences} sentences or less that captures the main message and purpose",
+    "key_points": ["point 1", "point 2", "point 3", "point 4", "point 5"],
+    "category": "The primary category or topic (e.g., Technology, Business, Health, Politics, etc.)"{', "citations": ["quote 1", "quote 2", "quote 3"]' if include_citations else ''}
+  }}
+]
+
+Requirements:
+- id: The id attribute of the <doc> being summarized; include every document exactly once
+- summary: {max_summary_sentences} sentences maximum, using only that document's content
+- key_points: Exactly {num_key_points} key takeaways as an array of strings{f'''
+- citations: 2-3 notable verbatim quotes from the document''' if include_citations else ''}
+- category: Single word or short phrase
+
+Focus on the main message, key facts, conclusions, and actionable insights."""
+
+
+def _balanced_object(text: str, start: int) -> Optional[str]:
+    """
+    Return the JSON object opening at text[start] in one linear pass
+
+    Braces inside string literals are ignored; string bodies are skipped with
+    str.find rather than character by character.
+
+    Args:
+        text: Text containing the object
+        start: Index of the opening brace
+
+    Returns:
+        The object's text, or None if it is never closed
+    """
+    depth = 0
+    idx = start
+    length = len(text)
+    while idx < length:
+        char = text[idx]
+        if char == '"':
+            # Jump to the closing quote, passing over escaped ones
+            end = text.find('"', idx + 1)
+            while end != -1 and _is_escaped(text, end):
+                end = text.find('"', end + 1)
+            if end == -1:
+                return None
+            idx = end
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start : idx + 1]
+        idx += 1
+    return None
+
+
+def _is_escaped(text: str, idx: int) -> bool:
+    """Check whether text[idx] is preceded by an odd number of backslashes"""
+    backslashes = 0
+    while idx - backslashes - 1 >= 0 and text[idx - backslashes - 1] == "\\":
+        backslashes += 1
+    return backslashes % 2 == 1
+
+
 class SummarizationError(Exception):
     """Exception raised when summarization fails"""
 
+    __slots__ = ("message", "error_code")
+
     def __init__(self, message: str, error_code: str):
         self.message = message
         self.error_code = error_code
         super().__init__(self.message)
 
+    def __reduce__(self) -> Tuple[type, Tuple[str, str]]:
+        # Slots are not in __dict__, so rebuild from both fields when pickled
+        return (self.__class__, (self.message, self.error_code))
+
+
+class SummarizerResult(TypedDict):
+    """Summary fields returned by AISummarizer (every key is always present)"""
+
+    summary: str
+    key_points: List[str]
+    citations: Optional[List[str]]
+    category: Optional[str]
+    tokens_used: int
+    model_used: str
+
 
 class AISummarizer:
     """AI-powered text summarization using Google Gemini"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, rate_limiter: Optional[RateLimiter] = None):
+        """
+        Initialize the summarizer
+
+        Args:
+            api_key: API key for Google Gemini (falls back to GEMINI_API_KEY)
+            rate_limiter: Optional limiter applied before every Gemini call
+        """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY must be set in environment or provided")
+        self.rate_limiter = rate_limiter
 
         # Configure Gemini
-        genai.configure(api_key=self.api_key)
+        _genai().configure(api_key=self.api_key)
+
+        # Model handles by name, built once and reused across calls
+        self._models: Dict[str, "genai.GenerativeModel"] = {}
 
     def summarize(
         self,
@@ -42,7 +232,9 @@ class AISummarizer:
         num_key_points: int = 5,
         include_citations: bool = False,
         timeout: int = 30,
-    ) -> Dict:
+        max_input_tokens: Optional[int] = DEFAULT_MAX_INPUT_TOKENS,
+        on_chunk: Optional[Callable[[str], None]] = None,
+    ) -> SummarizerResult:
         """
         Summarize text using AI
 
@@ -54,18 +246,17 @@ class AISummarizer:
             num_key_points: Number of key points to extract
             include_citations: Whether to include notable quotes
             timeout: Request timeout in seconds
+            max_input_tokens: Approximate token budget for the text; longer text is cut (None disables)
+            on_chunk: Optional callback that receives raw model output as it streams in
 
         Returns:
-            Dictionary with summary, key_points, citations, category, tokens_used
+            SummarizerResult with summary, key_points, citations, category, tokens_used
 
         Raises:
             SummarizationError: If summarization fails
         """
-        if not text or len(text.strip()) < 50:
-            raise SummarizationError(
-                "Text is too short to summarize",
-                error_code="TEXT_TOO_SHORT",
-            )
+        self._check_length(text)
+        text = _fit_token_budget(text, max_input_tokens)
 
         try:
             # Build the prompt
@@ -79,73 +270,348 @@ class AISummarizer:
 
             logger.info(f"Sending {len(text)} characters to {model} for summarization")
 
-            # Initialize Gemini model with JSON response format
-            gemini_model = genai.GenerativeModel(
-                model,
-                generation_config=GenerationConfig(
-                    temperature=0.3,
-                    max_output_tokens=2048,
-                    response_mime_type="application/json",
-                )
-            )
+            gemini_model = self._get_model(model)
 
             # Call Gemini API
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
             response = gemini_model.generate_content(
                 prompt,
+                stream=on_chunk is not None,
                 request_options={"timeout": timeout},
             )
 
             # Extract response content
-            content = response.text
+            if on_chunk is not None:
+                parts = []
+                for chunk in response:
+                    parts.append(chunk.text)
+                    on_chunk(chunk.text)
+                content = "".join(parts)
+            else:
+                content = response.text
+
+            return self._parse_response(content, response, model)
+
+        except Exception as e:
+            raise self._summarization_error(e, timeout)
+
+    async def summarize_async(
+        self,
+        text: str,
+        title: Optional[str] = None,
+        model: str = "models/gemini-2.5-flash",
+        max_summary_sentences: int = 4,
+        num_key_points: int = 5,
+        include_citations: bool = False,
+        timeout: int = 30,
+        max_input_tokens: Optional[int] = DEFAULT_MAX_INPUT_TOKENS,
+    ) -> SummarizerResult:
+        """
+        Summarize text using AI without blocking the event loop
+
+        Same as summarize(), but awaits Gemini's async client instead of
+        holding a thread for the round-trip.
+
+        Args:
+            text: The text to summarize
+            title: Optional document title
+            model: AI model to use
+            max_summary_sentences: Maximum sentences in summary
+            num_key_points: Number of key points to extract
+            include_citations: Whether to include notable quotes
+            timeout: Request timeout in seconds
+            max_input_tokens: Approximate token budget for the text; longer text is cut (None disables)
+
+        Returns:
+            SummarizerResult with summary, key_points, citations, category, tokens_used
+
+        Raises:
+            SummarizationError: If summarization fails
+        """
+        self._check_length(text)
+        text = _fit_token_budget(text, max_input_tokens)
+
+        try:
+            prompt = self._build_prompt(
+                text=text,
+                title=title,
+                max_summary_sentences=max_summary_sentences,
+                num_key_points=num_key_points,
+                include_citations=include_citations,
+            )
+
+            logger.info(f"Sending {len(text)} characters to {model} for summarization")
+
+            gemini_model = self._get_model(model)
+
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            response = await gemini_model.generate_content_async(
+                prompt,
+                request_options={"timeout": timeout},
+            )
+
+            return self._parse_response(response.text, response, model)
+
+        except Exception as e:
+            raise self._summarization_error(e, timeout)
+
+    async def summarize_many(
+        self,
+        items: List[Dict],
+        concurrency: int = 8,
+    ) -> List[Union[SummarizerResult, SummarizationError]]:
+        """
+        Summarize several texts concurrently, one AI request each
+
+        Args:
+            items: Keyword arguments for summarize_async(), one dict per text
+            concurrency: Maximum requests in flight at once
+
+        Returns:
+            One SummarizerResult per item, in input order, or the
+            SummarizationError that item failed with
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(item: Dict) -> Union[SummarizerResult, SummarizationError]:
+            async with semaphore:
+                try:
+                    return await self.summarize_async(**item)
+                except SummarizationError as e:
+                    return e
+
+        return list(await asyncio.gather(*(bounded(item) for item in items)))
+
+    def summarize_batch(
+        self,
+        documents: List[Tuple[str, Optional[str]]],
+        model: str = "models/gemini-2.5-flash",
+        max_summary_sentences: int = 4,
+        num_key_points: int = 5,
+        include_citations: bool = False,
+        timeout: int = 30,
+        max_input_tokens: Optional[int] = DEFAULT_MAX_INPUT_TOKENS,
+    ) -> List[Optional[SummarizerResult]]:
+        """
+        Summarize several documents with a single AI request
+
+        Args:
+            documents: (text, title) pairs to summarize
+            model: AI model to use
+            max_summary_sentences: Maximum sentences in each summary
+            num_key_points: Number of key points to extract per document
+            include_citations: Whether to include notable quotes
+            timeout: Request timeout in seconds
+            max_input_tokens: Approximate token budget for the text; longer text is cut (None disables)
+
+        Returns:
+            One SummarizerResult per document, in input order (None where the
+            model returned nothing usable for that document)
+
+        Raises:
+            SummarizationError: If the request fails
+        """
+        if not documents:
+            return []
+
+        documents = [
+            (_fit_token_budget(text, max_input_tokens), title) for text, title in documents
+        ]
+
+        try:
+            prompt = self._build_batch_prompt(
+                documents=documents,
+                max_summary_sentences=max_summary_sentences,
+                num_key_points=num_key_points,
+                include_citations=include_citations,
+            )
+
+            total_chars = sum(len(text) for text, _ in documents)
+            logger.info(f"Sending {len(documents)} documents ({total_chars} characters) to {model}")
+
+            gemini_model = self._get_model(model)
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            response = gemini_model.generate_content(
+                prompt,
+                # Room for every document's answer on top of the model's defaults
+                generation_config={"max_output_tokens": 2048 * len(documents)},
+                request_options={"timeout": timeout},
+            )
+
+            items = orjson.loads(response.text)
+            if isinstance(items, dict):
+                items = items.get("documents", [])
 
-            # Parse JSON response
-            try:
-                result = json.loads(content)
-            except json.JSONDecodeError:
-                # If response is not JSON, try to extract it
-                logger.warning("Response is not valid JSON, attempting to extract")
-                result = self._extract_from_text(content)
-
-            # Add metadata
-            # Gemini provides token counts in usage_metadata
             tokens_used = 0
-            if hasattr(response, 'usage_metadata'):
+            if hasattr(response, "usage_metadata"):
                 tokens_used = (
-                    response.usage_metadata.prompt_token_count +
-                    response.usage_metadata.candidates_token_count
+                    response.usage_metadata.prompt_token_count
+                    + response.usage_metadata.candidates_token_count
                 )
 
-            result["tokens_used"] = tokens_used
-            result["model_used"] = model
+        except Exception as e:
+            raise self._summarization_error(e, timeout)
 
-            logger.info(f"Summarization complete. Tokens used: {result['tokens_used']}")
+        answered: Dict[int, Dict] = {}
+        for item in items:
+            if not isinstance(item, dict) or not item.get("summary"):
+                continue
+            try:
+                doc_id = int(item["id"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if 0 <= doc_id < len(documents):
+                answered[doc_id] = item
+
+        # Token usage is only reported per request, so split it evenly
+        returned = len(answered)
+        results: List[Optional[SummarizerResult]] = [
+            (
+                self._to_result(answered[idx], tokens_used // returned, model)
+                if idx in answered
+                else None
+            )
+            for idx in range(len(documents))
+        ]
 
-            return result
+        logger.info(
+            f"Batch summarization complete: {returned}/{len(documents)} documents, {tokens_used} tokens"
+        )
 
-        except Exception as e:
-            error_message = str(e)
+        return results
 
-            # Check for timeout
-            if "timeout" in error_message.lower():
-                raise SummarizationError(
-                    f"AI request timeout after {timeout} seconds",
-                    error_code="AI_TIMEOUT",
-                )
+    def generate_text(
+        self,
+        prompt: str,
+        model: str = "models/gemini-2.5-flash",
+        timeout: int = 30,
+    ) -> str:
+        """
+        Send a free-form prompt and return the model's plain-text answer
 
-            # Check for API errors
-            if "api" in error_message.lower() or "quota" in error_message.lower():
-                logger.error(f"Gemini API error: {e}")
-                raise SummarizationError(
-                    f"AI API error: {str(e)}",
-                    error_code="AI_API_ERROR",
-                )
+        Args:
+            prompt: Complete prompt to send
+            model: AI model to use
+            timeout: Request timeout in seconds
+
+        Returns:
+            Response text, stripped
+
+        Raises:
+            SummarizationError: If the request fails
+        """
+        try:
+            gemini_model = self._get_model(model)
 
-            logger.error(f"Summarization failed: {e}")
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            response = gemini_model.generate_content(
+                prompt,
+                # Same cached handle, but answer in prose rather than JSON
+                generation_config={"response_mime_type": "text/plain"},
+                request_options={"timeout": timeout},
+            )
+            text: str = response.text
+            return text.strip()
+
+        except Exception as e:
+            raise self._summarization_error(e, timeout)
+
+    def _get_model(self, model: str) -> "genai.GenerativeModel":
+        """Return the cached Gemini model handle with JSON response format"""
+        gemini_model = self._models.get(model)
+        if gemini_model is None:
+            genai = _genai()
+            gemini_model = genai.GenerativeModel(
+                model,
+                generation_config=genai.GenerationConfig(
+                    temperature=0.3,
+                    max_output_tokens=2048,
+                    response_mime_type="application/json",
+                ),
+            )
+            self._models[model] = gemini_model
+        return gemini_model
+
+    @staticmethod
+    def _check_length(text: str) -> None:
+        """Reject text too short to be worth an AI request"""
+        if not text or len(text.strip()) < 50:
             raise SummarizationError(
-                f"Failed to summarize content: {str(e)}",
-                error_code="SUMMARIZATION_FAILED",
+                "Text is too short to summarize",
+                error_code="TEXT_TOO_SHORT",
             )
 
+    def _parse_response(
+        self,
+        content: str,
+        response: Union[
+            "genai.types.GenerateContentResponse", "genai.types.AsyncGenerateContentResponse"
+        ],
+        model: str,
+    ) -> SummarizerResult:
+        """Parse a single-document answer and attach token usage"""
+        # Parse JSON response
+        try:
+            result = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # If response is not JSON, try to extract it
+            logger.warning("Response is not valid JSON, attempting to extract")
+            result = self._extract_from_text(content)
+
+        # Add metadata
+        # Gemini provides token counts in usage_metadata
+        tokens_used = 0
+        if hasattr(response, "usage_metadata"):
+            tokens_used = (
+                response.usage_metadata.prompt_token_count
+                + response.usage_metadata.candidates_token_count
+            )
+
+        logger.info(f"Summarization complete. Tokens used: {tokens_used}")
+
+        return self._to_result(result, tokens_used, model)
+
+    def _to_result(self, raw: Dict, tokens_used: int, model: str) -> SummarizerResult:
+        """Fill in every SummarizerResult field from the model's parsed JSON"""
+        return SummarizerResult(
+            summary=raw.get("summary", ""),
+            key_points=raw.get("key_points", []),
+            citations=raw.get("citations"),
+            category=raw.get("category"),
+            tokens_used=tokens_used,
+            model_used=model,
+        )
+
+    def _summarization_error(self, error: Exception, timeout: int) -> SummarizationError:
+        """Map a failed Gemini request onto a SummarizationError"""
+        error_message = str(error)
+
+        # Check for timeout
+        if "timeout" in error_message.lower():
+            return SummarizationError(
+                f"AI request timeout after {timeout} seconds",
+                error_code="AI_TIMEOUT",
+            )
+
+        # Check for API errors
+        if "api" in error_message.lower() or "quota" in error_message.lower():
+            logger.error(f"Gemini API error: {error}")
+            return SummarizationError(
+                f"AI API error: {error_message}",
+                error_code="AI_API_ERROR",
+            )
+
+        logger.error(f"Summarization failed: {error}")
+        return SummarizationError(
+            f"Failed to summarize content: {error_message}",
+            error_code="SUMMARIZATION_FAILED",
+        )
+
     def _build_prompt(
         self,
         text: str,
@@ -156,48 +622,45 @@ class AISummarizer:
     ) -> str:
         """Build the AI prompt for summarization"""
         title_info = f"Title: {title}\n\n" if title else ""
+        instructions = _prompt_instructions(
+            max_summary_sentences, num_key_points, include_citations
+        )
 
-        citations_instruction = ""
-        if include_citations:
-            citations_instruction = """
-  - "citations": Array of 2-3 notable quotes or key statements from the text (verbatim)
-"""
-
-        prompt = f"""You are an expert content summarizer. Analyze the following web content and provide a structured summary in JSON format.
-
-{title_info}Content:
-{text}
-
-Provide a JSON response with this exact structure:
-{{
-  "summary": "A concise summary in {max_summary_sentences} sentences or less that captures the main message and purpose",
-  "key_points": ["point 1", "point 2", "point 3", "point 4", "point 5"],
-  "category": "The primary category or topic (e.g., Technology, Business, Health, Politics, etc.)"{', "citations": ["quote 1", "quote 2", "quote 3"]' if include_citations else ''}
-}}
-
-Requirements:
-- summary: {max_summary_sentences} sentences maximum
-- key_points: Exactly {num_key_points} key takeaways as an array of strings{f'''
-- citations: 2-3 notable verbatim quotes from the text''' if include_citations else ''}
-- category: Single word or short phrase
+        return "".join((_PROMPT_HEAD, title_info, "Content:\n", text, instructions))
 
-Focus on the main message, key facts, conclusions, and actionable insights."""
+    def _build_batch_prompt(
+        self,
+        documents: List[Tuple[str, Optional[str]]],
+        max_summary_sentences: int,
+        num_key_points: int,
+        include_citations: bool,
+    ) -> str:
+        """Build the AI prompt for summarizing several documents at once"""
+        envelopes = "\n\n".join(
+            f'<doc id="{idx}">\n' + (f"Title: {title}\n\n" if title else "") + f"{text}\n</doc>"
+            for idx, (text, title) in enumerate(documents)
+        )
+        instructions = _batch_prompt_instructions(
+            max_summary_sentences, num_key_points, include_citations
+        )
 
-        return prompt
+        return "".join((_BATCH_PROMPT_HEAD.format(count=len(documents)), envelopes, instructions))
 
     def _extract_from_text(self, text: str) -> Dict:
         """Fallback: Extract structured data from non-JSON response"""
         logger.warning("Using fallback extraction method")
 
-        # Try to find JSON in the text
-        import re
-
-        json_match = re.search(r"\{.*\}", text, re.DOTALL)
-        if json_match:
-            try:
-                return json.loads(json_match.group(0))
-            except json.JSONDecodeError:
-                pass
+        # Try the first balanced object, then everything from the first { to the last }
+        start = text.find("{")
+        if start != -1:
+            for candidate in (_balanced_object(text, start), text[start : text.rfind("}") + 1]):
+                if not candidate:
+                    continue
+                try:
+                    parsed: Dict = orjson.loads(candidate)
+                    return parsed
+                except orjson.JSONDecodeError:
+                    pass
 
         # If all else fails, return a basic structure
         return {
@@ -2,18 +2,151 @@
 Topic-based content aggregation and social media post generation
 """
 
-import logging
-from datetime import datetime
-from typing import List, Dict, Optional
+import asyncio
 import concurrent.futures
+import functools
+import logging
+import re
+import threading
+from collections import Counter, defaultdict
 from dataclasses import dataclass
+from datetime import datetime
+from typing import DefaultDict, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from web_summarizer.agent import WebSummarizerAgent
+from web_summarizer.models import SummaryResponse
 
 logger = logging.getLogger(__name__)
 
 
+# Separators treated as spaces when splitting a topic into hashtag words
+_HASHTAG_TRANS = str.maketrans({"-": " ", "_": " "})
+
+# Generic useful hashtags, added after the topic and key point ones
+_GENERIC_HASHTAGS = ("#TechNews", "#Innovation", "#DigitalTransformation")
+
+# Words in key points that never make useful hashtags
+_HASHTAG_STOPWORDS = frozenset(
+    {
+        "about",
+        "after",
+        "also",
+        "been",
+        "from",
+        "have",
+        "into",
+        "more",
+        "most",
+        "other",
+        "over",
+        "such",
+        "than",
+        "that",
+        "their",
+        "them",
+        "then",
+        "there",
+        "these",
+        "they",
+        "this",
+        "those",
+        "through",
+        "very",
+        "were",
+        "what",
+        "when",
+        "where",
+        "which",
+        "while",
+        "will",
+        "with",
+        "would",
+        "your",
+    }
+)
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+@functools.lru_cache(maxsize=256)
+def _topic_hashtags(topic: str) -> Tuple[str, ...]:
+    """Hashtags for the words of a topic, built once per topic"""
+    # Skip short words; dict keeps first-seen order
+    return tuple(
+        dict.fromkeys(
+            f"#{word.capitalize()}"
+            for word in topic.translate(_HASHTAG_TRANS).split()
+            if len(word) > 3
+        )
+    )
+
+
+def _key_point_hashtags(key_points: List[str], limit: int = 5) -> List[str]:
+    """Hashtags for the words used most often across key points"""
+    counts = Counter(
+        word
+        for word in _WORD_RE.findall(" ".join(key_points).lower())
+        if len(word) > 3 and word not in _HASHTAG_STOPWORDS and not word.isdigit()
+    )
+    return [f"#{word.capitalize()}" for word, _ in counts.most_common(limit)]
+
+
+@functools.lru_cache(maxsize=None)
+def _platform_columns(platform: str) -> Tuple[str, str, str]:
+    """Row keys for a platform's post, hashtags and character count"""
+    return f"{platform}_post", f"{platform}_hashtags", f"{platform}_chars"
+
+
+def _canonical_url(url: str) -> str:
+    """Key under which equivalent URLs (case, trailing slash, utm_* tags) collapse"""
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.startswith("utm_")
+    ]
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path.rstrip("/"),
+            urlencode(query),
+            "",
+        )
+    )
+
+
+def _unique_urls(urls: List[str]) -> Tuple[List[str], List[int]]:
+    """
+    Collapse equivalent URLs so each page is summarized once
+
+    Args:
+        urls: URLs as given by the caller
+
+    Returns:
+        Tuple of (first URL of each distinct page, index into it for every input URL)
+    """
+    index: Dict[str, int] = {}
+    unique: List[str] = []
+    positions: List[int] = []
+    for url in urls:
+        key = _canonical_url(url)
+        if key not in index:
+            index[key] = len(unique)
+            unique.append(url)
+        positions.append(index[key])
+    return unique, positions
+
+
 @dataclass
 class SocialMediaPost:
     """Social media post data"""
+
     platform: str
     content: str
     hashtags: List[str]
@@ -23,14 +156,20 @@ class SocialMediaPost:
 class TopicAggregator:
     """Aggregates summaries from multiple sources for a specific topic"""
 
-    def __init__(self, agent):
+    # Combined source summaries longer than this are master-summarized in groups first
+    MAX_MASTER_CHARS = 80_000
+
+    def __init__(self, agent: WebSummarizerAgent, combine_summaries: bool = True):
         """
         Initialize topic aggregator
 
         Args:
             agent: WebSummarizerAgent instance
+            combine_summaries: Summarize fetched articles in shared AI requests
+                (see WebSummarizerAgent.summarize_combined) instead of one per URL
         """
         self.agent = agent
+        self.combine_summaries = combine_summaries
 
     def aggregate_topic(
         self,
@@ -38,6 +177,8 @@ class TopicAggregator:
         urls: List[str],
         platforms: Optional[List[str]] = None,
         max_workers: int = 5,
+        force_refresh: bool = False,
+        max_per_host: int = 2,
     ) -> Dict:
         """
         Aggregate summaries from multiple URLs for a specific topic
@@ -47,6 +188,9 @@ class TopicAggregator:
             urls: List of URLs to summarize
             platforms: Social media platforms to generate posts for
             max_workers: Maximum concurrent workers
+            max_per_host: Maximum concurrent summarizations per host
+            force_refresh: Re-summarize URLs even if cached or stored in RAG
+                (combined mode only)
 
         Returns:
             Dictionary with aggregated data and social media posts
@@ -56,17 +200,138 @@ class TopicAggregator:
 
         logger.info(f"Aggregating content for topic: {topic} from {len(urls)} sources")
 
-        # Summarize all URLs concurrently
-        summaries = self._fetch_summaries(urls, max_workers)
+        # Summarize each distinct page once, concurrently
+        unique, positions = _unique_urls(urls)
+        if self.combine_summaries:
+            results = self.agent.summarize_combined(
+                unique, max_workers=max_workers, max_per_host=max_per_host, refresh=force_refresh
+            )
+        else:
+            results = self._fetch_summaries(unique, max_workers, max_per_host)
+        summaries = [results[i] for i in positions]
+
+        return self._build_result(topic, urls, platforms, summaries)
+
+    async def aggregate_topic_async(
+        self,
+        topic: str,
+        urls: List[str],
+        platforms: Optional[List[str]] = None,
+        max_workers: int = 5,
+        max_per_host: int = 2,
+        force_refresh: bool = False,
+    ) -> Dict:
+        """
+        Async variant of aggregate_topic for use inside an event loop
 
+        URLs are summarized off the event loop, at most max_workers at a time
+        and at most max_per_host against any single site, so the caller's loop
+        is never blocked.
+
+        Args:
+            topic: The topic to focus on
+            urls: List of URLs to summarize
+            platforms: Social media platforms to generate posts for
+            max_workers: Maximum concurrent summarizations
+            max_per_host: Maximum concurrent summarizations per host
+            force_refresh: Re-summarize URLs even if cached or stored in RAG
+                (combined mode only)
+
+        Returns:
+            Dictionary with aggregated data and social media posts
+        """
+        if platforms is None:
+            platforms = ["twitter", "linkedin", "facebook"]
+
+        logger.info(f"Aggregating content for topic: {topic} from {len(urls)} sources")
+
+        unique, positions = _unique_urls(urls)
+        if self.combine_summaries:
+            results = await asyncio.to_thread(
+                self.agent.summarize_combined,
+                unique,
+                max_workers=max_workers,
+                max_per_host=max_per_host,
+                refresh=force_refresh,
+            )
+        else:
+            results = await self._gather_summaries(unique, max_workers, max_per_host)
+        summaries = [results[i] for i in positions]
+
+        # The master summary makes a blocking Gemini call
+        return await asyncio.to_thread(self._build_result, topic, urls, platforms, summaries)
+
+    def _build_result(
+        self,
+        topic: str,
+        urls: List[str],
+        platforms: List[str],
+        summaries: List,
+    ) -> Dict:
+        """Assemble rows, posts and the master summary from finished summaries"""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            # The master summary is a blocking Gemini call; per-source rows don't need it
+            master_future = executor.submit(self._generate_master_summary, summaries, topic)
+            rows, entries = self._build_rows(topic, platforms, summaries)
+            master_summary = master_future.result()
+
+        social_media_posts = self._consolidate_posts(topic, summaries, platforms, master_summary)
+
+        result = {
+            "topic": topic,
+            "total_sources": len(urls),
+            "successful_summaries": len(rows),
+            "failed_summaries": len(urls) - len(rows),
+            "platforms": platforms,
+            "generated_at": datetime.now().isoformat(),
+            "master_summary": master_summary,
+            "social_media_posts": social_media_posts,
+            "summaries": entries,
+            "data": rows,
+        }
+
+        logger.info(f"Successfully aggregated {len(rows)}/{len(urls)} sources")
+
+        return result
+
+    def _build_rows(
+        self, topic: str, platforms: List[str], summaries: List
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Flatten summaries into export rows and per-source result entries in one pass
+
+        Args:
+            topic: The topic being aggregated
+            platforms: Platforms to generate per-source posts for
+            summaries: SummaryResponse per source, in input order
+
+        Returns:
+            Tuple of (rows for successful sources, one result entry per source)
+        """
         # Generate social media posts for each summary
         rows = []
+        entries = []
         for i, summary_response in enumerate(summaries):
             if not summary_response.success:
                 logger.warning(f"Failed to summarize URL {i+1}: {summary_response.error}")
+                entries.append(
+                    {"url": "", "success": False, "data": {}, "error": summary_response.error}
+                )
                 continue
 
             data = summary_response.data
+            entries.append(
+                {
+                    "url": data.url,
+                    "success": True,
+                    "data": {
+                        "title": data.title,
+                        "summary": data.summary,
+                        "key_points": data.key_points,
+                    },
+                    "error": None,
+                }
+            )
 
             # Generate posts for each platform
             social_posts = self._generate_social_posts(
@@ -83,8 +348,8 @@ class TopicAggregator:
                 "title": data.title,
                 "category": data.category,
                 "summary": data.summary,
-                "key_points": "; ".join(data.key_points),
-                "word_count": len(data.summary.split()),
+                "key_points": data.key_points_text,
+                "word_count": data.word_count,
                 "tokens_used": data.metadata.tokens_used,
                 "processing_time_ms": data.metadata.processing_time_ms,
                 "timestamp": data.metadata.timestamp,
@@ -92,32 +357,202 @@ class TopicAggregator:
 
             # Add social media posts
             for platform, post in social_posts.items():
-                row[f"{platform}_post"] = post.content
-                row[f"{platform}_hashtags"] = " ".join(post.hashtags)
-                row[f"{platform}_chars"] = post.character_count
+                post_key, hashtags_key, chars_key = _platform_columns(platform)
+                row[post_key] = post.content
+                row[hashtags_key] = " ".join(post.hashtags)
+                row[chars_key] = post.character_count
 
             rows.append(row)
 
+        return rows, entries
+
+    def stream_topic(
+        self,
+        topic: str,
+        urls: List[str],
+        platforms: Optional[List[str]] = None,
+        max_workers: int = 5,
+        max_per_host: int = 2,
+        force_refresh: bool = False,
+    ) -> Iterator[Dict]:
+        """
+        Aggregate a topic like aggregate_topic, yielding events as results arrive
+
+        Distinct pages are summarized once, through the same combined or per-URL
+        path as aggregate_topic. Yields "article" events (one per input URL) as
+        their summaries finish, then "master_summary", one "post" per platform and
+        a final "done" event with the counts.
+
+        Args:
+            topic: The topic to focus on
+            urls: List of URLs to summarize
+            platforms: Social media platforms to generate posts for
+            max_workers: Maximum concurrent workers
+            max_per_host: Maximum concurrent summarizations per host
+            force_refresh: Re-summarize URLs even if cached or stored in RAG
+                (combined mode only)
+
+        Yields:
+            Event dictionaries with a "type" key
+        """
+        if platforms is None:
+            platforms = ["twitter", "linkedin", "facebook"]
+
+        logger.info(f"Streaming aggregation for topic: {topic} from {len(urls)} sources")
+
+        unique, positions = _unique_urls(urls)
+        # Input positions sharing each distinct page
+        duplicates: Dict[int, List[int]] = defaultdict(list)
+        for idx, unique_idx in enumerate(positions):
+            duplicates[unique_idx].append(idx)
+
+        summaries: Dict[int, SummaryResponse] = {}
+        for unique_idx, summary in self._iter_summaries(
+            unique, max_workers, max_per_host, force_refresh
+        ):
+            for idx in duplicates[unique_idx]:
+                summaries[idx] = summary
+                yield {
+                    "type": "article",
+                    "idx": idx,
+                    "url": summary.data.url if summary.data else urls[idx],
+                    "success": summary.success,
+                    "title": summary.data.title if summary.data else "",
+                    "summary": summary.data.summary if summary.data else "",
+                    "key_points": summary.data.key_points if summary.data else [],
+                    "error": summary.error if not summary.success else None,
+                }
+
+        # Input order, as aggregate_topic consolidates them
+        ordered = [summaries[idx] for idx in range(len(urls))]
+        master_summary, social_media_posts = self._consolidate(topic, ordered, platforms)
+        yield {"type": "master_summary", "text": master_summary}
+
+        for platform, text in social_media_posts.items():
+            yield {"type": "post", "platform": platform, "text": text}
+
+        successful = sum(1 for s in ordered if s.success)
+        yield {
+            "type": "done",
+            "total_sources": len(urls),
+            "successful_summaries": successful,
+            "failed_summaries": len(urls) - successful,
+        }
+
+    def _fetch_summaries(
+        self, urls: List[str], max_workers: int, max_per_host: int = 2
+    ) -> List[SummaryResponse]:
+        """Fetch summaries concurrently from synchronous code, preserving input order"""
+        # Plain threads rather than an event loop, so callers already inside one still work
+        results = dict(self._iter_threaded(urls, max_workers, max_per_host))
+        return [results[idx] for idx in range(len(urls))]
+
+    def _iter_summaries(
+        self,
+        urls: List[str],
+        max_workers: int,
+        max_per_host: int = 2,
+        force_refresh: bool = False,
+    ) -> Iterator[Tuple[int, SummaryResponse]]:
+        """Yield (index, SummaryResponse) pairs as summaries finish"""
+        if self.combine_summaries:
+            yield from self.agent.iter_combined(
+                urls, max_workers=max_workers, max_per_host=max_per_host, refresh=force_refresh
+            )
+            return
+
+        yield from self._iter_threaded(urls, max_workers, max_per_host)
+
+    def _iter_threaded(
+        self, urls: List[str], max_workers: int, max_per_host: int = 2
+    ) -> Iterator[Tuple[int, SummaryResponse]]:
+        """Yield (index, SummaryResponse) pairs from per-URL summaries on a thread pool"""
+        # Same per-host cap as _gather_summaries, on plain threads
+        host_slots = {urlsplit(url).hostname: threading.Semaphore(max_per_host) for url in urls}
+
+        def bounded(url: str) -> SummaryResponse:
+            with host_slots[urlsplit(url).hostname]:
+                return self.agent.summarize_url(url)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_idx = {executor.submit(bounded, url): idx for idx, url in enumerate(urls)}
+
+            for future in concurrent.futures.as_completed(future_to_idx):
+                idx = future_to_idx[future]
+                try:
+                    yield idx, future.result()
+                except Exception as e:
+                    yield idx, self._failed_summary(urls[idx], e)
+
+    async def _gather_summaries(
+        self, urls: List[str], max_workers: int, max_per_host: int = 2
+    ) -> List[SummaryResponse]:
+        """Summarize URLs concurrently on the event loop, preserving input order"""
+        semaphore = asyncio.Semaphore(max_workers)
+        # Keep several URLs from one site from hammering it (and its rate limits) at once
+        host_semaphores: DefaultDict[Optional[str], asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(max_per_host)
+        )
+
+        async def bounded(url: str) -> SummaryResponse:
+            async with host_semaphores[urlsplit(url).hostname], semaphore:
+                return await asyncio.to_thread(self.agent.summarize_url, url)
+
+        results = await asyncio.gather(*(bounded(url) for url in urls), return_exceptions=True)
+
+        return [
+            self._failed_summary(url, result) if isinstance(result, BaseException) else result
+            for url, result in zip(urls, results)
+        ]
+
+    def _failed_summary(self, url: str, error: BaseException) -> SummaryResponse:
+        """Build a failed SummaryResponse for a URL that raised"""
+        logger.error(f"Failed to fetch summary for {url}: {error}")
+        # Create a failed response
+        return SummaryResponse(
+            success=False,
+            error=str(error),
+            error_code="FETCH_FAILED",
+        )
+
+    def _consolidate(
+        self,
+        topic: str,
+        summaries: List,
+        platforms: List[str],
+    ) -> Tuple[str, Dict[str, str]]:
+        """Build the master summary and consolidated posts across all sources"""
         # Generate master summary from all successful summaries
         master_summary = self._generate_master_summary(summaries, topic)
 
-        # Generate consolidated social media posts
-        all_summaries_text = "\n\n".join([
-            s.data.summary for s in summaries if s.success
-        ])
-        all_key_points = []
-        for s in summaries:
-            if s.success:
-                all_key_points.extend(s.data.key_points)
+        return master_summary, self._consolidate_posts(topic, summaries, platforms, master_summary)
 
-        # Get first successful URL for reference
-        first_url = next((s.data.url for s in summaries if s.success), "")
+    def _consolidate_posts(
+        self,
+        topic: str,
+        summaries: List,
+        platforms: List[str],
+        master_summary: str,
+    ) -> Dict[str, str]:
+        """Build consolidated posts across all sources around the master summary"""
+        # Top 5 key points and the first successful URL for reference, in one pass
+        key_points: List[str] = []
+        first_url = ""
+        for s in summaries:
+            if not s.success:
+                continue
+            if not first_url:
+                first_url = s.data.url
+            key_points.extend(s.data.key_points[: 5 - len(key_points)])
+            if len(key_points) == 5:
+                break
         first_title = f"{topic} - Research Summary"
 
+        # Generate consolidated social media posts
         consolidated_posts = self._generate_social_posts(
             topic=topic,
             summary=master_summary,
-            key_points=all_key_points[:5],  # Top 5 key points
+            key_points=key_points,
             url=first_url,
             title=first_title,
             platforms=platforms,
@@ -125,67 +560,10 @@ class TopicAggregator:
 
         # Convert posts to simple dict
         social_media_posts = {
-            platform: post.content
-            for platform, post in consolidated_posts.items()
-        }
-
-        result = {
-            "topic": topic,
-            "total_sources": len(urls),
-            "successful_summaries": len(rows),
-            "failed_summaries": len(urls) - len(rows),
-            "platforms": platforms,
-            "generated_at": datetime.now().isoformat(),
-            "master_summary": master_summary,
-            "social_media_posts": social_media_posts,
-            "summaries": [
-                {
-                    "url": s.data.url if s.success else "",
-                    "success": s.success,
-                    "data": {
-                        "title": s.data.title if s.success else "",
-                        "summary": s.data.summary if s.success else "",
-                        "key_points": s.data.key_points if s.success else [],
-                    } if s.success else {},
-                    "error": s.error if not s.success else None,
-                }
-                for s in summaries
-            ],
-            "data": rows,
+            platform: post.content for platform, post in consolidated_posts.items()
         }
 
-        logger.info(f"Successfully aggregated {len(rows)}/{len(urls)} sources")
-
-        return result
-
-    def _fetch_summaries(self, urls: List[str], max_workers: int) -> List:
-        """Fetch summaries concurrently"""
-        summaries = []
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_url = {
-                executor.submit(self.agent.summarize_url, url): url
-                for url in urls
-            }
-
-            for future in concurrent.futures.as_completed(future_to_url):
-                try:
-                    summary = future.result(timeout=60)
-                    summaries.append(summary)
-                except Exception as e:
-                    url = future_to_url[future]
-                    logger.error(f"Failed to fetch summary for {url}: {e}")
-                    # Create a failed response
-                    from web_summarizer.models import SummaryResponse
-                    summaries.append(
-                        SummaryResponse(
-                            success=False,
-                            error=str(e),
-                            error_code="FETCH_FAILED",
-                        )
-                    )
-
-        return summaries
+        return social_media_posts
 
     def _generate_social_posts(
         self,
@@ -203,22 +581,19 @@ class TopicAggregator:
         hashtags = self._generate_hashtags(topic, key_points)
 
         for platform in platforms:
-            if platform.lower() == "twitter":
-                posts["twitter"] = self._generate_twitter_post(
-                    summary, key_points, url, hashtags
-                )
-            elif platform.lower() == "linkedin":
+            platform = platform.lower()
+            if platform == "twitter":
+                posts["twitter"] = self._generate_twitter_post(summary, key_points, url, hashtags)
+            elif platform == "linkedin":
                 posts["linkedin"] = self._generate_linkedin_post(
                     topic, title, summary, key_points, url, hashtags
                 )
-            elif platform.lower() == "facebook":
+            elif platform == "facebook":
                 posts["facebook"] = self._generate_facebook_post(
                     topic, title, summary, key_points, url, hashtags
                 )
-            elif platform.lower() == "instagram":
-                posts["instagram"] = self._generate_instagram_post(
-                    summary, key_points, hashtags
-                )
+            elif platform == "instagram":
+                posts["instagram"] = self._generate_instagram_post(summary, key_points, hashtags)
 
         return posts
 
@@ -247,7 +622,7 @@ class TopicAggregator:
         # Ensure we fit in the limit
         available = max_length - reserved
         if len(content) > available:
-            content = content[:available-3] + "..."
+            content = content[: available - 3] + "..."
 
         post_text = f"{content}\n\n{url}\n\n{hashtag_text}"
 
@@ -258,6 +633,26 @@ class TopicAggregator:
             character_count=len(post_text),
         )
 
+    @staticmethod
+    def _build_post(parts: List[str], limit: Optional[int] = None) -> str:
+        """
+        Join post lines and truncate to a platform limit
+
+        Args:
+            parts: Post lines, in order
+            limit: Maximum characters, or None for no limit
+
+        Returns:
+            Post text, ending in "..." when it was cut
+        """
+        post_text = "\n".join(parts)
+
+        # Ensure within limit
+        if limit is not None and len(post_text) > limit:
+            post_text = post_text[: limit - 3] + "..."
+
+        return post_text
+
     def _generate_linkedin_post(
         self,
         topic: str,
@@ -281,18 +676,16 @@ class TopicAggregator:
         for i, point in enumerate(key_points[:5], 1):
             post_parts.append(f"{i}. {point}")
 
-        post_parts.extend([
-            "",
-            f"Read more: {url}",
-            "",
-            " ".join(hashtags[:5]),
-        ])
+        post_parts.extend(
+            [
+                "",
+                f"Read more: {url}",
+                "",
+                " ".join(hashtags[:5]),
+            ]
+        )
 
-        post_text = "\n".join(post_parts)
-
-        # Ensure within limit
-        if len(post_text) > 3000:
-            post_text = post_text[:2997] + "..."
+        post_text = self._build_post(post_parts, 3000)
 
         return SocialMediaPost(
             platform="linkedin",
@@ -324,14 +717,16 @@ class TopicAggregator:
         for point in key_points[:3]:
             post_parts.append(f"• {point}")
 
-        post_parts.extend([
-            "",
-            f"🔗 {url}",
-            "",
-            " ".join(hashtags[:3]),
-        ])
+        post_parts.extend(
+            [
+                "",
+                f"🔗 {url}",
+                "",
+                " ".join(hashtags[:3]),
+            ]
+        )
 
-        post_text = "\n".join(post_parts)
+        post_text = self._build_post(post_parts)
 
         return SocialMediaPost(
             platform="facebook",
@@ -360,16 +755,14 @@ class TopicAggregator:
             emoji = emojis[i % len(emojis)]
             post_parts.append(f"{emoji} {point}")
 
-        post_parts.extend([
-            "",
-            " ".join(hashtags[:30]),  # Instagram allows up to 30
-        ])
-
-        post_text = "\n".join(post_parts)
+        post_parts.extend(
+            [
+                "",
+                " ".join(hashtags[:30]),  # Instagram allows up to 30
+            ]
+        )
 
-        # Ensure within limit
-        if len(post_text) > 2200:
-            post_text = post_text[:2197] + "..."
+        post_text = self._build_post(post_parts, 2200)
 
         return SocialMediaPost(
             platform="instagram",
@@ -388,48 +781,75 @@ class TopicAggregator:
         if len(successful_summaries) == 1:
             return successful_summaries[0].data.summary
 
-        # Combine all summaries
-        combined_text = "\n\n---\n\n".join([
-            f"Source: {s.data.title}\n{s.data.summary}"
-            for s in successful_summaries
-        ])
+        sections = [f"Source: {s.data.title}\n{s.data.summary}" for s in successful_summaries]
 
         # Use Gemini to generate a master summary
         try:
-            prompt = f"""Based on the following summaries about "{topic}", create a comprehensive master summary that:
+            return self._master_summary_text(sections, topic)
+
+        except Exception as e:
+            logger.error(f"Failed to generate master summary: {e}")
+            # Fallback: return first summary
+            return successful_summaries[0].data.summary
+
+    def _master_summary_text(self, sections: List[str], topic: str) -> str:
+        """
+        Master-summarize source sections, map-reducing when they overflow one prompt
+
+        Args:
+            sections: One "Source: title\nsummary" block per source
+            topic: The topic being aggregated
+
+        Returns:
+            Master summary text
+        """
+        # Combine all summaries
+        combined_text = "\n\n---\n\n".join(sections)
+
+        if len(combined_text) > self.MAX_MASTER_CHARS and len(sections) > 1:
+            groups = self._group_sections(sections)
+            logger.info(
+                f"Master summary input is {len(combined_text)} characters; "
+                f"summarizing {len(groups)} groups first"
+            )
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(groups), 4)) as executor:
+                partials = list(
+                    executor.map(lambda group: self._master_summary_text(group, topic), groups)
+                )
+            return self._master_summary_text(
+                [f"Source group {i}:\n{partial}" for i, partial in enumerate(partials, 1)], topic
+            )
+
+        prompt = f"""Based on the following summaries about "{topic}", create a comprehensive master summary that:
 1. Synthesizes the key insights from all sources
 2. Highlights common themes and patterns
 3. Notes any contrasting viewpoints
 4. Is concise yet informative (3-5 sentences)
 
 Summaries:
-{combined_text}
+{combined_text[:self.MAX_MASTER_CHARS]}
 
 Master Summary:"""
 
-            response = self.agent.summarizer.client.generate_content(prompt)
-            master_summary = response.text.strip()
-
-            return master_summary
+        return self.agent.summarizer.generate_text(prompt)
 
-        except Exception as e:
-            logger.error(f"Failed to generate master summary: {e}")
-            # Fallback: return first summary
-            return successful_summaries[0].data.summary
+    def _group_sections(self, sections: List[str]) -> List[List[str]]:
+        """Pack sections in order into groups that each fit MAX_MASTER_CHARS"""
+        groups: List[List[str]] = [[]]
+        size = 0
+        for section in sections:
+            if groups[-1] and size + len(section) > self.MAX_MASTER_CHARS:
+                groups.append([])
+                size = 0
+            groups[-1].append(section)
+            size += len(section) + 7  # separator
+        return groups
 
     def _generate_hashtags(self, topic: str, key_points: List[str]) -> List[str]:
         """Generate relevant hashtags from topic and key points"""
-        hashtags = set()
-
-        # Add topic-based hashtags
-        topic_words = topic.replace("-", " ").replace("_", " ").split()
-        for word in topic_words:
-            if len(word) > 3:  # Skip short words
-                hashtags.add(f"#{word.capitalize()}")
-
-        # Generic useful hashtags
-        hashtags.add("#TechNews")
-        hashtags.add("#Innovation")
-        hashtags.add("#DigitalTransformation")
+        # Topic words first, then frequent key point words, then generic tags
+        hashtags = dict.fromkeys(_topic_hashtags(topic))
+        hashtags.update(dict.fromkeys(_key_point_hashtags(key_points)))
+        hashtags.update(dict.fromkeys(_GENERIC_HASHTAGS))
 
         return list(hashtags)[:10]  # Return max 10 hashtags
@@ -2,65 +2,182 @@
 Web search module for finding relevant articles on a topic
 """
 
+import asyncio
+import concurrent.futures
 import logging
-from typing import List, Dict, Optional
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from urllib.parse import urlparse
+
+from web_summarizer.cache import TTLCache
+from web_summarizer.rate_limit import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Host of a plain http(s) URL; anything unusual (userinfo, IPv6) falls back to urlparse
+_HOST_RE = re.compile(r"https?://([^/:?#@\[\]]+)(?::\d*)?(?=[/?#]|$)", re.IGNORECASE)
+
+
+def _url_host(url: str) -> str:
+    """Lower-cased host of a URL, or "" if it has none"""
+    match = _HOST_RE.match(url)
+    if match:
+        return match.group(1).lower()
+    return urlparse(url).hostname or ""
+
 
 class WebSearchError(Exception):
     """Exception raised when web search fails"""
 
+    __slots__ = ("message", "error_code")
+
     def __init__(self, message: str, error_code: str):
         self.message = message
         self.error_code = error_code
         super().__init__(self.message)
 
+    def __reduce__(self) -> Tuple[type, Tuple[str, str]]:
+        return (self.__class__, (self.message, self.error_code))
+
 
 class WebSearcher:
     """Search the web for relevant articles using DuckDuckGo"""
 
-    def __init__(self, search_engine: str = "duckduckgo"):
-        """Initialize web searcher"""
+    def __init__(
+        self,
+        search_engine: str = "duckduckgo",
+        client: Optional[Any] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache_size: int = 256,
+        cache_ttl: float = 600.0,
+    ):
+        """
+        Initialize web searcher
+
+        Args:
+            search_engine: Search engine to use
+            client: Shared DDGS client (otherwise one is created per thread and reused)
+            rate_limiter: Optional limiter applied before every search call
+            cache_size: Maximum number of cached result lists (0 disables caching)
+            cache_ttl: Seconds a cached result list stays valid
+        """
         self.search_engine = search_engine.lower()
+        self.rate_limiter = rate_limiter
+        self._client = client
+        self._local = threading.local()
+        self._search_cache = TTLCache(maxsize=cache_size, ttl=cache_ttl) if cache_size else None
+
+    def _throttle(self) -> None:
+        """Wait for the rate limiter, if any, before calling the search engine"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+    def _get_client(self) -> Any:
+        """Return a DDGS client, keeping its connection pool alive between searches"""
+        if self._client is not None:
+            return self._client
+
+        client = getattr(self._local, "client", None)
+        if client is None:
+            try:
+                from ddgs import DDGS
+            except ImportError:
+                raise WebSearchError(
+                    "ddgs is not installed. Install with: pip install ddgs",
+                    error_code="MISSING_DEPENDENCY",
+                )
+            client = self._local.client = DDGS()
+
+        return client
+
+    def _cache_key(self, method: str, query: str, num_results: int) -> tuple:
+        """Cache key for a search, ignoring case and whitespace differences in the query"""
+        return (self.search_engine, method, " ".join(query.lower().split()), num_results)
+
+    def _cached(self, key: tuple) -> Optional[List[Dict[str, str]]]:
+        """Return a copy of cached results for key, if any"""
+        if self._search_cache is None:
+            return None
+        results = self._search_cache.get(key)
+        if results is None:
+            return None
+        logger.info(f"Using cached results for query: {key[2]}")
+        return [dict(result) for result in results]
+
+    def _store(self, key: tuple, results: List[Dict[str, str]]) -> None:
+        """Cache results for key (empty answers are not cached, they are often transient)"""
+        if self._search_cache is not None and results:
+            self._search_cache.set(key, tuple(dict(result) for result in results))
+
+    @staticmethod
+    def _text_results(search_results: Iterable[Any]) -> List[Dict[str, str]]:
+        """Normalize raw text hits to title, url and snippet, dropping any without a URL"""
+        return [
+            {
+                "title": result.get("title", ""),
+                "url": url,
+                "snippet": result.get("body", "") or result.get("snippet", ""),
+            }
+            for result in search_results
+            if isinstance(result, dict)
+            and (url := result.get("href") or result.get("url") or result.get("link", ""))
+        ]
+
+    @staticmethod
+    def _domain_query(
+        query: str,
+        allowed_domains: Optional[List[str]] = None,
+        blocked_domains: Optional[List[str]] = None,
+    ) -> str:
+        """Append site: operators so the engine only returns matching domains"""
+        if allowed_domains:
+            query += " (" + " OR ".join(f"site:{domain}" for domain in allowed_domains) + ")"
+        if blocked_domains:
+            query += "".join(f" -site:{domain}" for domain in blocked_domains)
+        return query
 
     def search(
         self,
         query: str,
         num_results: int = 10,
         filters: Optional[Dict[str, str]] = None,
+        allowed_domains: Optional[List[str]] = None,
+        blocked_domains: Optional[List[str]] = None,
     ) -> List[Dict[str, str]]:
-        """Search the web for articles"""
+        """
+        Search the web for articles
+
+        Args:
+            query: Search query
+            num_results: Maximum number of results
+            filters: Unused, kept for compatibility
+            allowed_domains: Only return results from these domains
+            blocked_domains: Never return results from these domains
+
+        Returns:
+            List of results with title, url and snippet
+        """
         logger.info(f"Searching for: {query}")
+        query = self._domain_query(query, allowed_domains, blocked_domains)
 
-        try:
-            from ddgs import DDGS
-        except ImportError:
-            raise WebSearchError(
-                "ddgs is not installed. Install with: pip install ddgs",
-                error_code="MISSING_DEPENDENCY"
-            )
+        cache_key = self._cache_key("text", query, num_results)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return self._enforce_domains(cached, allowed_domains, blocked_domains)
 
-        results = []
+        ddgs = self._get_client()
 
         try:
-            ddgs = DDGS()
+            self._throttle()
             search_results = ddgs.text(
                 query,
                 max_results=num_results,
-                backend="api"  # Use API backend for more reliable results
+                backend="api",  # Use API backend for more reliable results
             )
 
             # Convert generator to list and process results
-            for result in search_results:
-                if isinstance(result, dict):
-                    url = result.get("href") or result.get("url") or result.get("link", "")
-                    if url:  # Only add if we have a valid URL
-                        results.append({
-                            "title": result.get("title", ""),
-                            "url": url,
-                            "snippet": result.get("body", "") or result.get("snippet", ""),
-                        })
+            results = self._text_results(search_results)
 
             logger.info(f"Found {len(results)} results for query: {query}")
 
@@ -69,18 +186,9 @@ class WebSearcher:
             # Try with different backend as fallback
             try:
                 logger.info("Retrying with alternative backend...")
-                ddgs = DDGS()
+                self._throttle()
                 search_results = ddgs.text(query, max_results=num_results)
-
-                for result in search_results:
-                    if isinstance(result, dict):
-                        url = result.get("href") or result.get("url") or result.get("link", "")
-                        if url:
-                            results.append({
-                                "title": result.get("title", ""),
-                                "url": url,
-                                "snippet": result.get("body", "") or result.get("snippet", ""),
-                            })
+                results = self._text_results(search_results)
 
                 logger.info(f"Fallback search found {len(results)} results")
 
@@ -88,42 +196,55 @@ class WebSearcher:
                 logger.error(f"Fallback search also failed: {fallback_error}")
                 raise WebSearchError(
                     f"Search failed: {str(e)}. Fallback also failed: {str(fallback_error)}",
-                    error_code="SEARCH_FAILED"
+                    error_code="SEARCH_FAILED",
                 )
 
-        return results
+        self._store(cache_key, results)
+        return self._enforce_domains(results, allowed_domains, blocked_domains)
 
     def search_news(
         self,
         query: str,
         num_results: int = 10,
+        allowed_domains: Optional[List[str]] = None,
+        blocked_domains: Optional[List[str]] = None,
     ) -> List[Dict[str, str]]:
-        """Search for news articles"""
-        try:
-            from ddgs import DDGS
-        except ImportError:
-            raise WebSearchError(
-                "ddgs is not installed. Install with: pip install ddgs",
-                error_code="MISSING_DEPENDENCY"
-            )
+        """
+        Search for news articles
 
-        results = []
+        Args:
+            query: Search query
+            num_results: Maximum number of results
+            allowed_domains: Only return articles from these domains
+            blocked_domains: Never return articles from these domains
+
+        Returns:
+            List of articles with title, url, snippet, date and source
+        """
+        query = self._domain_query(query, allowed_domains, blocked_domains)
+
+        cache_key = self._cache_key("news", query, num_results)
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return self._enforce_domains(cached, allowed_domains, blocked_domains)
+
+        ddgs = self._get_client()
 
         try:
-            ddgs = DDGS()
+            self._throttle()
             news_results = ddgs.news(query, max_results=num_results)
-
-            for result in news_results:
-                if isinstance(result, dict):
-                    url = result.get("url") or result.get("href") or result.get("link", "")
-                    if url:
-                        results.append({
-                            "title": result.get("title", ""),
-                            "url": url,
-                            "snippet": result.get("body", "") or result.get("snippet", ""),
-                            "date": result.get("date", ""),
-                            "source": result.get("source", ""),
-                        })
+            results = [
+                {
+                    "title": result.get("title", ""),
+                    "url": url,
+                    "snippet": result.get("body", "") or result.get("snippet", ""),
+                    "date": result.get("date", ""),
+                    "source": result.get("source", ""),
+                }
+                for result in news_results
+                if isinstance(result, dict)
+                and (url := result.get("url") or result.get("href") or result.get("link", ""))
+            ]
 
             logger.info(f"Found {len(results)} news articles for query: {query}")
 
@@ -132,20 +253,12 @@ class WebSearcher:
             # Fallback to regular search if news search fails
             try:
                 logger.info("News search failed, falling back to regular search...")
-                ddgs = DDGS()
+                self._throttle()
                 search_results = ddgs.text(query, max_results=num_results)
-
-                for result in search_results:
-                    if isinstance(result, dict):
-                        url = result.get("href") or result.get("url") or result.get("link", "")
-                        if url:
-                            results.append({
-                                "title": result.get("title", ""),
-                                "url": url,
-                                "snippet": result.get("body", "") or result.get("snippet", ""),
-                                "date": "",
-                                "source": "",
-                            })
+                results = [
+                    {**result, "date": "", "source": ""}
+                    for result in self._text_results(search_results)
+                ]
 
                 logger.info(f"Fallback search found {len(results)} results")
 
@@ -153,37 +266,191 @@ class WebSearcher:
                 logger.error(f"Fallback search also failed: {fallback_error}")
                 raise WebSearchError(
                     f"News search failed: {str(e)}. Fallback also failed: {str(fallback_error)}",
-                    error_code="NEWS_SEARCH_FAILED"
+                    error_code="NEWS_SEARCH_FAILED",
                 )
 
+        self._store(cache_key, results)
+        return self._enforce_domains(results, allowed_domains, blocked_domains)
+
+    async def asearch(
+        self,
+        query: str,
+        num_results: int = 10,
+        allowed_domains: Optional[List[str]] = None,
+        blocked_domains: Optional[List[str]] = None,
+    ) -> List[Dict[str, str]]:
+        """Async variant of search(); the blocking engine call runs on a worker thread"""
+        return await asyncio.to_thread(
+            self.search,
+            query,
+            num_results,
+            allowed_domains=allowed_domains,
+            blocked_domains=blocked_domains,
+        )
+
+    async def asearch_news(
+        self,
+        query: str,
+        num_results: int = 10,
+        allowed_domains: Optional[List[str]] = None,
+        blocked_domains: Optional[List[str]] = None,
+    ) -> List[Dict[str, str]]:
+        """Async variant of search_news(); the blocking engine call runs on a worker thread"""
+        return await asyncio.to_thread(
+            self.search_news,
+            query,
+            num_results,
+            allowed_domains=allowed_domains,
+            blocked_domains=blocked_domains,
+        )
+
+    async def asearch_many(
+        self,
+        queries: List[str],
+        num_results: int = 10,
+        news: bool = False,
+        max_concurrent: int = 4,
+        allowed_domains: Optional[List[str]] = None,
+        blocked_domains: Optional[List[str]] = None,
+    ) -> List[Union[List[Dict[str, str]], BaseException]]:
+        """
+        Run several searches concurrently
+
+        Wall time is bounded by the slowest queries rather than the sum of
+        all of them. The rate limiter, if any, still applies to every call.
+
+        Args:
+            queries: Search queries
+            num_results: Maximum number of results per query
+            news: Search news instead of the web
+            max_concurrent: Maximum searches in flight at once
+            allowed_domains: Only return results from these domains
+            blocked_domains: Never return results from these domains
+
+        Returns:
+            One result list per query, in input order (the exception, usually
+            a WebSearchError, in place of any query that failed)
+        """
+        search = self.asearch_news if news else self.asearch
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def bounded(query: str) -> List[Dict[str, str]]:
+            async with semaphore:
+                return await search(query, num_results, allowed_domains, blocked_domains)
+
+        return list(await asyncio.gather(*(bounded(q) for q in queries), return_exceptions=True))
+
+    async def asearch_all(
+        self,
+        query: str,
+        num_web: int = 10,
+        num_news: int = 10,
+        allowed_domains: Optional[List[str]] = None,
+        blocked_domains: Optional[List[str]] = None,
+    ) -> Dict[str, Union[List[Dict[str, str]], BaseException]]:
+        """
+        Search the web and the news for one query at the same time
+
+        Args:
+            query: Search query
+            num_web: Maximum number of web results
+            num_news: Maximum number of news articles
+            allowed_domains: Only return results from these domains
+            blocked_domains: Never return results from these domains
+
+        Returns:
+            Dictionary with "web" and "news" result lists (the exception in
+            place of a search that failed)
+        """
+        web, news = await asyncio.gather(
+            self.asearch(query, num_web, allowed_domains, blocked_domains),
+            self.asearch_news(query, num_news, allowed_domains, blocked_domains),
+            return_exceptions=True,
+        )
+        return {"web": web, "news": news}
+
+    def search_many(
+        self,
+        queries: List[str],
+        num_results: int = 10,
+        news: bool = False,
+        max_concurrent: int = 4,
+        allowed_domains: Optional[List[str]] = None,
+        blocked_domains: Optional[List[str]] = None,
+    ) -> List[Union[List[Dict[str, str]], BaseException]]:
+        """Run several searches concurrently from synchronous code (see asearch_many)"""
+        if not queries:
+            return []
+
+        search: Callable[..., List[Dict[str, str]]] = self.search_news if news else self.search
+        results: List[Union[List[Dict[str, str]], BaseException]] = []
+        # Threads rather than asyncio.run, so callers inside a running event loop still work
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_concurrent, len(queries))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    search,
+                    query,
+                    num_results,
+                    allowed_domains=allowed_domains,
+                    blocked_domains=blocked_domains,
+                )
+                for query in queries
+            ]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(e)
         return results
 
+    def _enforce_domains(
+        self,
+        results: List[Dict[str, str]],
+        allowed_domains: Optional[List[str]],
+        blocked_domains: Optional[List[str]],
+    ) -> List[Dict[str, str]]:
+        """Drop anything the engine returned despite the site: operators"""
+        if not (allowed_domains or blocked_domains):
+            return results
+        return self.filter_by_domain(results, allowed_domains, blocked_domains)
+
+    @staticmethod
+    def _domain_matcher(domains: List[str]) -> Tuple[Set[str], Tuple[str, ...]]:
+        """Exact names and ".name" suffixes matching a domain or any of its subdomains"""
+        names = {domain.lower().strip(".") for domain in domains}
+        names.discard("")
+        return names, tuple(f".{name}" for name in names)
+
     def filter_by_domain(
         self,
         results: List[Dict[str, str]],
         allowed_domains: Optional[List[str]] = None,
         blocked_domains: Optional[List[str]] = None,
     ) -> List[Dict[str, str]]:
-        """Filter search results by domain"""
-        from urllib.parse import urlparse
+        """Filter search results by domain (a domain also covers its subdomains)"""
+        if not (allowed_domains or blocked_domains):
+            return list(results)
+
+        blocked, blocked_suffixes = self._domain_matcher(blocked_domains or [])
+        allowed, allowed_suffixes = self._domain_matcher(allowed_domains or [])
 
         filtered = []
 
         for result in results:
             url = result.get("url", "")
             try:
-                domain = urlparse(url).netloc.lower()
+                domain = _url_host(url)
 
                 if domain.startswith("www."):
                     domain = domain[4:]
 
-                if blocked_domains:
-                    if any(blocked in domain for blocked in blocked_domains):
-                        continue
+                if blocked and (domain in blocked or domain.endswith(blocked_suffixes)):
+                    continue
 
-                if allowed_domains:
-                    if not any(allowed in domain for allowed in allowed_domains):
-                        continue
+                if allowed and not (domain in allowed or domain.endswith(allowed_suffixes)):
+                    continue
 
                 filtered.append(result)
             except Exception as e:
@@ -1,23 +1,34 @@
 #!/usr/bin/env python3
 """Quick test of the search-based aggregation feature"""
 
-import sys
-import os
-sys.path.insert(0, 'src')
+import asyncio
+import time
 
-from web_summarizer.web_searcher import WebSearcher
+from web_summarizer.web_searcher import WebSearcher, WebSearchError
+
+QUERIES = ["python programming", "rust async", "lxml vs html.parser"]
 
 # Test search
 searcher = WebSearcher(search_engine="duckduckgo")
 
-print("🔍 Testing web search...")
-results = searcher.search("python programming", num_results=3)
+print(f"🔍 Testing web search ({len(QUERIES)} queries at once)...")
+start = time.perf_counter()
+results_list = asyncio.run(searcher.asearch_many(QUERIES, num_results=3))
+elapsed = time.perf_counter() - start
+
+for query, results in zip(QUERIES, results_list):
+    if isinstance(results, WebSearchError):
+        print(f"\n❌ {query}: {results.message}")
+        continue
 
-print(f"\n✅ Found {len(results)} results:\n")
-for i, result in enumerate(results, 1):
-    print(f"{i}. {result['title']}")
-    print(f"   {result['url']}")
-    print(f"   {result['snippet'][:100]}...")
-    print()
+    print(f"\n✅ {query}: found {len(results)} results:\n")
+    for i, result in enumerate(results, 1):
+        print(f"{i}. {result['title']}")
+        print(f"   {result['url']}")
+        print(f"   {result['snippet'][:100]}...")
+        print()
 
+print(
+    f"\n⏱️  {len(QUERIES)} searches took {elapsed:.2f}s (about one search's latency, not the sum)"
+)
 print("\n✨ Search feature working!")
@@ -0,0 +1,319 @@
+"""
+Tests for the web summarizer agent
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from web_summarizer.agent import WebSummarizerAgent
+from web_summarizer.extractor import ContentExtractor, ExtractionError
+from web_summarizer.fetcher import FetchError
+
+
+def _result(summary="A summary.", key_points=None, category=None):
+    """Summarizer output with every SummarizerResult field set"""
+    return {
+        "summary": summary,
+        "key_points": key_points if key_points is not None else ["one"],
+        "citations": None,
+        "category": category,
+        "tokens_used": 10,
+        "model_used": "models/gemini-2.5-flash",
+    }
+
+
+def _agent(**kwargs):
+    agent = WebSummarizerAgent(gemini_api_key="test-key", **kwargs)
+    agent.fetcher = MagicMock()
+    agent.fetcher.fetch.return_value = ("<html></html>", "https://example.com/")
+    agent.extractor = MagicMock()
+    agent.extractor.extract.return_value = ("Body text " * 20, "Title")
+    agent.summarizer = MagicMock()
+    agent.summarizer.summarize.return_value = _result()
+    return agent
+
+
+class TestSummaryCache:
+    def test_repeated_request_is_cached(self):
+        """Test identical requests reuse the first summary"""
+        agent = _agent()
+
+        first = agent.summarize_url("https://example.com")
+        second = agent.summarize_url("https://example.com")
+
+        assert first.success
+        assert second is first
+        assert agent.summarizer.summarize.call_count == 1
+
+    def test_options_are_part_of_key(self):
+        """Test different options are summarized separately"""
+        agent = _agent()
+
+        agent.summarize_url("https://example.com", num_key_points=3)
+        agent.summarize_url("https://example.com", num_key_points=5)
+
+        assert agent.summarizer.summarize.call_count == 2
+
+    def test_failures_are_not_cached(self):
+        """Test failed summaries are retried"""
+        agent = _agent()
+        agent.fetcher.fetch.side_effect = FetchError("boom", error_code="FETCH_FAILED")
+
+        assert not agent.summarize_url("https://example.com").success
+        assert not agent.summarize_url("https://example.com").success
+        assert agent.fetcher.fetch.call_count == 2
+
+    def test_identical_content_is_reused(self):
+        """Test a different URL with the same text skips the AI"""
+        agent = _agent()
+
+        agent.summarize_url("https://example.com/a")
+        response = agent.summarize_url("https://example.com/a?utm_source=feed")
+
+        assert response.success
+        assert agent.fetcher.fetch.call_count == 2
+        assert agent.summarizer.summarize.call_count == 1
+
+    def test_cache_disabled(self):
+        """Test enable_cache=False always summarizes"""
+        agent = _agent(enable_cache=False)
+
+        agent.summarize_url("https://example.com")
+        agent.summarize_url("https://example.com")
+
+        assert agent.summarizer.summarize.call_count == 2
+
+    def test_cached_summary_lookup(self):
+        """Test cached_summary sees summaries and cache_summary feeds summarize"""
+        agent = _agent()
+        assert agent.cached_summary("https://example.com/") is None
+
+        response = agent.summarize_url("https://example.com")
+        assert agent.cached_summary("https://example.com/") is response
+
+        agent.cache_summary("https://example.com/other", None, response)
+        assert agent.summarize_url("https://example.com/other") is response
+        assert agent.fetcher.fetch.call_count == 1
+
+
+class TestSummarizeCombined:
+    def test_single_combined_request(self):
+        """Test several URLs are summarized in one AI request"""
+        agent = _agent()
+        agent.summarizer.summarize_batch.return_value = [
+            _result("First.", ["a"]),
+            _result("Second.", ["b"]),
+        ]
+
+        results = agent.summarize_combined(["https://a.com", "https://b.com"])
+
+        assert [r.data.summary for r in results] == ["First.", "Second."]
+        assert agent.summarizer.summarize_batch.call_count == 1
+        assert agent.summarizer.summarize.call_count == 0
+
+    def test_missing_documents_fall_back(self):
+        """Test documents left out of the combined answer are summarized alone"""
+        agent = _agent()
+        agent.summarizer.summarize_batch.return_value = [_result("First."), None]
+
+        results = agent.summarize_combined(["https://a.com", "https://b.com"])
+
+        assert [r.data.summary for r in results] == ["First.", "A summary."]
+        assert agent.summarizer.summarize.call_count == 1
+
+    def test_fetch_failures_keep_order(self):
+        """Test failed fetches are reported in place"""
+        agent = _agent()
+
+        def fetch(url):
+            if "a.com" in url:
+                raise FetchError("boom", error_code="FETCH_FAILED")
+            return "<html></html>", url
+
+        agent.fetcher.fetch.side_effect = fetch
+
+        results = agent.summarize_combined(["https://a.com", "https://b.com"])
+
+        assert not results[0].success
+        assert results[0].error_code == "FETCH_FAILED"
+        assert results[1].data.summary == "A summary."
+        assert agent.summarizer.summarize_batch.call_count == 0
+
+    def test_batches_are_capped(self):
+        """Test documents are split into batches by count"""
+        agent = _agent()
+        agent.MAX_COMBINED_DOCS = 2
+        agent.summarizer.summarize_batch.side_effect = lambda documents, **kwargs: [
+            _result("S.") for _ in documents
+        ]
+
+        results = agent.summarize_combined([f"https://site{i}.com" for i in range(4)])
+
+        assert all(r.success for r in results)
+        assert agent.summarizer.summarize_batch.call_count == 2
+
+
+class TestSummarizeMany:
+    def test_runs_concurrently_in_order(self):
+        """Test URLs are summarized in parallel and returned in input order"""
+        agent = _agent()
+
+        def fetch(url):
+            time.sleep(0.05)
+            return "<html></html>", url
+
+        agent.fetcher.fetch.side_effect = fetch
+        urls = [f"https://site{i}.com/" for i in range(8)]
+
+        start = time.perf_counter()
+        results = asyncio.run(agent.summarize_many(urls))
+
+        assert time.perf_counter() - start < 0.3
+        assert [str(r.data.url) for r in results] == urls
+
+    def test_invalid_url_reported(self):
+        """Test malformed URLs fail in place without stopping the batch"""
+        agent = _agent()
+
+        results = asyncio.run(agent.summarize_many(["not a url", "https://example.com/"]))
+
+        assert results[0].error_code == "INVALID_URL"
+        assert results[1].success
+
+    def test_cancel_does_not_block_loop(self):
+        """Test cancelling a batch returns without waiting for running fetches"""
+        agent = _agent()
+        release = threading.Event()
+
+        def fetch(url):
+            release.wait(2)
+            return "<html></html>", url
+
+        agent.fetcher.fetch.side_effect = fetch
+
+        async def cancel():
+            task = asyncio.create_task(agent.summarize_many(["https://example.com/"]))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            start = time.perf_counter()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return time.perf_counter() - start
+
+        try:
+            assert asyncio.run(cancel()) < 0.5
+        finally:
+            release.set()
+
+
+class TestExtractionWorkers:
+    def test_extracts_in_worker_process(self):
+        """Test extraction_workers runs the extractor out of process, errors included"""
+        agent = _agent(extraction_workers=1)
+        agent.extractor = ContentExtractor()
+        html = (
+            "<html><head><title>T</title></head><body><article>"
+            + "<p>Worker text.</p>" * 20
+            + "</article></body></html>"
+        )
+
+        try:
+            text, title = agent._extract(html, "https://example.com")
+            assert "Worker text." in text
+            assert title == "T"
+
+            with pytest.raises(ExtractionError) as exc_info:
+                agent._extract("<html><body><p>Too short</p></body></html>", "https://example.com")
+            assert exc_info.value.error_code == "INSUFFICIENT_CONTENT"
+        finally:
+            agent.close()
+
+
+class TestStoredSummaries:
+    def _rag_agent(self):
+        agent = _agent()
+        agent.rag_enabled = True
+        agent.rag_engine = MagicMock()
+        agent.rag_engine.get_summaries.return_value = {}
+        return agent
+
+    def test_stored_summaries_are_reused(self):
+        """Test URLs already in the RAG store skip fetching and the AI"""
+        agent = self._rag_agent()
+        agent.summarize_url("https://example.com/")
+        agent.wait_for_rag_writes()
+        stored_meta = agent.rag_engine.store_summaries.call_args.args[0][0]["metadata"]
+        agent.rag_engine.get_summaries.return_value = {
+            "https://example.com/": {"url": "https://example.com/", **stored_meta}
+        }
+
+        fresh = _agent()
+        fresh.rag_enabled = True
+        fresh.rag_engine = agent.rag_engine
+        results = fresh.summarize_combined(["https://example.com/"])
+
+        assert results[0].data.summary == "A summary."
+        assert fresh.fetcher.fetch.call_count == 0
+
+    def test_other_options_are_not_reused(self):
+        """Test summaries stored with different options are summarized again"""
+        agent = self._rag_agent()
+        agent.summarize_url("https://example.com/", num_key_points=3)
+        agent.wait_for_rag_writes()
+        stored_meta = agent.rag_engine.store_summaries.call_args.args[0][0]["metadata"]
+        agent.rag_engine.get_summaries.return_value = {
+            "https://example.com/": {"url": "https://example.com/", **stored_meta}
+        }
+        agent._summary_cache.clear()
+
+        agent.summarize_combined(["https://example.com/"])
+
+        assert agent.fetcher.fetch.call_count == 2
+
+    def test_refresh_skips_store(self):
+        """Test refresh=True bypasses the cache and the RAG store"""
+        agent = self._rag_agent()
+        agent.summarize_combined(["https://example.com/"])
+
+        agent.summarize_combined(["https://example.com/"], refresh=True)
+
+        assert agent.fetcher.fetch.call_count == 2
+        assert agent.rag_engine.get_summaries.call_count == 1
+
+    def test_writes_are_coalesced(self):
+        """Test summaries queued while the writer is busy land in one write"""
+        agent = self._rag_agent()
+        release = threading.Event()
+        agent.rag_engine.store_summaries.side_effect = lambda batch: release.wait(1)
+
+        agent.summarize_url("https://site0.com/")
+        for i in range(1, 4):
+            agent.summarize_url(f"https://site{i}.com/")
+        release.set()
+        agent.wait_for_rag_writes()
+
+        batches = [c.args[0] for c in agent.rag_engine.store_summaries.call_args_list]
+        assert sum(len(batch) for batch in batches) == 4
+        assert len(batches) <= 2
+
+
+class TestResponseAssembly:
+    def test_category_is_trimmed(self):
+        """Test model-produced categories are normalized once at assembly"""
+        agent = _agent()
+        agent.summarizer.summarize.return_value = _result(category="  Technology \n")
+
+        response = agent.summarize_url("https://example.com")
+
+        assert response.data.category == "Technology"
+
+    def test_blank_category_is_dropped(self):
+        """Test empty or non-string categories become None"""
+        agent = _agent()
+        agent.summarizer.summarize.return_value = _result(category=" ")
+
+        assert agent.summarize_url("https://example.com").data.category is None
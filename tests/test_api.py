@@ -0,0 +1,259 @@
+"""
+Tests for the FastAPI service
+"""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.requests import ClientDisconnect
+
+import api
+from web_summarizer.models import SummaryData, SummaryMetadata, SummaryResponse
+
+URL = "https://example.com/article"
+HELD_URL = "https://example.com/held"
+
+
+def _response(url):
+    """Successful SummaryResponse for a URL"""
+    return SummaryResponse(
+        success=True,
+        data=SummaryData(
+            url=url,
+            title="Title",
+            summary="A summary.",
+            key_points=["one"],
+            metadata=SummaryMetadata(
+                tokens_used=1,
+                processing_time_ms=1,
+                model_used="models/gemini-2.5-flash",
+                content_length=10,
+                extraction_method="readability",
+            ),
+        ),
+    )
+
+
+class _StubAgent:
+    """Stand-in agent answering from memory; HELD_URL waits until release is set"""
+
+    def __init__(self):
+        self.cache = {}
+        self.combined_calls = []
+        self.fail = False
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def cached_summary(self, url, options=None):
+        return self.cache.get(url)
+
+    def cache_summary(self, url, options, response):
+        self.cache[url] = response
+
+    def summarize_combined(self, urls, options=None, **kwargs):
+        self.combined_calls.append(list(urls))
+        self.started.set()
+        if HELD_URL in urls:
+            self.release.wait(5)
+        return [_response(url) for url in urls]
+
+    def summarize(self, request, on_chunk=None):
+        if on_chunk is not None:
+            on_chunk("Hel")
+            on_chunk("lo")
+        if self.fail:
+            raise RuntimeError("model unavailable")
+        return _response(str(request.url))
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def stub_agent(monkeypatch):
+    stub = _StubAgent()
+
+    def init_services(http_session=None):
+        api.agent = stub
+
+    monkeypatch.setattr(api, "agent", None)
+    monkeypatch.setattr(api, "_init_services", init_services)
+    return stub
+
+
+@pytest.fixture
+def client(stub_agent):
+    with TestClient(api.app) as test_client:
+        yield test_client
+
+
+def _ndjson(response):
+    """Decode a newline-delimited JSON body"""
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+class TestSummarize:
+    def test_cache_hit_skips_agent(self, client, stub_agent):
+        """Test a summary cached by the agent is served without summarizing"""
+        stub_agent.cache_summary(URL, None, _response(URL))
+
+        response = client.post("/summarize", json={"url": URL})
+
+        assert response.status_code == 200
+        assert response.json()["data"]["url"] == URL
+        assert stub_agent.combined_calls == []
+
+    def test_concurrent_duplicates_share_one_call(self, client, stub_agent):
+        """Test identical in-flight requests join the first one"""
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            futures = [
+                pool.submit(client.post, "/summarize", json={"url": HELD_URL}) for _ in range(5)
+            ]
+            assert stub_agent.started.wait(5)
+            time.sleep(0.2)  # let the duplicates reach the in-flight future
+            stub_agent.release.set()
+            statuses = [future.result().status_code for future in futures]
+
+        assert statuses == [200] * 5
+        assert stub_agent.combined_calls == [[HELD_URL]]
+
+    def test_duplicates_match_after_normalization(self, client, stub_agent):
+        """Test an http:// spelling of an in-flight URL joins it rather than summarizing again"""
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(client.post, "/summarize", json={"url": HELD_URL})
+            assert stub_agent.started.wait(5)
+            second = pool.submit(
+                client.post, "/summarize", json={"url": HELD_URL.replace("https", "http", 1)}
+            )
+            time.sleep(0.2)  # let the duplicate reach the in-flight future
+            stub_agent.release.set()
+
+            assert [first.result().status_code, second.result().status_code] == [200, 200]
+        assert stub_agent.combined_calls == [[HELD_URL]]
+
+    def test_slow_batch_does_not_block_next(self, client, stub_agent):
+        """Test a request queued behind a slow batch is answered first"""
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            slow = pool.submit(client.post, "/summarize", json={"url": HELD_URL})
+            assert stub_agent.started.wait(5)
+
+            fast = client.post("/summarize", json={"url": URL})
+
+            assert fast.status_code == 200
+            assert not slow.done()
+            stub_agent.release.set()
+            assert slow.result().status_code == 200
+
+    def test_batch_without_options(self, client, stub_agent):
+        """Test queued requests whose options are None are grouped and answered"""
+
+        async def run_batch():
+            future = asyncio.get_running_loop().create_future()
+            await api._run_batch([(api.SummaryRequest(url=URL, options=None), future)])
+            return await future
+
+        response = client.portal.call(run_batch)
+
+        assert response.success
+        assert stub_agent.combined_calls == [[URL]]
+
+    def test_saturated_server_returns_503(self, client, monkeypatch):
+        """Test requests fail fast once every summarization slot is taken"""
+        monkeypatch.setattr(api, "SUMMARIZE_QUEUE_TIMEOUT", 0.05)
+        for _ in range(api.SUMMARIZE_WORKERS * 2):
+            client.portal.call(api._summarize_slots.acquire)
+
+        response = client.post("/summarize", json={"url": URL})
+
+        assert response.status_code == 503
+        assert "overloaded" in response.json()["detail"]
+
+
+class TestSummarizeStream:
+    def test_event_order(self, client):
+        """Test chunks stream first and the result comes last"""
+        response = client.post("/summarize/stream", json={"url": URL})
+
+        events = _ndjson(response)
+        assert response.status_code == 200
+        assert [event["type"] for event in events] == ["chunk", "chunk", "result"]
+        assert "".join(event["text"] for event in events[:-1]) == "Hello"
+        assert events[-1]["success"] is True
+
+    def test_worker_failure_ends_with_error(self, client, stub_agent):
+        """Test a failing worker produces a final error line"""
+        stub_agent.fail = True
+
+        events = _ndjson(client.post("/summarize/stream", json={"url": URL}))
+
+        assert [event["type"] for event in events] == ["chunk", "chunk", "error"]
+        assert "model unavailable" in events[-1]["detail"]
+
+    def test_streams_give_back_their_slot(self, client, stub_agent, monkeypatch):
+        """Test finished and failed streams release their slot"""
+        monkeypatch.setattr(api, "SUMMARIZE_QUEUE_TIMEOUT", 0.05)
+
+        for i in range(api.SUMMARIZE_WORKERS * 2 + 2):
+            stub_agent.fail = bool(i % 2)
+            assert client.post("/summarize/stream", json={"url": URL}).status_code == 200
+
+    def test_disconnect_before_first_chunk_releases_slot(self, client, monkeypatch):
+        """Test a client that leaves before the body starts doesn't leak its slot"""
+        monkeypatch.setattr(api, "SUMMARIZE_QUEUE_TIMEOUT", 0.05)
+
+        async def disconnect():
+            response = await api.summarize_stream(api.SummarizeURLRequest(url=URL))
+
+            async def receive():
+                return {"type": "http.disconnect"}
+
+            async def send(message):
+                raise OSError("client went away")
+
+            with pytest.raises(ClientDisconnect):
+                await response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send)
+
+        for _ in range(api.SUMMARIZE_WORKERS * 2 + 1):
+            client.portal.call(disconnect)
+
+        assert client.post("/summarize/stream", json={"url": URL}).status_code == 200
+
+
+class TestCORS:
+    PREFLIGHT = {
+        "Origin": "https://app.example.com",
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "content-type",
+    }
+
+    def test_preflight_is_answered(self, client):
+        """Test an allowed preflight gets the static CORS headers"""
+        response = client.options("/summarize", headers=self.PREFLIGHT)
+
+        assert response.status_code == 200
+        assert response.text == "OK"
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert "POST" in response.headers["access-control-allow-methods"]
+        assert "content-type" in response.headers["access-control-allow-headers"].lower()
+        assert response.headers["access-control-max-age"] == "600"
+
+    def test_disallowed_preflight_is_rejected(self, client):
+        """Test a preflight for a method outside the policy falls through to a 400"""
+        headers = {**self.PREFLIGHT, "Access-Control-Request-Method": "PUT"}
+
+        response = client.options("/summarize", headers=headers)
+
+        assert response.status_code == 400
+        assert response.text == "Disallowed CORS method"
+
+    def test_simple_request_gets_cors_header(self, client):
+        """Test a cross-origin GET carries the allow-origin header"""
+        response = client.get("/health", headers={"Origin": "https://app.example.com"})
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "*"
@@ -0,0 +1,82 @@
+"""
+Tests for caching helpers
+"""
+
+import time
+
+from web_summarizer.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_set_and_get(self):
+        """Test stored values are returned"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert "key" in cache
+        assert len(cache) == 1
+
+    def test_missing_key_returns_default(self):
+        """Test missing keys return the default"""
+        cache = TTLCache()
+
+        assert cache.get("missing") is None
+        assert cache.get("missing", "default") == "default"
+        assert "missing" not in cache
+
+    def test_expired_entries(self):
+        """Test entries expire after the TTL"""
+        cache = TTLCache(ttl=0.01)
+        cache.set("key", "value")
+        time.sleep(0.02)
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Test least recently used entry is evicted when full"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # Touch "a" so "b" becomes least recently used
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+
+    def test_pop_and_clear(self):
+        """Test removing entries"""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        assert cache.pop("a") == 1
+        assert "a" not in cache
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_byte_budget_eviction(self):
+        """Test least recently used entries are evicted to stay under max_bytes"""
+        cache = TTLCache(maxsize=10, ttl=60, max_bytes=10, sizeof=len)
+        cache.set("a", "aaaa")
+        cache.set("b", "bbbb")
+        cache.set("a", "aaaa")  # replacing counts the new size only
+        cache.set("c", "cccc")
+
+        assert "b" not in cache
+        assert "a" in cache
+        assert "c" in cache
+
+    def test_oversized_value_is_not_stored(self):
+        """Test a value larger than max_bytes is skipped, keeping the rest"""
+        cache = TTLCache(maxsize=10, ttl=60, max_bytes=10, sizeof=len)
+        cache.set("a", "aaaa")
+        cache.set("big", "x" * 11)
+
+        assert "big" not in cache
+        assert "a" in cache
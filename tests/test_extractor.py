@@ -2,6 +2,9 @@
 Tests for content extractor
 """
 
+from unittest.mock import patch
+
+import orjson
 import pytest
 
 from web_summarizer.extractor import ContentExtractor, ExtractionError
@@ -103,6 +106,76 @@ class TestContentExtractor:
         assert "Related articles" not in text
         assert "Main article" in text
 
+    def test_remove_by_id_any_case(self):
+        """Test ad/menu ids are matched case-insensitively"""
+        html = """
+        <html>
+        <body>
+            <article>
+                <p>Main article content that is important and contains valuable information for readers.</p>
+                <div id="Social-Links">Follow us everywhere</div>
+                <p>This should be extracted successfully without the social links block in it.</p>
+                <p>Additional text to ensure we meet the minimum required length for extraction.</p>
+            </article>
+        </body>
+        </html>
+        """
+
+        extractor = ContentExtractor()
+        text, _ = extractor.extract(html, "https://example.com")
+
+        assert "Follow us" not in text
+        assert "social links block" in text
+
+    def test_json_ld_article_body(self):
+        """Test pages with a JSON-LD articleBody skip readability"""
+        body = "Structured article text that the publisher provides in full. " * 10
+        ld = orjson.dumps(
+            {
+                "@graph": [
+                    {"@type": "WebSite"},
+                    {"@type": "NewsArticle", "headline": "Headline", "articleBody": body},
+                ]
+            }
+        )
+        html = f"""
+        <html>
+        <head><title>Page Title | Site</title>
+        <script type="application/ld+json">{ld.decode()}</script></head>
+        <body><article><p>Rendered copy of the article.</p></article></body>
+        </html>
+        """
+
+        extractor = ContentExtractor()
+        with patch("web_summarizer.extractor.Document") as document:
+            text, title = extractor.extract(html, "https://example.com")
+
+        document.assert_not_called()
+        assert text == body.strip()
+        assert title == "Headline"
+
+    def test_json_ld_teaser_falls_back(self):
+        """Test short JSON-LD bodies are ignored in favour of the page content"""
+        ld = orjson.dumps({"@type": "Article", "articleBody": "Subscribe to read."})
+        html = f"""
+        <html>
+        <head><script type="application/ld+json">{ld.decode()}</script></head>
+        <body>
+            <article>
+                <p>This is the actual content we want to keep from the article.</p>
+                <p>And more important text here with useful information for the reader.</p>
+                <p>Additional paragraphs ensure we meet the minimum content length requirement.</p>
+            </article>
+        </body>
+        </html>
+        """
+
+        extractor = ContentExtractor()
+        text, _ = extractor.extract(html, "https://example.com")
+
+        assert "actual content" in text
+        assert "Subscribe" not in text
+
     def test_empty_content_error(self):
         """Test that empty content raises error"""
         extractor = ContentExtractor()
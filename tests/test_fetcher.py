@@ -2,8 +2,17 @@
 Tests for URL fetcher
 """
 
+import asyncio
+import io
+import threading
+import time
+from unittest.mock import MagicMock
+
 import pytest
+import requests
 import requests_mock
+from requests.adapters import BaseAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 
 from web_summarizer.fetcher import FetchError, URLFetcher
 
@@ -127,6 +136,225 @@ class TestURLFetcher:
 
             assert m.request_history[0].headers["User-Agent"] == "CustomAgent/1.0"
 
+    def test_accepts_supported_encodings(self):
+        """Test only encodings urllib3 can decode are advertised"""
+        fetcher = URLFetcher()
 
-# Import requests for timeout test
-import requests
+        with requests_mock.Mocker() as m:
+            m.get("https://example.com", text="<html></html>")
+
+            fetcher.fetch("https://example.com")
+
+            assert m.request_history[0].headers["Accept-Encoding"] == ACCEPT_ENCODING
+
+    def test_shared_session(self):
+        """Test a provided session is reused across fetches"""
+        session = requests.Session()
+        fetcher = URLFetcher(max_redirects=2, session=session)
+
+        assert fetcher.session is session
+        assert session.max_redirects == 2
+
+        with requests_mock.Mocker() as m:
+            m.get("https://example.com/a", text="<html>A</html>")
+            m.get("https://example.com/b", text="<html>B</html>")
+
+            fetcher.fetch("https://example.com/a")
+            fetcher.fetch("https://example.com/b")
+
+            assert m.call_count == 2
+
+    def test_default_session_is_pooled(self):
+        """Test fetchers without a session get a pooled, retrying adapter"""
+        fetcher = URLFetcher()
+        adapter = fetcher.session.get_adapter("https://example.com")
+
+        assert adapter._pool_maxsize == 10
+        assert adapter.max_retries.total == 2
+        assert 503 in adapter.max_retries.status_forcelist
+
+    def test_conditional_get(self):
+        """Test repeat fetches send validators and reuse the page on 304"""
+        fetcher = URLFetcher()
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://example.com",
+                [
+                    {"text": "<html>Cached</html>", "headers": {"ETag": '"v1"'}},
+                    {"status_code": 304},
+                ],
+            )
+
+            fetcher.fetch("https://example.com")
+            html, _ = fetcher.fetch("https://example.com")
+
+            assert html == "<html>Cached</html>"
+            assert m.request_history[1].headers["If-None-Match"] == '"v1"'
+
+    def test_revalidation_cache_is_capped_by_size(self):
+        """Test pages beyond revalidate_bytes are dropped, oldest first"""
+        fetcher = URLFetcher(revalidate_bytes=30)
+
+        with requests_mock.Mocker() as m:
+            for name in ("a", "b"):
+                m.get(
+                    f"https://example.com/{name}",
+                    text=f"<html>{name * 10}</html>",
+                    headers={"ETag": '"v1"'},
+                )
+            fetcher.fetch("https://example.com/a")
+            fetcher.fetch("https://example.com/b")
+            fetcher.fetch("https://example.com/a")
+
+            # Only one 23-character page fits; the repeat of /a went out unconditionally
+            assert "If-None-Match" not in m.request_history[2].headers
+
+    def test_close_leaves_shared_session_open(self):
+        """Test close() only closes a session the fetcher created"""
+        shared = MagicMock()
+        URLFetcher(session=shared).close()
+        shared.close.assert_not_called()
+
+        fetcher = URLFetcher()
+        fetcher.session = MagicMock()
+        fetcher.close()
+        fetcher.session.close.assert_called_once()
+
+    def test_large_body_is_capped(self):
+        """Test reading stops at max_bytes"""
+        fetcher = URLFetcher(max_bytes=1000)
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://example.com",
+                text="<html>" + "x" * 5000 + "</html>",
+                headers={"Content-Type": "text/html; charset=utf-8"},
+            )
+
+            html, _ = fetcher.fetch("https://example.com")
+
+            assert len(html) == 1000
+
+    def test_binary_content_rejected(self):
+        """Test non-HTML responses are rejected before the body is read"""
+        fetcher = URLFetcher()
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://example.com/report.pdf",
+                content=b"%PDF-1.7",
+                headers={"Content-Type": "application/pdf"},
+            )
+
+            with pytest.raises(FetchError) as exc_info:
+                fetcher.fetch("https://example.com/report.pdf")
+
+            assert exc_info.value.error_code == "UNSUPPORTED_CONTENT_TYPE"
+
+    def test_charset_decoding(self):
+        """Test the declared charset is used and UTF-8 is the default"""
+        fetcher = URLFetcher()
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://example.com/latin",
+                content="<p>caf\u00e9</p>".encode("latin-1"),
+                headers={"Content-Type": "text/html; charset=ISO-8859-1"},
+            )
+            m.get(
+                "https://example.com/utf8",
+                content="<p>caf\u00e9</p>".encode("utf-8"),
+                headers={"Content-Type": "text/html"},
+            )
+
+            assert "caf\u00e9" in fetcher.fetch("https://example.com/latin")[0]
+            assert "caf\u00e9" in fetcher.fetch("https://example.com/utf8")[0]
+
+
+class _BarrierAdapter(BaseAdapter):
+    """Transport that answers only once `parties` requests are in flight together"""
+
+    def __init__(self, parties):
+        super().__init__()
+        self.barrier = threading.Barrier(parties, timeout=10)
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            self.barrier.wait()
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "text/html"
+        response.raw = io.BytesIO(f"<html>{request.url}</html>".encode())
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+class TestFetchMany:
+    def test_concurrent_fetch_batch(self):
+        """Test a batch of pages is fetched with every request in flight at once, in input order"""
+        adapter = _BarrierAdapter(parties=50)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        fetcher = URLFetcher(session=session)
+        urls = [f"https://example.com/{i}" for i in range(50)]
+
+        results = asyncio.run(fetcher.afetch_many(urls, max_concurrency=50))
+
+        # A serialized fetch would break the barrier and come back as a FetchError
+        assert [result[1] for result in results] == urls
+        assert adapter.peak == 50
+
+    def test_failures_are_returned_in_place(self):
+        """Test a failed URL yields its FetchError without stopping the batch"""
+        fetcher = URLFetcher()
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://example.com/ok",
+                text="<html>ok</html>",
+                headers={"Content-Type": "text/html"},
+            )
+            m.get("https://example.com/missing", status_code=404)
+
+            ok, missing = asyncio.run(
+                fetcher.afetch_many(["https://example.com/ok", "https://example.com/missing"])
+            )
+
+        assert ok[0] == "<html>ok</html>"
+        assert isinstance(missing, FetchError)
+
+    def test_cancel_does_not_block_loop(self):
+        """Test cancelling a batch returns without waiting for fetches in flight"""
+        adapter = _BarrierAdapter(parties=2)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        fetcher = URLFetcher(session=session)
+
+        async def cancel():
+            task = asyncio.create_task(fetcher.afetch_many(["https://example.com/held"]))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            start = time.perf_counter()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return time.perf_counter() - start
+
+        try:
+            assert asyncio.run(cancel()) < 0.5
+        finally:
+            adapter.barrier.abort()
@@ -124,3 +124,24 @@ class TestSummaryResponse:
         """Test that success=False requires error"""
         with pytest.raises(ValidationError):
             SummaryResponse(success=False, error=None)
+
+    def test_derived_fields_are_cached(self):
+        """Test word_count and key_points_text are computed once and kept out of dumps"""
+        metadata = SummaryMetadata(
+            tokens_used=10,
+            processing_time_ms=20,
+            model_used="models/gemini-2.5-flash",
+            content_length=50,
+            extraction_method="readability",
+        )
+        data = SummaryData(
+            url="https://example.com",
+            summary="Three word summary.",
+            key_points=["Point 1", "Point 2"],
+            metadata=metadata,
+        )
+
+        assert data.word_count == 3
+        assert data.key_points_text == "Point 1; Point 2"
+        assert data.key_points_text is data.key_points_text
+        assert "word_count" not in data.model_dump()
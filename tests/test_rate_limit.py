@@ -0,0 +1,49 @@
+"""
+Tests for rate limiting
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from web_summarizer.rate_limit import RateLimiter
+
+
+class TestRateLimiter:
+    def test_burst_is_immediate(self):
+        """Test calls within the burst do not wait"""
+        limiter = RateLimiter(requests_per_second=5)
+
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire()
+
+        assert time.monotonic() - start < 0.1
+
+    def test_waits_when_exhausted(self):
+        """Test calls beyond the burst are spaced out at the configured rate"""
+        limiter = RateLimiter(requests_per_second=20, burst=1)
+        limiter.acquire()
+
+        start = time.monotonic()
+        limiter.acquire()
+
+        assert time.monotonic() - start >= 0.04
+
+    def test_acquire_async(self):
+        """Test the async variant also waits for a token"""
+        limiter = RateLimiter(requests_per_second=20, burst=1)
+
+        async def acquire_twice():
+            await limiter.acquire_async()
+            start = time.monotonic()
+            await limiter.acquire_async()
+            return time.monotonic() - start
+
+        assert asyncio.run(acquire_twice()) >= 0.04
+
+    def test_invalid_rate(self):
+        """Test a non-positive rate is rejected"""
+        with pytest.raises(ValueError):
+            RateLimiter(requests_per_second=0)
@@ -0,0 +1,236 @@
+"""
+Tests for spreadsheet generation
+"""
+
+from datetime import date, datetime
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+
+from web_summarizer.models import SummaryData, SummaryMetadata, SummaryResponse
+from web_summarizer.spreadsheet_generator import SpreadsheetGenerator
+from web_summarizer.topic_aggregator import TopicAggregator
+
+
+def _aggregated(rows):
+    return {
+        "topic": "Testing",
+        "total_sources": rows,
+        "successful_summaries": rows,
+        "failed_summaries": 0,
+        "generated_at": "2026-01-01T00:00:00",
+        "platforms": ["twitter"],
+        "data": [
+            {
+                "source_url": f"https://example.com/{i}",
+                "title": f"Title {i}",
+                "summary": "A summary, with a comma",
+                "twitter_post": "Post",
+            }
+            for i in range(rows)
+        ],
+    }
+
+
+class TestIterCSV:
+    def test_matches_generate_csv(self):
+        """Test streamed CSV is identical to the materialized CSV"""
+        generator = SpreadsheetGenerator()
+        data = _aggregated(50)
+
+        streamed = b"".join(generator.iter_csv(data, chunk_size=256)).decode("utf-8")
+
+        assert streamed == generator.generate_csv(data)
+
+    def test_rows_are_coalesced(self):
+        """Test small rows are yielded together rather than one per chunk"""
+        generator = SpreadsheetGenerator()
+
+        chunks = list(generator.iter_csv(_aggregated(50)))
+
+        assert len(chunks) == 1
+
+    def test_file_matches_string(self, tmp_path):
+        """Test CSV written to a path matches the returned CSV string"""
+        generator = SpreadsheetGenerator()
+        data = _aggregated(20)
+        path = tmp_path / "out" / "data.csv"
+
+        assert generator.generate_csv(data, str(path)) == str(path)
+        assert path.read_bytes().decode("utf-8") == generator.generate_csv(data)
+
+    def test_rows_may_be_streamed(self):
+        """Test a generator of rows gives the same CSV as a list, across chunks"""
+        generator = SpreadsheetGenerator()
+        data = _aggregated(25)
+        streamed = dict(data, data=(row for row in data["data"]))
+
+        assert generator.generate_csv(streamed, chunk_size=10) == generator.generate_csv(data)
+
+    def test_empty_data_raises_immediately(self):
+        """Test missing data fails before iteration starts"""
+        generator = SpreadsheetGenerator()
+
+        with pytest.raises(ValueError):
+            generator.iter_csv({"data": []})
+
+
+class TestGenerateExcel:
+    def test_workbook_contents(self):
+        """Test the streamed workbook keeps headers, rows, styling and metadata"""
+        openpyxl = pytest.importorskip("openpyxl")
+        output = BytesIO()
+
+        SpreadsheetGenerator().generate_excel(_aggregated(3), output, include_metadata=False)
+
+        wb = openpyxl.load_workbook(BytesIO(output.getvalue()))
+        assert wb.sheetnames == ["Social Media Content", "Metadata"]
+        ws = wb["Social Media Content"]
+        assert ws["A1"].value == "Source URL"
+        assert ws["A1"].font.bold
+        assert ws.freeze_panes == "A2"
+        assert ws.max_row == 4
+        assert ws["B4"].value == "Title 2"
+        assert ws["F2"].value == "Post"
+        assert ws["F2"].alignment.wrap_text
+        assert ws.column_dimensions["A"].width == 50
+
+        meta = wb["Metadata"]
+        assert meta["A1"].value == "Topic"
+        assert meta["A1"].font.bold
+        assert meta["B6"].value == "twitter"
+
+    def test_numbers_and_escaping(self):
+        """Test the raw XML writer keeps numbers numeric and escapes markup"""
+        openpyxl = pytest.importorskip("openpyxl")
+        data = _aggregated(1)
+        data["data"][0].update(title="A & <B>", twitter_chars=42)
+        output = BytesIO()
+
+        SpreadsheetGenerator().generate_excel(data, output, include_metadata=False)
+
+        ws = openpyxl.load_workbook(BytesIO(output.getvalue()))["Social Media Content"]
+        assert ws["B2"].value == "A & <B>"
+        assert ws["H2"].value == 42
+
+    def test_exotic_values_use_openpyxl(self):
+        """Test values the raw writer cannot encode fall back to openpyxl"""
+        pytest.importorskip("openpyxl")
+        generator = SpreadsheetGenerator()
+        data = _aggregated(1)
+        data["data"][0]["timestamp"] = date(2026, 1, 1)
+
+        with patch.object(generator, "_generate_xlsx_fast") as fast:
+            generator.generate_excel(data, BytesIO())
+
+        fast.assert_not_called()
+
+    def test_aggregator_rows_use_raw_writer(self):
+        """Test real TopicAggregator rows, datetime timestamps included, take the raw writer"""
+        openpyxl = pytest.importorskip("openpyxl")
+        generator = SpreadsheetGenerator()
+        timestamp = datetime(2026, 1, 2, 3, 4, 5)
+        summary = SummaryResponse(
+            success=True,
+            data=SummaryData(
+                url="https://example.com/a",
+                title="Title",
+                summary="A summary.",
+                key_points=["one"],
+                metadata=SummaryMetadata(
+                    timestamp=timestamp,
+                    tokens_used=1,
+                    processing_time_ms=1,
+                    model_used="models/gemini-2.5-flash",
+                    content_length=10,
+                    extraction_method="readability",
+                ),
+            ),
+        )
+        rows, _ = TopicAggregator(agent=None)._build_rows("Testing", ["twitter"], [summary])
+        data = dict(_aggregated(0), data=rows)
+        output = BytesIO()
+
+        with patch.object(
+            generator, "_generate_xlsx_fast", wraps=generator._generate_xlsx_fast
+        ) as fast:
+            generator.generate_excel(data, output)
+
+        fast.assert_called_once()
+        ws = openpyxl.load_workbook(BytesIO(output.getvalue()))["Social Media Content"]
+        assert ws["L2"].value == timestamp
+        assert ws["L2"].number_format == "yyyy-mm-dd h:mm:ss"
+
+    def test_streamed_rows_across_chunks(self):
+        """Test generator input is written in chunks; odd values after the first chunk become text"""
+        openpyxl = pytest.importorskip("openpyxl")
+        data = _aggregated(5)
+        data["data"][4]["timestamp"] = date(2026, 1, 1)
+        streamed = dict(data, data=iter(data["data"]))
+        output = BytesIO()
+
+        SpreadsheetGenerator().generate_excel(streamed, output, chunk_size=2)
+
+        ws = openpyxl.load_workbook(BytesIO(output.getvalue()))["Social Media Content"]
+        assert ws.max_row == 6
+        assert ws["B6"].value == "Title 4"
+        assert ws["L6"].value == "2026-01-01"
+
+    @pytest.mark.parametrize("bad_row", [0, 4])
+    @pytest.mark.parametrize("fast", [True, False])
+    def test_control_characters_are_stripped(self, bad_row, fast):
+        """Test both writers drop XML-illegal characters, in or after the first chunk"""
+        openpyxl = pytest.importorskip("openpyxl")
+        generator = SpreadsheetGenerator()
+        data = _aggregated(5)
+        data["topic"] = "Test\x0bing"
+        data["data"][bad_row]["title"] = "Bad\x00 \x1ftitle"
+        if not fast:
+            data["data"][0]["timestamp"] = date(2026, 1, 1)
+        streamed = dict(data, data=iter(data["data"]))
+        output = BytesIO()
+
+        with patch.object(
+            generator, "_generate_xlsx_openpyxl", wraps=generator._generate_xlsx_openpyxl
+        ) as slow:
+            generator.generate_excel(streamed, output, chunk_size=2)
+
+        assert slow.called is not fast
+        workbook = openpyxl.load_workbook(BytesIO(output.getvalue()))
+        assert workbook["Social Media Content"][f"B{bad_row + 2}"].value == "Bad title"
+        assert workbook["Metadata"]["B1"].value == "Testing"
+
+
+class TestGeneratePDF:
+    def test_streamed_articles(self):
+        """Test article flowables are fed in batches without losing any articles"""
+        pytest.importorskip("reportlab")
+        data = _aggregated(120)
+        for row in data["data"]:
+            row["key_points"] = "a; b"
+        streamed = dict(data, data=iter(data["data"]))
+        listed, stream_out = BytesIO(), BytesIO()
+
+        SpreadsheetGenerator().generate_pdf(data, listed)
+        SpreadsheetGenerator().generate_pdf(streamed, stream_out)
+
+        pages = stream_out.getvalue().count(b"/Type /Page\n")
+        assert pages == listed.getvalue().count(b"/Type /Page\n")
+        assert pages == 61
+
+    def test_markup_in_content_is_escaped(self):
+        """Test model and user text containing <, > and & renders instead of breaking the parser"""
+        pytest.importorskip("reportlab")
+        data = _aggregated(2)
+        data.update(
+            master_summary="Less < more & <b>bold", social_media_posts={"twitter": "A & <B>\nline"}
+        )
+        for row in data["data"]:
+            row["key_points"] = "a & b"
+        data["data"][0].update(title="<i>Unclosed", summary="x < y")
+        output = BytesIO()
+
+        SpreadsheetGenerator().generate_pdf(data, output)
+
+        assert output.getvalue().startswith(b"%PDF")
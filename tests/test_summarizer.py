@@ -0,0 +1,152 @@
+"""
+Tests for AI summarizer
+"""
+
+import asyncio
+import pickle
+import subprocess
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from web_summarizer.summarizer import AISummarizer, SummarizationError
+
+
+def _response(text, prompt_tokens=90, output_tokens=10):
+    response = MagicMock()
+    response.text = text
+    response.usage_metadata.prompt_token_count = prompt_tokens
+    response.usage_metadata.candidates_token_count = output_tokens
+    return response
+
+
+class TestAISummarizer:
+    def test_model_handles_are_reused(self):
+        """Test one GenerativeModel is built per model name"""
+        summarizer = AISummarizer(api_key="test-key")
+
+        model = summarizer._get_model("models/gemini-2.5-flash")
+
+        assert summarizer._get_model("models/gemini-2.5-flash") is model
+        assert summarizer._get_model("models/gemini-2.5-pro") is not model
+
+    @patch("web_summarizer.summarizer.genai.GenerativeModel")
+    def test_summarize_batch_aligns_results(self, model_cls):
+        """Test combined results are matched to documents by id"""
+        model_cls.return_value.generate_content.return_value = _response(
+            '[{"id": 1, "summary": "B", "key_points": []},'
+            ' {"id": 0, "summary": "A", "key_points": []},'
+            ' {"id": 9, "summary": "stray"}]'
+        )
+        summarizer = AISummarizer(api_key="test-key")
+
+        results = summarizer.summarize_batch([("a" * 60, "A"), ("b" * 60, None), ("c" * 60, None)])
+
+        assert [r["summary"] if r else None for r in results] == ["A", "B", None]
+        assert results[0]["tokens_used"] == 50
+        assert model_cls.call_count == 1
+
+    @patch("web_summarizer.summarizer.genai.GenerativeModel")
+    def test_summarize_batch_errors(self, model_cls):
+        """Test request failures raise SummarizationError"""
+        model_cls.return_value.generate_content.side_effect = RuntimeError("quota exceeded")
+        summarizer = AISummarizer(api_key="test-key")
+
+        with pytest.raises(SummarizationError) as exc_info:
+            summarizer.summarize_batch([("a" * 60, "A")])
+
+        assert exc_info.value.error_code == "AI_API_ERROR"
+
+    def test_extract_from_text_finds_first_object(self):
+        """Test fallback parsing skips prose and braces inside strings"""
+        summarizer = AISummarizer(api_key="test-key")
+        text = 'Here you go: {"summary": "Uses {braces} and \\"quotes\\"", "key_points": []} Hope {this} helps.'
+
+        result = summarizer._extract_from_text(text)
+
+        assert result == {"summary": 'Uses {braces} and "quotes"', "key_points": []}
+
+    def test_extract_from_text_without_json(self):
+        """Test fallback returns a basic structure when no object parses"""
+        summarizer = AISummarizer(api_key="test-key")
+
+        result = summarizer._extract_from_text("No JSON here {unterminated")
+
+        assert result["category"] == "Unknown"
+        assert result["summary"] == "No JSON here {unterminated"
+
+    @patch("web_summarizer.summarizer.genai.GenerativeModel")
+    def test_summarize_many_runs_concurrently(self, model_cls):
+        """Test async summaries overlap and failures are returned in place"""
+
+        async def generate(prompt, **kwargs):
+            await asyncio.sleep(0.05)
+            return _response('{"summary": "S", "key_points": []}')
+
+        model_cls.return_value.generate_content_async.side_effect = generate
+        summarizer = AISummarizer(api_key="test-key")
+        items = [{"text": "x" * 60}] * 6 + [{"text": "short"}]
+
+        start = time.perf_counter()
+        results = asyncio.run(summarizer.summarize_many(items, concurrency=6))
+
+        assert time.perf_counter() - start < 0.2
+        assert [r["summary"] for r in results[:6]] == ["S"] * 6
+        assert isinstance(results[6], SummarizationError)
+        assert results[6].error_code == "TEXT_TOO_SHORT"
+
+    def test_error_survives_pickling(self):
+        """Test SummarizationError keeps its slot fields across processes"""
+        error = pickle.loads(pickle.dumps(SummarizationError("boom", error_code="AI_TIMEOUT")))
+
+        assert (error.message, error.error_code, str(error)) == ("boom", "AI_TIMEOUT", "boom")
+
+    @patch("web_summarizer.summarizer.genai.GenerativeModel")
+    def test_long_text_is_cut_to_token_budget(self, model_cls):
+        """Test text over max_input_tokens is truncated at a word boundary before sending"""
+        model_cls.return_value.generate_content.return_value = _response(
+            '{"summary": "S", "key_points": []}'
+        )
+        summarizer = AISummarizer(api_key="test-key")
+
+        summarizer.summarize("word " * 1000, max_input_tokens=100)
+
+        prompt = model_cls.return_value.generate_content.call_args.args[0]
+        content = prompt.split("Content:\n")[1].split("\n\nProvide")[0]
+        assert content == "word " * 79 + "word"
+
+    @patch("web_summarizer.summarizer.genai.GenerativeModel")
+    def test_short_text_is_sent_whole(self, model_cls):
+        """Test text within budget, or with the budget disabled, is not cut"""
+        model_cls.return_value.generate_content.return_value = _response(
+            '{"summary": "S", "key_points": []}'
+        )
+        summarizer = AISummarizer(api_key="test-key")
+
+        summarizer.summarize("word " * 1000, max_input_tokens=None)
+
+        prompt = model_cls.return_value.generate_content.call_args.args[0]
+        assert prompt.split("Content:\n")[1].startswith("word " * 1000)
+
+    @patch("web_summarizer.summarizer.genai.GenerativeModel")
+    def test_generate_text_asks_for_prose(self, model_cls):
+        """Test free-form prompts reuse the model handle but request plain text"""
+        model_cls.return_value.generate_content.return_value = _response("  A master summary.\n")
+        summarizer = AISummarizer(api_key="test-key")
+
+        text = summarizer.generate_text("Summarize these")
+
+        kwargs = model_cls.return_value.generate_content.call_args.kwargs
+        assert text == "A master summary."
+        assert kwargs["generation_config"] == {"response_mime_type": "text/plain"}
+
+    def test_gemini_sdk_is_imported_lazily(self):
+        """Test importing the package does not import google.generativeai"""
+        code = "import sys, web_summarizer; print('google.generativeai' in sys.modules)"
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert out.stdout.strip() == "False"
@@ -0,0 +1,281 @@
+"""
+Tests for topic aggregation
+"""
+
+import asyncio
+import threading
+import time
+from collections import Counter
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from web_summarizer.topic_aggregator import TopicAggregator, _unique_urls
+
+
+class _TrackingAgent:
+    """Stand-in agent recording peak concurrency per host"""
+
+    def __init__(self):
+        self.active = Counter()
+        self.peak = Counter()
+        self._lock = threading.Lock()
+
+    def summarize_url(self, url):
+        host = url.split("/")[2]
+        with self._lock:
+            self.active[host] += 1
+            self.peak[host] = max(self.peak[host], self.active[host])
+        time.sleep(0.02)
+        with self._lock:
+            self.active[host] -= 1
+        return url
+
+
+class TestGatherSummaries:
+    def test_preserves_input_order(self):
+        """Test results come back in the order URLs were given"""
+        aggregator = TopicAggregator(_TrackingAgent())
+        urls = [f"https://site{i}.com/a" for i in range(5)]
+
+        results = asyncio.run(aggregator._gather_summaries(urls, max_workers=5))
+
+        assert results == urls
+
+    def test_per_host_limit(self):
+        """Test no more than max_per_host URLs from one site run at once"""
+        agent = _TrackingAgent()
+        aggregator = TopicAggregator(agent)
+        urls = [f"https://busy.com/{i}" for i in range(6)] + ["https://other.com/a"]
+
+        asyncio.run(aggregator._gather_summaries(urls, max_workers=10, max_per_host=2))
+
+        assert agent.peak["busy.com"] == 2
+        assert agent.peak["other.com"] == 1
+
+    def test_sync_path_uses_same_limits(self):
+        """Test the synchronous fetch path keeps input order and the per-host limit"""
+        agent = _TrackingAgent()
+        aggregator = TopicAggregator(agent, combine_summaries=False)
+        urls = [f"https://busy.com/{i}" for i in range(4)] + ["https://other.com/a"]
+
+        results = aggregator._fetch_summaries(urls, max_workers=5, max_per_host=2)
+
+        assert results == urls
+        assert agent.peak["busy.com"] == 2
+
+    def test_sync_path_inside_running_loop(self):
+        """Test the synchronous fetch path works when called from a running event loop"""
+        aggregator = TopicAggregator(_TrackingAgent(), combine_summaries=False)
+        urls = [f"https://site{i}.com/a" for i in range(3)]
+
+        async def call_sync():
+            return aggregator._fetch_summaries(urls, max_workers=3)
+
+        assert asyncio.run(call_sync()) == urls
+
+
+class TestHashtags:
+    def test_topic_words_come_first(self):
+        """Test hashtags are deduplicated with topic words first in a stable order"""
+        aggregator = TopicAggregator(_TrackingAgent())
+
+        tags = aggregator._generate_hashtags("machine-learning for_edge devices devices", [])
+
+        assert tags == [
+            "#Machine",
+            "#Learning",
+            "#Edge",
+            "#Devices",
+            "#TechNews",
+            "#Innovation",
+            "#DigitalTransformation",
+        ]
+
+    def test_long_topics_are_capped(self):
+        """Test at most 10 hashtags are returned"""
+        aggregator = TopicAggregator(_TrackingAgent())
+
+        tags = aggregator._generate_hashtags(" ".join(f"word{i}" for i in range(12)), [])
+
+        assert len(tags) == 10
+        assert tags[0] == "#Word0"
+
+    def test_frequent_key_point_words_are_added(self):
+        """Test the most common key point words, minus stopwords, follow the topic words"""
+        aggregator = TopicAggregator(_TrackingAgent())
+        key_points = [
+            "Quantum chips scale with error correction.",
+            "Error rates drop as quantum hardware matures.",
+            "Vendors ship quantum error mitigation in 2025.",
+        ]
+
+        tags = aggregator._generate_hashtags("quantum computing", key_points)
+
+        assert tags[:4] == ["#Quantum", "#Computing", "#Error", "#Chips"]
+        assert "#With" not in tags and "#2025" not in tags
+        assert tags[-3:] == ["#TechNews", "#Innovation", "#DigitalTransformation"]
+
+
+class TestBuildPost:
+    def test_long_posts_are_truncated(self):
+        """Test posts over the limit are cut and marked with an ellipsis"""
+        post = TopicAggregator._build_post(["a" * 20, "b" * 20], 30)
+
+        assert post == "a" * 20 + "\n" + "b" * 6 + "..."
+        assert len(post) == 30
+
+    def test_short_posts_are_joined(self):
+        """Test posts within the limit, or without one, are left whole"""
+        assert TopicAggregator._build_post(["one", "", "two"], 30) == "one\n\ntwo"
+        assert TopicAggregator._build_post(["x" * 100]) == "x" * 100
+
+
+class TestUniqueUrls:
+    def test_equivalent_urls_collapse(self):
+        """Test case, trailing slashes and utm_* tags do not make a page distinct"""
+        urls = [
+            "https://Example.com/news/",
+            "https://example.com/news?utm_source=feed",
+            "https://example.com/news?id=2",
+            "https://example.com/News",
+        ]
+
+        unique, positions = _unique_urls(urls)
+
+        assert unique == [
+            "https://Example.com/news/",
+            "https://example.com/news?id=2",
+            "https://example.com/News",
+        ]
+        assert positions == [0, 0, 1, 2]
+
+    def test_duplicates_summarized_once(self):
+        """Test repeated URLs are summarized once and fanned back out in place"""
+        agent = _TrackingAgent()
+        calls = []
+        agent.summarize_url = lambda url: calls.append(url) or url
+        aggregator = TopicAggregator(agent, combine_summaries=False)
+        aggregator._build_result = lambda topic, urls, platforms, summaries: summaries
+
+        summaries = aggregator.aggregate_topic(
+            "t", ["https://a.com/x", "https://b.com/", "https://a.com/x/"]
+        )
+
+        assert sorted(calls) == ["https://a.com/x", "https://b.com/"]
+        assert summaries == ["https://a.com/x", "https://b.com/", "https://a.com/x"]
+
+
+class TestStreamTopic:
+    def _summary(self, url):
+        return SimpleNamespace(
+            success=True,
+            error=None,
+            data=SimpleNamespace(url=url, title="T", summary="S.", key_points=["k"]),
+        )
+
+    def test_combined_stream_dedups_and_fans_out(self):
+        """Test distinct pages go through iter_combined once and every input URL gets an event"""
+        agent = MagicMock()
+        agent.iter_combined.side_effect = lambda urls, **kwargs: (
+            (i, self._summary(url)) for i, url in enumerate(urls)
+        )
+        aggregator = TopicAggregator(agent)
+        consolidated = []
+        aggregator._consolidate = lambda topic, summaries, platforms: (
+            consolidated.append(summaries) or ("Master.", {"twitter": "Post"})
+        )
+
+        events = list(
+            aggregator.stream_topic(
+                "t",
+                ["https://a.com/x", "https://b.com/", "https://a.com/x/"],
+                force_refresh=True,
+            )
+        )
+
+        assert agent.iter_combined.call_args.args[0] == ["https://a.com/x", "https://b.com/"]
+        assert agent.iter_combined.call_args.kwargs["refresh"] is True
+        assert sorted(e["idx"] for e in events if e["type"] == "article") == [0, 1, 2]
+        assert [s.data.url for s in consolidated[0]] == [
+            "https://a.com/x",
+            "https://b.com/",
+            "https://a.com/x",
+        ]
+        assert [e["type"] for e in events[3:]] == ["master_summary", "post", "done"]
+        assert events[-1]["successful_summaries"] == 3
+
+    def test_per_url_stream_keeps_host_limit(self):
+        """Test the per-URL stream path caps concurrency per host"""
+        agent = _TrackingAgent()
+        aggregator = TopicAggregator(agent, combine_summaries=False)
+        urls = [f"https://busy.com/{i}" for i in range(6)] + ["https://other.com/a"]
+
+        pairs = list(aggregator._iter_summaries(urls, max_workers=10, max_per_host=2))
+
+        assert sorted(idx for idx, _ in pairs) == list(range(7))
+        assert agent.peak["busy.com"] == 2
+
+
+class TestBuildResult:
+    def test_master_summary_overlaps_rows(self):
+        """Test the master summary request runs while per-source rows are built"""
+        aggregator = TopicAggregator(_TrackingAgent())
+
+        def slow_master(summaries, topic):
+            time.sleep(0.1)
+            return "Master."
+
+        def slow_rows(topic, platforms, summaries):
+            time.sleep(0.1)
+            return [], []
+
+        aggregator._generate_master_summary = slow_master
+        aggregator._build_rows = slow_rows
+
+        start = time.perf_counter()
+        result = aggregator._build_result("topic", [], ["twitter"], [])
+
+        assert time.perf_counter() - start < 0.18
+        assert result["master_summary"] == "Master."
+        assert result["social_media_posts"]["twitter"].startswith("Master.")
+
+
+class TestMasterSummary:
+    def _summaries(self, count, size):
+        return [
+            SimpleNamespace(success=True, data=SimpleNamespace(title=f"T{i}", summary="x" * size))
+            for i in range(count)
+        ]
+
+    def test_small_input_is_one_request(self):
+        """Test summaries that fit one prompt are master-summarized in a single call"""
+        agent = MagicMock()
+        agent.summarizer.generate_text.return_value = "Master."
+        aggregator = TopicAggregator(agent)
+
+        result = aggregator._generate_master_summary(self._summaries(3, 100), "topic")
+
+        assert result == "Master."
+        assert agent.summarizer.generate_text.call_count == 1
+
+    def test_large_input_is_map_reduced(self):
+        """Test oversized input is summarized in groups, then the group summaries are combined"""
+        agent = MagicMock()
+        agent.summarizer.generate_text.return_value = "Partial."
+        aggregator = TopicAggregator(agent)
+        aggregator.MAX_MASTER_CHARS = 1000
+
+        aggregator._generate_master_summary(self._summaries(6, 400), "topic")
+
+        prompts = [c.args[0] for c in agent.summarizer.generate_text.call_args_list]
+        assert len(prompts) == 4
+        assert all(len(p) < 1500 for p in prompts)
+        assert "Source group 3:\nPartial." in prompts[-1]
+
+    def test_failure_falls_back_to_first_summary(self):
+        """Test a failed request returns the first source summary"""
+        agent = MagicMock()
+        agent.summarizer.generate_text.side_effect = RuntimeError("quota")
+        aggregator = TopicAggregator(agent)
+
+        assert aggregator._generate_master_summary(self._summaries(2, 100), "topic") == "x" * 100
@@ -0,0 +1,256 @@
+"""
+Tests for web search
+"""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+from urllib.parse import urlparse
+
+from web_summarizer.web_searcher import WebSearcher, WebSearchError, _url_host
+
+
+def _hit(url):
+    return {"title": "Title", "href": url, "body": "Snippet"}
+
+
+class TestDomainFilters:
+    def test_domains_are_pushed_into_query(self):
+        """Test allowed and blocked domains become site: operators"""
+        client = MagicMock()
+        client.text.return_value = [_hit("https://docs.python.org/3/")]
+        searcher = WebSearcher(client=client)
+
+        searcher.search(
+            "asyncio",
+            allowed_domains=["python.org", "realpython.com"],
+            blocked_domains=["spam.com"],
+        )
+
+        query = client.text.call_args.args[0]
+        assert query == "asyncio (site:python.org OR site:realpython.com) -site:spam.com"
+
+    def test_unhonored_operators_are_filtered(self):
+        """Test results outside the allowed domains are still dropped"""
+        client = MagicMock()
+        client.news.return_value = [
+            {"title": "A", "url": "https://www.python.org/news"},
+            {"title": "B", "url": "https://other.com/news"},
+        ]
+        searcher = WebSearcher(client=client)
+
+        results = searcher.search_news("release", allowed_domains=["python.org"])
+
+        assert [r["url"] for r in results] == ["https://www.python.org/news"]
+
+    def test_plain_query_unchanged(self):
+        """Test queries without domain filters are sent as given"""
+        client = MagicMock()
+        client.text.return_value = [_hit("https://example.com/")]
+        searcher = WebSearcher(client=client)
+
+        results = searcher.search("asyncio", num_results=3)
+
+        assert client.text.call_args.args[0] == "asyncio"
+        assert len(results) == 1
+
+    def test_subdomains_match_but_lookalikes_do_not(self):
+        """Test a domain covers its subdomains but not names that merely contain it"""
+        searcher = WebSearcher(client=MagicMock())
+        results = [
+            {"url": "https://docs.python.org/3/"},
+            {"url": "https://python.org:8080/"},
+            {"url": "https://notpython.org/"},
+            {"url": "https://ads.spam.com/"},
+        ]
+
+        kept = searcher.filter_by_domain(
+            results, allowed_domains=["python.org", "spam.com"], blocked_domains=[".spam.com"]
+        )
+
+        assert [r["url"] for r in kept] == [
+            "https://docs.python.org/3/",
+            "https://python.org:8080/",
+        ]
+
+    def test_no_filters_returns_copy(self):
+        """Test filtering without domain lists keeps every result without parsing URLs"""
+        searcher = WebSearcher(client=MagicMock())
+        results = [{"url": "https://a.com/"}, {"url": "not a url"}]
+
+        kept = searcher.filter_by_domain(results)
+
+        assert kept == results
+        assert kept is not results
+
+    def test_url_host_matches_urlparse(self):
+        """Test the regex host fast path agrees with urlparse, including the fallbacks"""
+        urls = [
+            "https://www.Example.com/path?q=1#x",
+            "http://a.com",
+            "https://a.com:8080/x",
+            "https://a.com?q",
+            "https://user:pw@h.com/",
+            "https://user@h.com/",
+            "https://[::1]:80/",
+            "not a url",
+        ]
+
+        assert [_url_host(url) for url in urls] == [urlparse(url).hostname or "" for url in urls]
+
+
+class TestSearchCache:
+    def test_repeated_query_is_cached(self):
+        """Test identical queries, up to case and whitespace, skip the engine"""
+        client = MagicMock()
+        client.text.return_value = [_hit("https://example.com/")]
+        searcher = WebSearcher(client=client)
+
+        first = searcher.search("Python  asyncio")
+        first[0]["title"] = "changed"
+        second = searcher.search("python asyncio")
+
+        assert client.text.call_count == 1
+        assert second[0]["title"] == "Title"
+
+    def test_methods_and_sizes_are_separate(self):
+        """Test news, text and different result counts are cached separately"""
+        client = MagicMock()
+        client.text.return_value = [_hit("https://example.com/")]
+        client.news.return_value = [{"title": "A", "url": "https://example.com/news"}]
+        searcher = WebSearcher(client=client)
+
+        searcher.search("asyncio", num_results=3)
+        searcher.search("asyncio", num_results=5)
+        searcher.search_news("asyncio", num_results=3)
+
+        assert client.text.call_count == 2
+        assert client.news.call_count == 1
+
+    def test_empty_results_and_disabled_cache(self):
+        """Test empty answers are retried and cache_size=0 always searches"""
+        client = MagicMock()
+        client.text.return_value = []
+        searcher = WebSearcher(client=client)
+        searcher.search("asyncio")
+        searcher.search("asyncio")
+
+        uncached = WebSearcher(client=client, cache_size=0)
+        client.text.return_value = [_hit("https://example.com/")]
+        uncached.search("asyncio")
+        uncached.search("asyncio")
+
+        assert client.text.call_count == 4
+
+
+class TestSearchMany:
+    def test_queries_run_concurrently_in_order(self):
+        """Test several queries overlap and come back in input order"""
+        client = MagicMock()
+
+        def text(query, **kwargs):
+            time.sleep(0.05)
+            return [_hit(f"https://example.com/{query}")]
+
+        client.text.side_effect = text
+        searcher = WebSearcher(client=client)
+
+        start = time.perf_counter()
+        results = searcher.search_many(["a", "b", "c", "d"], max_concurrent=4)
+
+        assert time.perf_counter() - start < 0.15
+        assert [r[0]["url"] for r in results] == [f"https://example.com/{q}" for q in "abcd"]
+
+    def test_sync_batch_inside_running_loop(self):
+        """Test search_many works when called from a running event loop"""
+        client = MagicMock()
+        client.text.side_effect = lambda query, **kwargs: [_hit(f"https://example.com/{query}")]
+        searcher = WebSearcher(client=client)
+
+        async def call_sync():
+            return searcher.search_many(["a", "b"])
+
+        results = asyncio.run(call_sync())
+
+        assert [r[0]["url"] for r in results] == ["https://example.com/a", "https://example.com/b"]
+
+    def test_failures_are_returned_in_place(self):
+        """Test a failing query does not cancel the others"""
+        client = MagicMock()
+
+        def text(query, **kwargs):
+            if query == "broken":
+                raise RuntimeError("rate limited")
+            return [_hit(f"https://example.com/{query}")]
+
+        client.text.side_effect = text
+        searcher = WebSearcher(client=client)
+
+        ok, broken = asyncio.run(searcher.asearch_many(["ok", "broken"]))
+
+        assert ok[0]["url"] == "https://example.com/ok"
+        assert isinstance(broken, WebSearchError)
+        assert broken.error_code == "SEARCH_FAILED"
+
+    def test_web_and_news_run_together(self):
+        """Test asearch_all runs the web and news searches (with its fallback) at once"""
+        client = MagicMock()
+
+        def text(query, **kwargs):
+            time.sleep(0.05)
+            return [_hit("https://a.com/")]
+
+        def news(query, **kwargs):
+            time.sleep(0.05)
+            raise RuntimeError("news down")
+
+        client.text.side_effect = text
+        client.news.side_effect = news
+        searcher = WebSearcher(client=client)
+
+        start = time.perf_counter()
+        results = asyncio.run(searcher.asearch_all("asyncio", num_web=5, num_news=5))
+
+        assert time.perf_counter() - start < 0.15
+        assert results["web"][0]["url"] == "https://a.com/"
+        assert results["news"][0]["date"] == ""
+        assert client.news.call_args.kwargs["max_results"] == 5
+
+
+class TestResultNormalization:
+    def test_hits_without_urls_are_dropped(self):
+        """Test raw hits are mapped to title, url and snippet, skipping unusable ones"""
+        client = MagicMock()
+        client.text.return_value = [
+            {"title": "A", "href": "https://a.com/", "body": "Body"},
+            {"title": "B", "link": "https://b.com/", "snippet": "Snip"},
+            {"title": "No URL"},
+            "not a dict",
+        ]
+        searcher = WebSearcher(client=client)
+
+        results = searcher.search("asyncio")
+
+        assert results == [
+            {"title": "A", "url": "https://a.com/", "snippet": "Body"},
+            {"title": "B", "url": "https://b.com/", "snippet": "Snip"},
+        ]
+
+    def test_news_fallback_adds_empty_fields(self):
+        """Test text results used as a news fallback carry empty date and source"""
+        client = MagicMock()
+        client.news.side_effect = RuntimeError("news down")
+        client.text.return_value = [_hit("https://a.com/")]
+        searcher = WebSearcher(client=client)
+
+        results = searcher.search_news("asyncio")
+
+        assert results == [
+            {
+                "title": "Title",
+                "url": "https://a.com/",
+                "snippet": "Snippet",
+                "date": "",
+                "source": "",
+            }
+        ]